@@ -4,12 +4,13 @@ import asyncio
 import logging
 import os
 from abc import ABC, abstractmethod
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 from typing import List, Dict, Any, Optional
 import time
 
 import requests
 from ..database_modules.models import DatabaseModels
+from ..domain import latest_business_date
 
 logger = logging.getLogger(__name__)
 
@@ -100,7 +101,9 @@ class KoreaEximAdapter(ICurrencyProvider):
                                 exchange_rate = float(rate_str.replace(",", ""))
                                 currency_mapping[currency_code] = exchange_rate
                             except ValueError as e:
-                                logger.error(f"❌ {currency_code} 환율 변환 오류: {e}")
+                                logger.error(
+                                    "❌ %s 환율 변환 오류: %s", currency_code, e
+                                )
 
                     logger.info(
                         f"✅ 한국수출입은행 환율 조회 성공: {len(currency_mapping)}개 통화"
@@ -175,14 +178,18 @@ class KoreaEximAdapter(ICurrencyProvider):
                                     )
                                     updated_rates.append(currency_rate)
                                     logger.info(
-                                        f"✅ {currency} 환율 업데이트 성공: {exchange_rate}"
+                                        "✅ %s 환율 업데이트 성공: %s",
+                                        currency,
+                                        exchange_rate,
                                     )
                                 except ValueError as e:
-                                    logger.error(f"❌ {currency} 환율 변환 오류: {e}")
+                                    logger.error(
+                                        "❌ %s 환율 변환 오류: %s", currency, e
+                                    )
                             else:
-                                logger.error(f"❌ {currency} 환율 데이터 없음")
+                                logger.error("❌ %s 환율 데이터 없음", currency)
                         else:
-                            logger.warning(f"⚠️ {currency} API 응답에 없음")
+                            logger.warning("⚠️ %s API 응답에 없음", currency)
 
                     logger.info(f"🏁 환율 업데이트 완료: {len(updated_rates)}개 성공")
                     return updated_rates
@@ -202,18 +209,7 @@ class KoreaEximAdapter(ICurrencyProvider):
 
     def _get_latest_business_date(self) -> date:
         """가장 최근 영업일을 계산하여 반환"""
-        now = datetime.now()
-        latest_business_day = now
-
-        # 평일 20시 이전이면 전날로
-        if now.hour < 20:
-            latest_business_day = now - timedelta(days=1)
-
-        # 주말이면 가장 최근 금요일로
-        while latest_business_day.weekday() >= 5:  # 5=토요일, 6=일요일
-            latest_business_day = latest_business_day - timedelta(days=1)
-
-        return latest_business_day.date()
+        return latest_business_date()
 
 
 class CurrencyAdapter:
@@ -231,14 +227,7 @@ class CurrencyAdapter:
                 f"💱 환율 정보 조회 시작 - 통화: {currencies if currencies else '전체'}"
             )
 
-            # 특정 통화만 조회할 경우 필터링
-            existing_rates = await self.provider.get_exchange_rates(
-                self.provider._get_latest_business_date()
-                if hasattr(self.provider, "_get_latest_business_date")
-                else date.today()
-            )
-
-            # 가장 최근 영업일 계산
+            # 가장 최근 영업일 계산 (조회와 갱신 판단에 같은 값을 사용)
             latest_business_date = (
                 self.provider._get_latest_business_date()
                 if hasattr(self.provider, "_get_latest_business_date")
@@ -246,6 +235,11 @@ class CurrencyAdapter:
             )
             logger.info(f"📅 최근 영업일: {latest_business_date}")
 
+            # 특정 통화만 조회할 경우 필터링
+            existing_rates = await self.provider.get_exchange_rates(
+                latest_business_date
+            )
+
             rates = []
             outdated_currencies = []
 
@@ -269,12 +263,12 @@ class CurrencyAdapter:
                 )
                 updated_rates = await self.provider.update_rates(outdated_currencies)
 
-                # 업데이트된 환율로 교체
+                # 업데이트된 환율로 교체 (통화 코드 -> 위치 인덱스로 바로 찾기)
+                rate_index = {rate.currency: i for i, rate in enumerate(rates)}
                 for updated_rate in updated_rates:
-                    for i, rate in enumerate(rates):
-                        if rate.currency == updated_rate.currency:
-                            rates[i] = updated_rate
-                            break
+                    i = rate_index.get(updated_rate.currency)
+                    if i is not None:
+                        rates[i] = updated_rate
 
             logger.info(f"✅ 환율 정보 조회 완료 - {len(rates)}개 통화")
             return rates
@@ -2,11 +2,15 @@
 
 import asyncio
 import logging
+import random
 from abc import ABC, abstractmethod
 from datetime import date, datetime
-from typing import Optional, Tuple, List
+from typing import Any, Dict, List, Optional, Tuple
 import time
 
+import requests
+from ..domain import current_trading_date
+
 try:
     import FinanceDataReader as fdr
     import yfinance as yf
@@ -17,6 +21,40 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# 재시도 대기 시간 상한 (초)
+RETRY_MAX_DELAY = 10.0
+
+# 재시도할 일시적 오류 (네트워크/타임아웃/요청 제한)
+# 심볼 없음, 응답 파싱 오류 같은 영구 오류는 재시도하지 않고 바로 전달한다.
+TRANSIENT_ERRORS: Tuple[type, ...] = (
+    ConnectionError,
+    TimeoutError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+try:
+    # yfinance는 curl_cffi로 요청하며 요청 제한은 YFRateLimitError로 알린다
+    from curl_cffi.requests import exceptions as curl_exceptions
+    from yfinance.exceptions import YFRateLimitError
+
+    TRANSIENT_ERRORS += (
+        curl_exceptions.ConnectionError,
+        curl_exceptions.Timeout,
+        YFRateLimitError,
+    )
+except ImportError:
+    pass
+
+# 해외 종목 가격 조회 동시 실행 수 (yfinance에 요청이 몰리지 않도록 제한)
+OVERSEAS_FETCH_CONCURRENCY = 8
+
+
+def _optional_amount(value: Any) -> Optional[float]:
+    """상장 목록 값을 float으로, 비어 있거나 NaN/0이면 None 반환"""
+    if value is None or value != value or not value:
+        return None
+    return float(value)
+
 
 class IMarketDataProvider(ABC):
     """시장 데이터 제공자 인터페이스."""
@@ -35,6 +73,13 @@ class IMarketDataProvider(ABC):
         """yfinance로 주식 정보 조회"""
         pass
 
+    @abstractmethod
+    async def get_stock_prices_bulk(
+        self, symbols_by_region: Dict[str, List[str]], price_date: date
+    ) -> Dict[str, Dict[str, Any]]:
+        """지역별 심볼 목록의 가격 정보 일괄 조회"""
+        pass
+
     @abstractmethod
     def search_symbol_info(self, product_name: str) -> Optional[dict]:
         """종목명으로 심볼 정보 검색"""
@@ -48,33 +93,41 @@ class MarketDataAdapter(IMarketDataProvider):
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
+    def _backoff_delay(self, attempt: int) -> float:
+        """attempt번째 재시도 대기 시간 (지수 백오프 + 지터, RETRY_MAX_DELAY 상한)
+
+        동시에 실패한 작업들이 같은 시각에 다시 몰리지 않도록 절반은 무작위로 둔다.
+        """
+        delay = min(self.retry_delay * 2**attempt, RETRY_MAX_DELAY)
+        return delay / 2 + random.uniform(0, delay / 2)
+
     async def _retry_async_call(self, func, *args, **kwargs):
-        """비동기 함수 재시도 래퍼"""
+        """비동기 함수 재시도 래퍼 (TRANSIENT_ERRORS만 재시도)"""
         for attempt in range(self.max_retries):
             try:
                 return await func(*args, **kwargs)
-            except Exception as e:
+            except TRANSIENT_ERRORS as e:
                 if attempt == self.max_retries - 1:
                     raise
+                delay = self._backoff_delay(attempt)
                 logger.warning(
-                    f"Attempt {attempt + 1} failed: {e}, retrying in {self.retry_delay}s..."
+                    "Attempt %d failed: %s, retrying in %.2fs...", attempt + 1, e, delay
                 )
-                await asyncio.sleep(self.retry_delay)
-                self.retry_delay *= 2  # Exponential backoff
+                await asyncio.sleep(delay)
 
     def _retry_sync_call(self, func, *args, **kwargs):
-        """동기 함수 재시도 래퍼"""
+        """동기 함수 재시도 래퍼 (TRANSIENT_ERRORS만 재시도)"""
         for attempt in range(self.max_retries):
             try:
                 return func(*args, **kwargs)
-            except Exception as e:
+            except TRANSIENT_ERRORS as e:
                 if attempt == self.max_retries - 1:
                     raise
+                delay = self._backoff_delay(attempt)
                 logger.warning(
-                    f"Attempt {attempt + 1} failed: {e}, retrying in {self.retry_delay}s..."
+                    "Attempt %d failed: %s, retrying in %.2fs...", attempt + 1, e, delay
                 )
-                time.sleep(self.retry_delay)
-                self.retry_delay *= 2  # Exponential backoff
+                time.sleep(delay)
 
     async def get_korean_stock_data(
         self, symbol: str, exchange: str = "KOSPI"
@@ -144,46 +197,50 @@ class MarketDataAdapter(IMarketDataProvider):
     def _get_stock_data_yfinance_sync(
         self, symbol: str
     ) -> Tuple[Optional[float], Optional[float], Optional[date]]:
-        """yfinance로 주식 정보 조회 (동기)"""
+        """yfinance로 주식 정보 조회 (동기, 오류 시 None 반환)"""
         if not yf:
             return None, None, None
 
         try:
-            ticker = yf.Ticker(symbol)
+            return self._fetch_yfinance_quote(symbol)
+        except Exception as e:
+            logger.error(f"❌ yfinance {symbol} 오류: {e}")
+            return None, None, None
 
-            # 최근 1일 데이터 조회하여 날짜 확보
-            hist = ticker.history(period="1d")
+    def _fetch_yfinance_quote(
+        self, symbol: str
+    ) -> Tuple[Optional[float], Optional[float], Optional[date]]:
+        """yfinance 종가/시가총액/기준일 조회 (동기, 오류는 호출자에게 전달)"""
+        ticker = yf.Ticker(symbol)
 
-            latest_close = None
-            price_date = None
+        # 최근 1일 데이터 조회하여 날짜 확보
+        hist = ticker.history(period="1d")
 
-            if not hist.empty:
-                latest_close = hist["Close"].iloc[-1]
-                price_date = hist.index[-1].date()
-            else:
-                # history가 비어있으면 info에서 가져오기
-                info = ticker.info
-                latest_close = info.get("currentPrice") or info.get(
-                    "regularMarketPrice"
-                )
-                # regularMarketTime은 epoch timestamp (초 단위)
-                market_time = info.get("regularMarketTime")
-                if market_time:
-                    price_date = datetime.fromtimestamp(market_time).date()
-                else:
-                    # 날짜 정보가 없으면 현재 날짜 사용
-                    price_date = datetime.now().date()
+        latest_close = None
+        price_date = None
 
-            # 시가총액
+        if not hist.empty:
+            latest_close = hist["Close"].iloc[-1]
+            price_date = hist.index[-1].date()
+        else:
+            # history가 비어있으면 info에서 가져오기
             info = ticker.info
-            marketcap = info.get("marketCap")
-            if marketcap:
-                marketcap = marketcap / 1_000_000_000  # 십억 단위로 변환
+            latest_close = info.get("currentPrice") or info.get("regularMarketPrice")
+            # regularMarketTime은 epoch timestamp (초 단위)
+            market_time = info.get("regularMarketTime")
+            if market_time:
+                price_date = datetime.fromtimestamp(market_time).date()
+            else:
+                # 날짜 정보가 없으면 현재 날짜 사용
+                price_date = datetime.now().date()
 
-            return latest_close, marketcap, price_date
-        except Exception as e:
-            logger.error(f"❌ yfinance {symbol} 오류: {e}")
-            return None, None, None
+        # 시가총액
+        info = ticker.info
+        marketcap = info.get("marketCap")
+        if marketcap:
+            marketcap = marketcap / 1_000_000_000  # 십억 단위로 변환
+
+        return latest_close, marketcap, price_date
 
     async def get_stock_data_yfinance(
         self, symbol: str
@@ -193,6 +250,134 @@ class MarketDataAdapter(IMarketDataProvider):
             asyncio.to_thread, self._get_stock_data_yfinance_sync, symbol
         )
 
+    async def get_stock_prices_bulk(
+        self, symbols_by_region: Dict[str, List[str]], price_date: date
+    ) -> Dict[str, Dict[str, Any]]:
+        """지역별 심볼 목록의 가격 정보를 한 번에 조회 (symbol -> 가격 정보)
+
+        국내는 KRX/ETF 상장 목록을 한 번씩만 받아 모든 심볼을 찾고,
+        해외는 yfinance에 일괄 시가총액 조회가 없어 심볼별로 동시에 조회한다.
+        지역 단위로 실패하면 해당 지역 심볼만 결과에서 빠진다.
+        """
+        regions = list(symbols_by_region)
+        results = await asyncio.gather(
+            *(
+                self._get_region_prices(region, symbols_by_region[region], price_date)
+                for region in regions
+            ),
+            return_exceptions=True,
+        )
+
+        prices: Dict[str, Dict[str, Any]] = {}
+        for region, region_prices in zip(regions, results):
+            if isinstance(region_prices, Exception):
+                logger.error("❌ %s 가격 일괄 조회 오류: %s", region, region_prices)
+                continue
+            prices.update(region_prices)
+        return prices
+
+    async def _get_region_prices(
+        self, region: str, symbols: List[str], price_date: date
+    ) -> Dict[str, Dict[str, Any]]:
+        """한 지역(domestic/global)의 심볼 가격 조회"""
+        if not fdr or not yf:
+            logger.error("FinanceDataReader or yfinance not available")
+            return {}
+
+        if region == "domestic":
+            return await self._retry_async_call(
+                asyncio.to_thread, self._get_domestic_prices_sync, symbols, price_date
+            )
+        return await self._get_overseas_prices(symbols, price_date)
+
+    def _get_domestic_prices_sync(
+        self, symbols: List[str], price_date: date
+    ) -> Dict[str, Dict[str, Any]]:
+        """KRX 주식 목록과 ETF 목록에서 여러 심볼의 종가/시가총액을 한 번에 조회 (동기)
+
+        상장 목록은 현재 시세 스냅숏이므로 price_date(마감 전이면 전날)가 아닌
+        현재 거래일로 기록하고, 두 목록에 모두 없는 심볼은 yfinance로 조회한다.
+        """
+        updated_at = current_trading_date().isoformat()
+        wanted = set(symbols)
+        prices: Dict[str, Dict[str, Any]] = {}
+
+        krx_stocks = fdr.StockListing("KRX")
+        matched = krx_stocks.loc[
+            krx_stocks["Code"].isin(wanted), ["Code", "Close", "Marcap"]
+        ]
+        for code, close, marcap in matched.itertuples(index=False):
+            marcap = _optional_amount(marcap)
+            prices[code] = {
+                "latest_close": _optional_amount(close),
+                "marketcap": marcap / 10**9 if marcap else None,  # 원 -> 십억원
+                "updated_at": updated_at,
+            }
+
+        # 주식 목록에 없는 심볼만 ETF 목록에서 찾기
+        missing = wanted - prices.keys()
+        if missing:
+            etf_list = fdr.StockListing("ETF/KR")
+            matched = etf_list.loc[
+                etf_list["Symbol"].isin(missing), ["Symbol", "Price", "MarCap"]
+            ]
+            for code, price, marcap in matched.itertuples(index=False):
+                marcap = _optional_amount(marcap)
+                prices[code] = {
+                    "latest_close": _optional_amount(price),
+                    "marketcap": marcap / 100 if marcap else None,  # 억원 -> 십억원
+                    "updated_at": updated_at,
+                }
+
+        # 두 목록에 모두 없는 심볼은 yfinance로 백업 조회 (.KS 없으면 .KQ)
+        for code in sorted(wanted - prices.keys()):
+            for suffix in (".KS", ".KQ"):
+                latest_close, marketcap, quote_date = (
+                    self._get_stock_data_yfinance_sync(f"{code}{suffix}")
+                )
+                if latest_close is not None:
+                    prices[code] = {
+                        "latest_close": float(latest_close),
+                        "marketcap": marketcap,
+                        "updated_at": (quote_date or price_date).isoformat(),
+                    }
+                    break
+
+        logger.info("📊 국내 가격 일괄 조회: %s/%s개 심볼", len(prices), len(wanted))
+        return prices
+
+    async def _get_overseas_prices(
+        self, symbols: List[str], price_date: date
+    ) -> Dict[str, Dict[str, Any]]:
+        """해외 심볼 가격을 동시 실행 수를 제한해 yfinance로 조회"""
+        semaphore = asyncio.Semaphore(OVERSEAS_FETCH_CONCURRENCY)
+
+        async def fetch(symbol: str):
+            # 일시적 오류는 종목별로만 재시도 (정상 종목은 기다리지 않음)
+            async with semaphore:
+                return await self._retry_async_call(
+                    asyncio.to_thread, self._fetch_yfinance_quote, symbol
+                )
+
+        results = await asyncio.gather(
+            *(fetch(symbol) for symbol in symbols), return_exceptions=True
+        )
+
+        prices: Dict[str, Dict[str, Any]] = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.error("❌ %s 해외 가격 조회 오류: %s", symbol, result)
+                continue
+            latest_close, marketcap, quote_date = result
+            if latest_close is None:
+                continue
+            prices[symbol] = {
+                "latest_close": float(latest_close),
+                "marketcap": marketcap,
+                "updated_at": (quote_date or price_date).isoformat(),
+            }
+        return prices
+
     def search_symbol_info(self, product_name: str) -> Optional[dict]:
         """종목명으로 심볼 정보 검색 (국내 + 해외)"""
         if not fdr or not yf:
@@ -0,0 +1,71 @@
+"""In-process TTL cache for read-heavy, rarely changing query results."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+
+# key -> (만료 시각(time.monotonic 기준), 값)
+_entries: Dict[Hashable, Tuple[float, Any]] = {}
+# 같은 키의 동시 미스가 loader를 한 번만 호출하도록 키별 [잠금, 사용 중인 호출 수]
+# (사용하는 호출이 없어지면 제거되어 키 수만큼 쌓이지 않음)
+_locks: Dict[Hashable, List[Any]] = {}
+# namespace -> 세대 번호 (invalidate/clear 때마다 증가)
+_generations: Dict[Hashable, int] = {}
+
+
+def _namespace_of(key: Hashable) -> Hashable:
+    """(namespace, ...) 튜플 키는 첫 요소, 그 외 키는 키 자체가 namespace"""
+    if isinstance(key, tuple) and key:
+        return key[0]
+    return key
+
+
+async def cached(
+    key: Hashable, ttl: float, loader: Callable[[], Awaitable[Any]]
+) -> Any:
+    """key의 캐시 값을 반환하고, 없거나 만료됐으면 loader 결과를 ttl초 동안 저장
+
+    loader 실행 중에 namespace가 무효화되면 결과는 반환만 하고 저장하지 않는다.
+    반환 값은 호출자 간에 공유되므로 수정하지 않아야 한다.
+    """
+    entry = _entries.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    slot = _locks.get(key)
+    if slot is None:
+        slot = _locks[key] = [asyncio.Lock(), 0]
+    slot[1] += 1
+    try:
+        async with slot[0]:
+            # 잠금을 기다리는 동안 다른 요청이 채웠을 수 있음
+            entry = _entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            namespace = _namespace_of(key)
+            started = _generations.setdefault(namespace, 0)
+            value = await loader()
+            if _generations.get(namespace) == started:
+                _entries[key] = (time.monotonic() + ttl, value)
+            return value
+    finally:
+        slot[1] -= 1
+        if not slot[1] and _locks.get(key) is slot:
+            del _locks[key]
+
+
+def invalidate(namespace: str) -> None:
+    """namespace로 시작하는 (namespace, ...) 튜플 키 또는 namespace 키를 모두 제거"""
+    _generations[namespace] = _generations.get(namespace, 0) + 1
+    for key in list(_entries):
+        if key == namespace or (isinstance(key, tuple) and key[:1] == (namespace,)):
+            _entries.pop(key, None)
+
+
+def clear() -> None:
+    """캐시 전체 비우기 (진행 중인 loader 결과도 저장되지 않음)"""
+    for namespace in _generations:
+        _generations[namespace] += 1
+    _entries.clear()
+    _locks.clear()
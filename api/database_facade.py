@@ -4,9 +4,13 @@ This module provides a backward-compatible facade that orchestrates
 the new modular services while maintaining the existing API interface.
 """
 
+import asyncio
+import functools
 import logging
 from datetime import date, datetime
-from typing import List, Optional, Dict, Any
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from pydantic import TypeAdapter
 
 from .database_modules.repositories import (
     BaseRepository,
@@ -15,7 +19,7 @@ from .database_modules.repositories import (
     CurrencyRepository,
     CashRepository,
 )
-from .database_modules.connection import DatabaseConnection
+from .database_modules.connection import get_database_connection
 from .database_modules.models import DatabaseModels
 from .services import (
     PortfolioService,
@@ -25,6 +29,8 @@ from .services import (
     SyncService,
 )
 from .adapters import MarketDataAdapter, CurrencyAdapter
+from . import cache
+from .decorators import log_and_reraise
 from .models import (
     AssetAllocation,
     AssetAllocationResponse,
@@ -32,7 +38,6 @@ from .models import (
     CashManagementSummary,
     CashUpdateRequest,
     CurrencyRate,
-    HoldingDetail,
     HoldingResponse,
     MarketSummary,
     PerformanceData,
@@ -41,11 +46,33 @@ from .models import (
     TimeDeposit,
     UnmatchedProduct,
     UnmatchedProductsResponse,
-    BSTimeseries,
 )
 
 logger = logging.getLogger(__name__)
 
+# 조회 응답 캐시 네임스페이스와 유지 시간 (초) - 쓰기 작업 성공 시 전체 무효화
+RESPONSE_CACHE = "response"
+RESPONSE_CACHE_TTL = 30
+# 종목 목록은 하루 단위로만 바뀌므로 더 오래 캐시 (쓰기 시 함께 무효화)
+STOCK_LIST_CACHE_TTL = 900
+
+# 서비스 모델 목록 -> 응답 모델 목록 일괄 변환기
+_CASH_BALANCE_LIST = TypeAdapter(List[CashBalance])
+_TIME_DEPOSIT_LIST = TypeAdapter(List[TimeDeposit])
+
+
+def _invalidates_responses(func):
+    """쓰기 작업이 끝나면 조회 응답 캐시를 비우는 데코레이터"""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            cache.invalidate(RESPONSE_CACHE)
+
+    return wrapper
+
 
 class DatabaseManager:
     """
@@ -59,8 +86,8 @@ class DatabaseManager:
         """Initialize the database manager and all services."""
         logger.info("🚀 DatabaseManager 파사드 초기화 시작")
 
-        # Database connection
-        self.db_connection = DatabaseConnection()
+        # Database connection (프로세스 전역 커넥션 풀 공유)
+        self.db_connection = get_database_connection()
 
         # Repositories
         self.base_repository = BaseRepository(self.db_connection)
@@ -75,111 +102,147 @@ class DatabaseManager:
 
         # Services
         self.sync_service = SyncService(self.cash_repository)
-        self.cash_service = CashService(self.cash_repository, self.sync_service)
+        self.cash_service = CashService(
+            self.cash_repository,
+            self.sync_service,
+            # 예약된 bs_timeseries 동기화가 끝나면 조회 응답 캐시를 다시 비움
+            on_synced=lambda: cache.invalidate(RESPONSE_CACHE),
+        )
         self.currency_service = CurrencyService(
-            self.currency_repository, self.currency_adapter
+            self.currency_repository,
+            self.currency_adapter,
+            # 자동 업데이트 조회가 환율을 저장하면 USD 환산 응답 캐시도 비움
+            on_rates_saved=lambda: cache.invalidate(RESPONSE_CACHE),
         )
         self.holdings_service = HoldingsService(
             self.holdings_repository, self.market_data_adapter
         )
         self.portfolio_service = PortfolioService(
-            self.portfolio_repository, self.sync_service
+            self.portfolio_repository,
+            self.sync_service,
+            self.currency_repository,
+            self.cash_repository,
         )
 
+        # 진행 중인 동일 요청 공유용 (single-flight)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
         logger.info("✅ DatabaseManager 파사드 초기화 완료")
 
+    async def _single_flight(
+        self, key: str, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """동일한 키의 요청이 진행 중이면 새로 조회하지 않고 그 결과를 공유"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 한 호출자의 취소가 다른 대기자에게 전파되지 않도록 shield
+        return await asyncio.shield(future)
+
+    def invalidate_cache(self) -> None:
+        """조회 응답 캐시 전체 무효화"""
+        cache.invalidate(RESPONSE_CACHE)
+        logger.info("🧹 조회 응답 캐시 무효화")
+
+    async def warm_up(self) -> None:
+        """첫 요청이 TLS/HTTP2 연결 수립 비용을 치르지 않도록 커넥션 풀을 미리 연결"""
+        status = await asyncio.to_thread(self.db_connection.health_check)
+        logger.info("🔌 데이터베이스 커넥션 풀 준비 - 상태: %s", status["status"])
+
+    async def flush_pending_syncs(self) -> None:
+        """예약된 bs_timeseries 동기화를 즉시 실행"""
+        await self.cash_service.flush_pending_syncs()
+
+    def close(self) -> None:
+        """공유 HTTP 커넥션 풀 종료 (애플리케이션 종료 시 호출)"""
+        self.db_connection.close()
+        logger.info("🔌 데이터베이스 커넥션 풀 종료")
+
     # Portfolio methods
-    async def get_portfolio_overview(self) -> PortfolioOverview:
-        """포트폴리오 전체 현황 조회"""
-        try:
-            overview = await self.portfolio_service.get_portfolio_overview()
-
-            return PortfolioOverview(
-                total_assets=overview.total_assets,
-                total_valuation_amount=overview.total_valuation_amount,
-                total_profit_loss=overview.total_profit_loss,
-                total_profit_loss_rate=overview.total_profit_loss_rate,
-                krw_assets=overview.krw_assets,
-                usd_assets=overview.usd_assets,
-                total_equity=overview.total_equity,
-                total_bond=overview.total_bond,
-                total_reit=overview.total_reit,
-                total_commodity=overview.total_commodity,
-                total_cash=overview.total_cash,
-                updated_at=overview.updated_at,
-            )
-        except Exception as e:
-            logger.error(f"포트폴리오 전체 현황 조회 오류: {e}")
-            raise
+    async def get_portfolio_overview(
+        self, account: Optional[str] = None
+    ) -> PortfolioOverview:
+        """포트폴리오 전체 현황 조회 (RESPONSE_CACHE_TTL 동안 캐시)"""
+        return await cache.cached(
+            (RESPONSE_CACHE, "portfolio_overview", account),
+            RESPONSE_CACHE_TTL,
+            lambda: self._fetch_portfolio_overview(account),
+        )
 
+    @log_and_reraise("포트폴리오 전체 현황 조회 오류")
+    async def _fetch_portfolio_overview(
+        self, account: Optional[str] = None
+    ) -> PortfolioOverview:
+        """포트폴리오 전체 현황 실제 조회"""
+        overview = await self.portfolio_service.get_portfolio_overview(account)
+
+        # 필드별 재구성 대신 서비스 모델 속성에서 한 번에 검증/변환
+        return PortfolioOverview.model_validate(overview, from_attributes=True)
+
+    @log_and_reraise("포트폴리오 요약 정보 조회 오류")
     async def get_portfolio_summary(
         self, account: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """계좌별 포트폴리오 요약 정보 조회"""
-        try:
-            summaries = await self.portfolio_service.get_portfolio_summary(account)
-
-            return [
-                {
-                    "account": summary.account,
-                    "valuation_amount": summary.valuation_amount,
-                    "profit_loss": summary.profit_loss,
-                    "profit_loss_rate": summary.profit_loss_rate,
-                    "updated_at": summary.updated_at,
-                }
-                for summary in summaries
-            ]
-        except Exception as e:
-            logger.error(f"포트폴리오 요약 정보 조회 오류: {e}")
-            raise
+        summaries = await self.portfolio_service.get_portfolio_summary(account)
+
+        return [
+            {
+                "account": summary.account,
+                "valuation_amount": summary.valuation_amount,
+                "profit_loss": summary.profit_loss,
+                "profit_loss_rate": summary.profit_loss_rate,
+                "updated_at": summary.updated_at,
+            }
+            for summary in summaries
+        ]
 
-    async def get_asset_allocation(self) -> AssetAllocationResponse:
-        """자산 배분 현황 조회"""
-        try:
-            allocation = await self.portfolio_service.get_asset_allocation()
-
-            return AssetAllocationResponse(
-                by_asset_type=allocation.by_asset_type,
-                by_region=allocation.by_region,
-                by_currency=allocation.by_currency,
-                total_assets=allocation.total_assets,
-                updated_at=allocation.updated_at,
-            )
-        except Exception as e:
-            logger.error(f"자산 배분 현황 조회 오류: {e}")
-            raise
+    async def get_asset_allocation(
+        self, account: Optional[str] = None
+    ) -> AssetAllocationResponse:
+        """자산 배분 현황 조회 (RESPONSE_CACHE_TTL 동안 캐시)"""
+        return await cache.cached(
+            (RESPONSE_CACHE, "asset_allocation", account),
+            RESPONSE_CACHE_TTL,
+            lambda: self._fetch_asset_allocation(account),
+        )
+
+    @log_and_reraise("자산 배분 현황 조회 오류")
+    async def _fetch_asset_allocation(
+        self, account: Optional[str]
+    ) -> AssetAllocationResponse:
+        """자산 배분 현황 실제 조회"""
+        allocation = await self.portfolio_service.get_asset_allocation(account)
+
+        return AssetAllocationResponse.model_validate(allocation, from_attributes=True)
 
     # Holdings methods
-    async def get_holdings(self, account: Optional[str] = None) -> HoldingResponse:
-        """보유 종목 정보 조회"""
-        try:
-            holdings = await self.holdings_service.get_holdings(account)
-
-            holding_details = []
-            for holding in holdings:
-                detail = HoldingDetail(
-                    account=holding.account,
-                    name=holding.name,
-                    symbol=holding.symbol,
-                    quantity=holding.quantity,
-                    average_price=holding.average_price,
-                    current_price=holding.current_price,
-                    valuation_amount=holding.valuation_amount,
-                    profit_loss=holding.profit_loss,
-                    profit_loss_rate=holding.profit_loss_rate,
-                    currency=holding.currency,
-                    sector=holding.sector,
-                    asset_type=holding.asset_type,
-                    region_type=holding.region_type,
-                    updated_at=holding.updated_at,
-                )
-                holding_details.append(detail)
-
-            return HoldingResponse(holdings=holding_details)
-        except Exception as e:
-            logger.error(f"보유 종목 정보 조회 오류: {e}")
-            raise
+    def iter_holdings(
+        self, account: Optional[str] = None, market: Optional[str] = None
+    ) -> AsyncIterator[HoldingResponse]:
+        """보유 종목 정보를 페이지 단위로 스트리밍 조회 (응답 캐시 미사용)"""
+        return self.holdings_service.iter_holdings(account, market)
+
+    async def account_exists(self, account: str) -> bool:
+        """보유 종목 계좌 존재 여부 확인 (전체 보유 종목 조회 전 404 판별용)"""
+        return await self.holdings_service.account_exists(account)
+
+    @log_and_reraise("보유 종목 정보 조회 오류")
+    async def get_holdings(
+        self, account: Optional[str] = None, market: Optional[str] = None
+    ) -> List[HoldingResponse]:
+        """보유 종목 정보 조회 (RESPONSE_CACHE_TTL 동안 캐시)"""
+        # 서비스 계층이 이미 응답 모델을 생성하므로 그대로 반환
+        return await cache.cached(
+            (RESPONSE_CACHE, "holdings", account, market),
+            RESPONSE_CACHE_TTL,
+            lambda: self.holdings_service.get_holdings(account, market),
+        )
 
+    @_invalidates_responses
+    @log_and_reraise("보유 종목 정보 업데이트 오류")
     async def update_holding(
         self,
         account: str,
@@ -189,91 +252,97 @@ class DatabaseManager:
         current_price: Optional[float] = None,
     ) -> bool:
         """보유 종목 정보 업데이트"""
-        try:
-            return await self.holdings_service.update_holding(
-                account, company, quantity, average_price, current_price
-            )
-        except Exception as e:
-            logger.error(f"보유 종목 정보 업데이트 오류: {e}")
-            raise
+        return await self.holdings_service.update_holding(
+            account, company, quantity, average_price, current_price
+        )
+
+    async def get_all_stocks(self) -> List[StockInfo]:
+        """모든 주식 정보 조회 (STOCK_LIST_CACHE_TTL 동안 캐시)"""
+        return await cache.cached(
+            (RESPONSE_CACHE, "all_stocks"),
+            STOCK_LIST_CACHE_TTL,
+            self._fetch_all_stocks,
+        )
+
+    @log_and_reraise("모든 주식 정보 조회 오류")
+    async def _fetch_all_stocks(self) -> List[StockInfo]:
+        """모든 주식 정보 실제 조회"""
+        return await self.holdings_service.get_all_stocks()
 
+    def iter_all_stocks(self) -> AsyncIterator[StockInfo]:
+        """모든 주식 정보를 페이지 단위로 스트리밍 조회"""
+        return self.holdings_service.iter_all_stocks()
+
+    @log_and_reraise("주식 정보 조회 오류")
     async def get_stock_info(self, symbol: str) -> Optional[StockInfo]:
         """특정 주식 정보 조회"""
-        try:
-            stock_info = await self.holdings_service.get_stock_info(symbol)
-
-            if stock_info:
-                return StockInfo(
-                    symbol=stock_info.symbol,
-                    name=stock_info.name,
-                    sector=stock_info.sector,
-                    industry=stock_info.industry,
-                    asset_type=stock_info.asset_type,
-                    region_type=stock_info.region_type,
-                    latest_close=stock_info.latest_close,
-                    marketcap=stock_info.marketcap,
-                    updated_at=stock_info.updated_at,
-                )
-            return None
-        except Exception as e:
-            logger.error(f"주식 정보 조회 오류: {e}")
-            raise
+        stock_info = await self.holdings_service.get_stock_info(symbol)
+
+        if stock_info:
+            return StockInfo(
+                symbol=stock_info.symbol,
+                name=stock_info.name,
+                sector=stock_info.sector,
+                industry=stock_info.industry,
+                asset_type=stock_info.asset_type,
+                region_type=stock_info.region_type,
+                latest_close=stock_info.latest_close,
+                marketcap=stock_info.marketcap,
+                updated_at=stock_info.updated_at,
+            )
+        return None
 
+    @_invalidates_responses
+    @log_and_reraise("symbol 가격 업데이트 오류")
     async def update_symbol_prices(
         self, symbols: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """symbol_table의 가격 정보 업데이트"""
-        try:
-            return await self.holdings_service.update_symbol_prices(symbols)
-        except Exception as e:
-            logger.error(f"symbol 가격 업데이트 오류: {e}")
-            raise
+        return await self._coalesced_symbol_price_update(symbols)
 
+    async def _coalesced_symbol_price_update(
+        self, symbols: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """같은 심볼 목록의 가격 업데이트가 진행 중이면 그 결과를 공유 (외부 시세 중복 조회 방지)"""
+        key = f"update_symbol_prices:{','.join(sorted(symbols or []))}"
+        return await self._single_flight(
+            key, lambda: self.holdings_service.update_symbol_prices(symbols)
+        )
+
+    @log_and_reraise("미매칭 종목 조회 오류")
     async def get_unmatched_products(self) -> UnmatchedProductsResponse:
         """symbol_table에 없는 종목 조회"""
-        try:
-            unmatched = await self.portfolio_service.get_unmatched_products()
-
-            unmatched_products = []
-            for product in unmatched:
-                unmatched_product = UnmatchedProduct(
-                    company=product.company,
-                    valuation_amount=product.valuation_amount,
-                    profit_loss=product.profit_loss,
-                    profit_loss_rate=product.profit_loss_rate,
-                    account=product.account,
-                    updated_at=product.updated_at,
-                )
-                unmatched_products.append(unmatched_product)
-
-            return UnmatchedProductsResponse(unmatched_products=unmatched_products)
-        except Exception as e:
-            logger.error(f"미매칭 종목 조회 오류: {e}")
-            raise
+        unmatched = await self.portfolio_service.get_unmatched_products()
+
+        unmatched_products = []
+        for product in unmatched:
+            unmatched_product = UnmatchedProduct(
+                company=product.company,
+                valuation_amount=product.valuation_amount,
+                profit_loss=product.profit_loss,
+                profit_loss_rate=product.profit_loss_rate,
+                account=product.account,
+                updated_at=product.updated_at,
+            )
+            unmatched_products.append(unmatched_product)
+
+        return UnmatchedProductsResponse(unmatched_products=unmatched_products)
 
     # Cash management methods
+    @log_and_reraise("현금 잔액 조회 오류")
     async def get_cash_balances(
         self, account: Optional[str] = None
     ) -> List[CashBalance]:
         """증권사별 예수금 정보 조회"""
-        try:
-            balances = await self.cash_service.get_cash_balances(account)
-
-            cash_balances = []
-            for balance in balances:
-                cash_balance = CashBalance(
-                    account=balance.account,
-                    krw=balance.krw,
-                    usd=balance.usd,
-                    updated_at=balance.updated_at,
-                )
-                cash_balances.append(cash_balance)
-
-            return cash_balances
-        except Exception as e:
-            logger.error(f"현금 잔액 조회 오류: {e}")
-            raise
+        balances = await self.cash_service.get_cash_balances(account)
+        if not balances:
+            return []
+
+        # 서비스 모델 목록을 속성 기반으로 응답 모델 목록에 일괄 변환
+        return _CASH_BALANCE_LIST.validate_python(balances, from_attributes=True)
 
+    @_invalidates_responses
+    @log_and_reraise("현금 잔액 업데이트 오류")
     async def update_cash_balance(
         self,
         account: str,
@@ -281,37 +350,22 @@ class DatabaseManager:
         usd: Optional[float] = None,
     ) -> bool:
         """증권사별 예수금 업데이트"""
-        try:
-            return await self.cash_service.update_cash_balance(account, krw, usd)
-        except Exception as e:
-            logger.error(f"현금 잔액 업데이트 오류: {e}")
-            raise
+        return await self.cash_service.update_cash_balance(account, krw, usd)
 
+    @log_and_reraise("예적금 정보 조회 오류")
     async def get_time_deposits(
         self, account: Optional[str] = None
     ) -> List[TimeDeposit]:
         """예적금 정보 조회"""
-        try:
-            deposits = await self.cash_service.get_time_deposits(account)
-
-            time_deposits = []
-            for deposit in deposits:
-                time_deposit = TimeDeposit(
-                    account=deposit.account,
-                    invest_prod_name=deposit.invest_prod_name,
-                    market_value=deposit.market_value,
-                    invested_principal=deposit.invested_principal,
-                    maturity_date=deposit.maturity_date,
-                    interest_rate=deposit.interest_rate,
-                    updated_at=deposit.updated_at,
-                )
-                time_deposits.append(time_deposit)
-
-            return time_deposits
-        except Exception as e:
-            logger.error(f"예적금 정보 조회 오류: {e}")
-            raise
+        deposits = await self.cash_service.get_time_deposits(account)
+        if not deposits:
+            return []
+
+        # 서비스 모델 목록을 속성 기반으로 응답 모델 목록에 일괄 변환
+        return _TIME_DEPOSIT_LIST.validate_python(deposits, from_attributes=True)
 
+    @_invalidates_responses
+    @log_and_reraise("예적금 생성 오류")
     async def create_time_deposit(
         self,
         account: str,
@@ -322,19 +376,17 @@ class DatabaseManager:
         interest_rate: Optional[float] = None,
     ) -> bool:
         """예적금 생성"""
-        try:
-            return await self.cash_service.create_time_deposit(
-                account,
-                invest_prod_name,
-                market_value,
-                invested_principal,
-                maturity_date,
-                interest_rate,
-            )
-        except Exception as e:
-            logger.error(f"예적금 생성 오류: {e}")
-            raise
+        return await self.cash_service.create_time_deposit(
+            account,
+            invest_prod_name,
+            market_value,
+            invested_principal,
+            maturity_date,
+            interest_rate,
+        )
 
+    @_invalidates_responses
+    @log_and_reraise("예적금 수정 오류")
     async def update_time_deposit(
         self,
         account: str,
@@ -345,84 +397,39 @@ class DatabaseManager:
         interest_rate: Optional[float] = None,
     ) -> bool:
         """예적금 수정"""
-        try:
-            return await self.cash_service.update_time_deposit(
-                account,
-                invest_prod_name,
-                market_value,
-                invested_principal,
-                maturity_date,
-                interest_rate,
-            )
-        except Exception as e:
-            logger.error(f"예적금 수정 오류: {e}")
-            raise
+        return await self.cash_service.update_time_deposit(
+            account,
+            invest_prod_name,
+            market_value,
+            invested_principal,
+            maturity_date,
+            interest_rate,
+        )
 
+    @_invalidates_responses
+    @log_and_reraise("예적금 삭제 오류")
     async def delete_time_deposit(self, account: str, invest_prod_name: str) -> bool:
         """예적금 삭제"""
-        try:
-            return await self.cash_service.delete_time_deposit(
-                account, invest_prod_name
-            )
-        except Exception as e:
-            logger.error(f"예적금 삭제 오류: {e}")
-            raise
+        return await self.cash_service.delete_time_deposit(account, invest_prod_name)
 
     async def get_cash_management_summary(self) -> CashManagementSummary:
-        """현금 관리 요약 정보 조회"""
-        try:
-            summary = await self.cash_service.get_cash_management_summary()
-
-            # 변환 로직 추가
-            cash_balances = []
-            for balance in summary.cash_balances:
-                cash_balances.append(
-                    CashBalance(
-                        account=balance.account,
-                        krw=balance.krw,
-                        usd=balance.usd,
-                        updated_at=balance.updated_at,
-                    )
-                )
-
-            time_deposits = []
-            for deposit in summary.time_deposits:
-                time_deposits.append(
-                    TimeDeposit(
-                        account=deposit.account,
-                        invest_prod_name=deposit.invest_prod_name,
-                        market_value=deposit.market_value,
-                        invested_principal=deposit.invested_principal,
-                        maturity_date=deposit.maturity_date,
-                        interest_rate=deposit.interest_rate,
-                        updated_at=deposit.updated_at,
-                    )
-                )
-
-            latest_bs_entry = None
-            if summary.latest_bs_entry:
-                latest_bs_entry = BSTimeseries(
-                    date=summary.latest_bs_entry.date,
-                    cash=summary.latest_bs_entry.cash,
-                    time_deposit=summary.latest_bs_entry.time_deposit,
-                    security_cash_balance=summary.latest_bs_entry.security_cash_balance,
-                    updated_at=summary.latest_bs_entry.updated_at,
-                )
-
-            return CashManagementSummary(
-                total_cash=summary.total_cash,
-                total_cash_balance=summary.total_cash_balance,
-                total_time_deposit=summary.total_time_deposit,
-                total_security_cash=summary.total_security_cash,
-                cash_balances=cash_balances,
-                time_deposits=time_deposits,
-                latest_bs_entry=latest_bs_entry,
-                updated_at=summary.updated_at,
-            )
-        except Exception as e:
-            logger.error(f"현금 관리 요약 정보 조회 오류: {e}")
-            raise
+        """현금 관리 요약 정보 조회 (RESPONSE_CACHE_TTL 동안 캐시)"""
+        return await cache.cached(
+            (RESPONSE_CACHE, "cash_management_summary"),
+            RESPONSE_CACHE_TTL,
+            self._fetch_cash_management_summary,
+        )
+
+    @log_and_reraise("현금 관리 요약 정보 조회 오류")
+    async def _fetch_cash_management_summary(self) -> CashManagementSummary:
+        """현금 관리 요약 정보 실제 조회"""
+        summary = await self.cash_service.get_cash_management_summary()
+
+        # 중첩 모델까지 속성에서 한 번에 변환
+        return CashManagementSummary.model_validate(summary, from_attributes=True)
 
+    @_invalidates_responses
+    @log_and_reraise("현금 정보 업데이트 오류")
     async def update_current_cash(
         self,
         cash: Optional[int] = None,
@@ -431,109 +438,122 @@ class DatabaseManager:
         reason: Optional[str] = None,
     ) -> bool:
         """현재 현금 정보 선택적 업데이트"""
-        try:
-            return await self.cash_service.update_current_cash(
-                cash, time_deposit, security_cash_balance, reason
-            )
-        except Exception as e:
-            logger.error(f"현금 정보 업데이트 오류: {e}")
-            raise
+        return await self.cash_service.update_current_cash(
+            cash, time_deposit, security_cash_balance, reason
+        )
 
     # Currency methods
     async def get_currency_rates(
         self, auto_update: bool = True, currencies: Optional[List[str]] = None
     ) -> List[CurrencyRate]:
-        """환율 정보 조회"""
-        try:
-            rates = await self.currency_service.get_currency_rates(
-                auto_update, currencies
+        """환율 정보 조회 (auto_update=False 조회는 RESPONSE_CACHE_TTL 동안 캐시)"""
+        if not auto_update:
+            return await cache.cached(
+                (RESPONSE_CACHE, "currency_rates", tuple(sorted(currencies or []))),
+                RESPONSE_CACHE_TTL,
+                lambda: self._fetch_currency_rates(False, currencies),
             )
+        key = f"currency_rates:{auto_update}:{','.join(sorted(currencies or []))}"
+        return await self._single_flight(
+            key, lambda: self._fetch_currency_rates(auto_update, currencies)
+        )
 
-            currency_rates = []
-            for rate in rates:
-                currency_rate = CurrencyRate(
-                    currency=rate.currency,
-                    exchange_rate=rate.exchange_rate,
-                    updated_at=rate.updated_at,
-                )
-                currency_rates.append(currency_rate)
+    @log_and_reraise("환율 정보 조회 오류")
+    async def _fetch_currency_rates(
+        self, auto_update: bool = True, currencies: Optional[List[str]] = None
+    ) -> List[CurrencyRate]:
+        """환율 정보 실제 조회"""
+        rates = await self.currency_service.get_currency_rates(auto_update, currencies)
+
+        currency_rates = []
+        for rate in rates:
+            currency_rate = CurrencyRate(
+                currency=rate.currency,
+                exchange_rate=rate.exchange_rate,
+                updated_at=rate.updated_at,
+            )
+            currency_rates.append(currency_rate)
 
-            return currency_rates
-        except Exception as e:
-            logger.error(f"환율 정보 조회 오류: {e}")
-            raise
+        return currency_rates
 
+    async def list_currency_codes(self) -> List[str]:
+        """등록된 통화 코드 목록 조회 (환율 값 없이 코드만)"""
+        return await self.currency_service.list_currency_codes()
+
+    @_invalidates_responses
+    @log_and_reraise("환율 정보 업데이트 오류")
     async def update_currency_rates(self, currencies: List[str]) -> List[CurrencyRate]:
         """특정 통화들의 환율 정보 업데이트"""
-        try:
-            rates = await self.currency_service.update_currency_rates(currencies)
-
-            currency_rates = []
-            for rate in rates:
-                currency_rate = CurrencyRate(
-                    currency=rate.currency,
-                    exchange_rate=rate.exchange_rate,
-                    updated_at=rate.updated_at,
-                )
-                currency_rates.append(currency_rate)
-
-            return currency_rates
-        except Exception as e:
-            logger.error(f"환율 정보 업데이트 오류: {e}")
-            raise
+        rates = await self.currency_service.update_currency_rates(currencies)
+
+        currency_rates = []
+        for rate in rates:
+            currency_rate = CurrencyRate(
+                currency=rate.currency,
+                exchange_rate=rate.exchange_rate,
+                updated_at=rate.updated_at,
+            )
+            currency_rates.append(currency_rate)
+
+        return currency_rates
 
     # Analytics methods
+    @log_and_reraise("성과 분석 데이터 조회 오류")
     async def get_performance_data(
         self, account: Optional[str] = None
     ) -> PerformanceData:
         """성과 분석 데이터 조회"""
-        try:
-            # 기본 성과 데이터 생성 (추후 확장 가능)
-            return PerformanceData(
-                daily_returns=[],
-                cumulative_returns=[],
-                volatility=0.0,
-                sharpe_ratio=0.0,
-                max_drawdown=0.0,
-                updated_at=datetime.now(),
-            )
-        except Exception as e:
-            logger.error(f"성과 분석 데이터 조회 오류: {e}")
-            raise
+        # 기본 성과 데이터 생성 (추후 확장 가능)
+        return PerformanceData(
+            daily_returns=[],
+            cumulative_returns=[],
+            volatility=0.0,
+            sharpe_ratio=0.0,
+            max_drawdown=0.0,
+            updated_at=datetime.now(),
+        )
 
+    @log_and_reraise("시장 요약 정보 조회 오류")
     async def get_market_summary(self) -> MarketSummary:
         """시장 요약 정보 조회"""
-        try:
-            # 기본 시장 요약 정보 생성 (추후 확장 가능)
-            return MarketSummary(
-                kospi=0.0,
-                kosdaq=0.0,
-                sp_500=0.0,
-                nasdaq=0.0,
-                updated_at=datetime.now(),
-            )
-        except Exception as e:
-            logger.error(f"시장 요약 정보 조회 오류: {e}")
-            raise
+        # 기본 시장 요약 정보 생성 (추후 확장 가능)
+        return MarketSummary(
+            kospi=0.0,
+            kosdaq=0.0,
+            sp_500=0.0,
+            nasdaq=0.0,
+            updated_at=datetime.now(),
+        )
 
     # Synchronization methods
+    @_invalidates_responses
+    @log_and_reraise("전체 데이터 새로고침 오류")
     async def refresh_all_data(self) -> Dict[str, Any]:
         """모든 데이터 새로고침"""
-        try:
-            return await self.portfolio_service.refresh_portfolio_data()
-        except Exception as e:
-            logger.error(f"전체 데이터 새로고침 오류: {e}")
-            raise
+        return await self.portfolio_service.refresh_portfolio_data()
+
+    @_invalidates_responses
+    @log_and_reraise("시장 데이터 새로고침 오류")
+    async def refresh_market_data(self) -> Dict[str, Any]:
+        """환율과 종목 가격을 동시에 새로고침 (소요 시간 = 둘 중 긴 쪽)"""
+        currency_rates, price_update = await asyncio.gather(
+            self._fetch_currency_rates(auto_update=True),
+            self._coalesced_symbol_price_update(),
+        )
+        return {"currency_rates": currency_rates, "price_update": price_update}
 
     # Health check
     async def health_check(self) -> Dict[str, Any]:
         """데이터베이스 연결 상태 확인"""
+        # 성공/실패 응답이 같은 시각을 쓰도록 한 번만 계산
+        timestamp = datetime.now().isoformat()
         try:
-            is_healthy = await self.db_connection.health_check()
+            connection_status = self.db_connection.health_check()
+            is_healthy = connection_status.get("status") == "healthy"
 
             return {
                 "status": "healthy" if is_healthy else "unhealthy",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "database": "supabase",
                 "services": {
                     "portfolio": "active",
@@ -544,9 +564,9 @@ class DatabaseManager:
                 },
             }
         except Exception as e:
-            logger.error(f"헬스 체크 오류: {e}")
+            logger.exception("헬스 체크 오류: %s", e)
             return {
                 "status": "error",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "error": str(e),
             }
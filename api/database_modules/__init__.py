@@ -1,6 +1,6 @@
 """Database package for AssetNest API."""
 
-from .connection import DatabaseConnection
+from .connection import DatabaseConnection, get_database_connection
 from .repositories import (
     PortfolioRepository,
     HoldingsRepository,
@@ -11,6 +11,7 @@ from .models import DatabaseModels
 
 __all__ = [
     "DatabaseConnection",
+    "get_database_connection",
     "PortfolioRepository",
     "HoldingsRepository",
     "CurrencyRepository",
@@ -1,60 +1,63 @@
 """Database connection management for AssetNest API."""
 
 import os
-from datetime import datetime, date
+import threading
+from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+import httpx
+import orjson
 from dotenv import load_dotenv
-from supabase import Client, create_client
+from supabase import Client, ClientOptions, create_client
 
 load_dotenv()
 
+# Supabase REST 호출에 사용할 HTTP 커넥션 풀 설정 (워커 프로세스별로 생성됨)
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=int(os.environ.get("DB_POOL_MAX_SIZE", 100)),
+    max_keepalive_connections=int(os.environ.get("DB_POOL_KEEPALIVE_SIZE", 50)),
+    keepalive_expiry=30.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(120.0)
 
-class SerializableClient(Client):
-    """JSON 직렬화 문제를 해결한 Supabase 클라이언트 래퍼."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+def _parse_json_with_orjson(response: httpx.Response) -> None:
+    """postgrest가 호출하는 response.json()을 orjson 파싱으로 교체"""
+    response.json = lambda **kwargs: orjson.loads(response.content)
 
-    def _serialize_data(self, data: Any) -> Any:
-        """데이터를 JSON 직렬화 가능한 형태로 변환"""
-        if isinstance(data, dict):
-            return {k: self._serialize_data(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._serialize_data(item) for item in data]
-        elif isinstance(data, (datetime, date)):
-            return data.isoformat()
-        else:
-            return data
 
-    def table(self, table_name: str): # type: ignore
-        """테이블 작업을 직렬화와 함께 처리"""
-        original_table = super().table(table_name)
+# orjson이 기본 지원하지 않는 타입의 직렬화 함수 (type 기반 dict 조회로 분기)
+_JSON_DEFAULT_HANDLERS = {
+    Decimal: float,
+    set: list,
+    frozenset: list,
+}
 
-        class SerializableTable:
-            def __init__(self, table, serializer):
-                self._table = table
-                self._serialize = serializer
 
-            def insert(self, data, *args, **kwargs):
-                serialized_data = self._serialize(data)
-                return self._table.insert(serialized_data, *args, **kwargs)
+def _json_default(value: Any) -> Any:
+    """orjson default 훅: 지원하지 않는 타입을 JSON 호환 값으로 변환"""
+    handler = _JSON_DEFAULT_HANDLERS.get(type(value))
+    if handler is None:
+        raise TypeError(f"JSON 직렬화를 지원하지 않는 타입: {type(value).__name__}")
+    return handler(value)
 
-            def update(self, data, *args, **kwargs):
-                serialized_data = self._serialize(data)
-                return self._table.update(serialized_data, *args, **kwargs)
 
-            def select(self, *args, **kwargs):
-                return self._table.select(*args, **kwargs)
+class OrjsonHttpClient(httpx.Client):
+    """요청 JSON을 orjson으로 직렬화하는 httpx 클라이언트 (datetime/date 지원)"""
 
-            def delete(self, *args, **kwargs):
-                return self._table.delete(*args, **kwargs)
+    def build_request(self, method, url, **kwargs) -> httpx.Request:
+        json_body = kwargs.pop("json", None)
+        if json_body is not None:
+            headers = httpx.Headers(kwargs.get("headers"))
+            headers["Content-Type"] = "application/json"
+            kwargs["headers"] = headers
+            kwargs["content"] = orjson.dumps(json_body, default=_json_default)
+        return super().build_request(method, url, **kwargs)
 
-            def __getattr__(self, name):
-                return getattr(self._table, name)
 
-        return SerializableTable(original_table, self._serialize_data)
+class SerializableClient(Client):
+    """JSON 직렬화 문제를 해결한 Supabase 클라이언트 (직렬화는 OrjsonHttpClient가 담당)."""
 
 
 class DatabaseConnection:
@@ -67,17 +70,34 @@ class DatabaseConnection:
         if not self.supabase_url or not self.supabase_key:
             raise ValueError("SUPABASE_URL과 SUPABASE_KEY 환경변수가 필요합니다")
 
+        # 모든 리포지토리가 keep-alive 커넥션 풀을 공유하도록 httpx 클라이언트 재사용
+        self.http_client = OrjsonHttpClient(
+            limits=HTTP_POOL_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            follow_redirects=True,
+            http2=True,
+            # 대용량 select 결과의 JSON 파싱 비용을 줄이기 위해 orjson 사용
+            event_hooks={"response": [_parse_json_with_orjson]},
+        )
+
         # JSON 직렬화 문제를 해결하기 위해 커스텀 클라이언트 사용
         self.supabase: SerializableClient = SerializableClient(
-            self.supabase_url, self.supabase_key
+            self.supabase_url,
+            self.supabase_key,
+            options=ClientOptions(httpx_client=self.http_client),
         )
 
     def get_client(self) -> SerializableClient:
         """Supabase 클라이언트 인스턴스 반환"""
         return self.supabase
 
+    def close(self) -> None:
+        """HTTP 커넥션 풀 종료"""
+        self.http_client.close()
+
     def health_check(self) -> Dict[str, Any]:
         """데이터베이스 연결 상태 확인"""
+        timestamp = datetime.now().isoformat()
         try:
             # 간단한 쿼리로 연결 상태 확인
             response = (
@@ -85,13 +105,27 @@ class DatabaseConnection:
             )
             return {
                 "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "connection": "supabase",
             }
         except Exception as e:
             return {
                 "status": "unhealthy",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "error": str(e),
                 "connection": "supabase",
             }
+
+
+_shared_connection: Optional[DatabaseConnection] = None
+_shared_connection_lock = threading.Lock()
+
+
+def get_database_connection() -> DatabaseConnection:
+    """프로세스 전역에서 공유하는 DatabaseConnection 반환 (최초 호출 시 생성)"""
+    global _shared_connection
+    if _shared_connection is None:
+        with _shared_connection_lock:
+            if _shared_connection is None:
+                _shared_connection = DatabaseConnection()
+    return _shared_connection
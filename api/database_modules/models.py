@@ -1,14 +1,26 @@
 """Database models and schemas for AssetNest API."""
 
 from datetime import datetime, date
-from decimal import Decimal
 from typing import List, Optional, Dict, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from pydantic.dataclasses import dataclass
+
+from .. import models as schemas
+
+# 루프에서 대량 생성되는 읽기 전용 DTO: __slots__ 기반 pydantic 데이터클래스
+# (BaseModel보다 생성이 빠르고 인스턴스 메모리가 작으며, 검증/extra 금지는 그대로 유지)
+read_only_dto = dataclass(
+    config=ConfigDict(extra="forbid"), frozen=True, slots=True, kw_only=True
+)
 
 
 class DatabaseModels:
-    """데이터베이스 모델 정의 클래스."""
+    """데이터베이스 모델 정의 클래스.
+
+    API 스키마(api/models.py)와 필드/설정이 같은 모델은 별도로 정의하지 않고
+    그대로 재사용한다.
+    """
 
     # 포트폴리오 관련 모델
     class PortfolioOverview(BaseModel):
@@ -25,57 +37,25 @@ class DatabaseModels:
         investment_allocations: List[Dict[str, Any]] = []
         last_updated: datetime
 
-        class Config:
-            json_encoders = {datetime: lambda v: v.isoformat()}
+    HoldingResponse = schemas.HoldingResponse
 
-    class HoldingResponse(BaseModel):
-        id: int
-        account: str
-        company: str
-        market: str
-        area: Optional[str] = None
-        amount: int
-        avg_price_krw: float
-        current_price_krw: float
-        principal: float
-        market_value: float
-        unrealized_pnl: float
-        return_rate: float
-        avg_price_usd: Optional[float] = None
-        current_price_usd: Optional[float] = None
-        principal_usd: Optional[float] = None
-        market_value_usd: Optional[float] = None
-        unrealized_pnl_usd: Optional[float] = None
-        return_rate_usd: Optional[float] = None
-        first_buy_at: Optional[date] = None
-        last_buy_at: Optional[date] = None
-        last_sell_at: Optional[date] = None
-        total_realized_pnl: Optional[float] = None
-
-    class AssetAllocation(BaseModel):
-        asset_category: str
-        holdings_count: int
-        total_market_value: float
-        allocation_percentage: float
-        holdings: List[str] = []
+    AssetAllocation = schemas.AssetAllocation
 
     class AssetAllocationResponse(BaseModel):
         total_portfolio_value: float
         allocations: List["DatabaseModels.AssetAllocation"]
-        account: Optional[str] = None
+        account: str | None = None
         last_updated: datetime
 
-        class Config:
-            json_encoders = {datetime: lambda v: v.isoformat()}
-
-    class UnmatchedProduct(BaseModel):
+    @read_only_dto
+    class UnmatchedProduct:
         account: str
         invest_prod_name: str
         amount: int
-        avg_price_krw: Optional[float] = None
-        avg_price_usd: Optional[float] = None
-        first_buy_at: Optional[date] = None
-        last_buy_at: Optional[date] = None
+        avg_price_krw: float | None = None
+        avg_price_usd: float | None = None
+        first_buy_at: date | None = None
+        last_buy_at: date | None = None
 
     class UnmatchedProductsResponse(BaseModel):
         unmatched_products: List["DatabaseModels.UnmatchedProduct"]
@@ -83,19 +63,14 @@ class DatabaseModels:
         accounts_with_unmatched: List[str]
         last_updated: datetime
 
-        class Config:
-            json_encoders = {datetime: lambda v: v.isoformat()}
-
-    class PortfolioSummary(BaseModel):
+    @read_only_dto
+    class PortfolioSummary:
         account: str
         valuation_amount: int
         profit_loss: int
         profit_loss_rate: float
         updated_at: datetime
 
-        class Config:
-            json_encoders = {datetime: lambda v: v.isoformat()}
-
     class TopHolding(BaseModel):
         name: str
         symbol: str
@@ -103,13 +78,11 @@ class DatabaseModels:
         profit_loss: int
         profit_loss_rate: float
         account: str
-        sector: Optional[str] = None
+        sector: str | None = None
         updated_at: datetime
 
-        class Config:
-            json_encoders = {datetime: lambda v: v.isoformat()}
-
-    class HoldingDetail(BaseModel):
+    @read_only_dto
+    class HoldingDetail:
         account: str
         name: str
         symbol: str
@@ -120,26 +93,13 @@ class DatabaseModels:
         profit_loss: float
         profit_loss_rate: float
         currency: str
-        sector: Optional[str] = None
-        asset_type: Optional[str] = None
-        region_type: Optional[str] = None
+        sector: str | None = None
+        asset_type: str | None = None
+        region_type: str | None = None
         updated_at: datetime
 
-        class Config:
-            json_encoders = {datetime: lambda v: v.isoformat()}
-
     # 주식 관련 모델
-    class StockInfo(BaseModel):
-        id: int
-        company: str
-        symbol: str
-        exchange: str
-        sector: Optional[str] = None
-        industry: Optional[str] = None
-        area: Optional[str] = None
-        latest_close: Optional[float] = None
-        marketcap: Optional[float] = None
-        updated_at: Optional[datetime] = None
+    StockInfo = schemas.StockInfo
 
     class PerformanceData(BaseModel):
         account: str
@@ -151,44 +111,24 @@ class DatabaseModels:
         region_allocation: Dict[str, float]
 
     # 현금 관련 모델
-    class CashBalance(BaseModel):
+    @read_only_dto
+    class CashBalance:
         account: str
         krw: float
         usd: float
         updated_at: datetime
 
-    class TimeDeposit(BaseModel):
+    @read_only_dto
+    class TimeDeposit:
         account: str
         invest_prod_name: str
         market_value: int
         invested_principal: int
-        maturity_date: Optional[datetime] = None
-        interest_rate: Optional[float] = None
+        maturity_date: datetime | None = None
+        interest_rate: float | None = None
         updated_at: datetime
 
-    class BSTimeseries(BaseModel):
-        date: datetime
-        cash: int
-        time_deposit: int
-        security_cash_balance: int
-
-    class CashBalanceUpdate(BaseModel):
-        krw: Optional[float] = None
-        usd: Optional[float] = None
-
-    class TimeDepositCreate(BaseModel):
-        account: str
-        invest_prod_name: str
-        market_value: int
-        invested_principal: int
-        maturity_date: Optional[datetime] = None
-        interest_rate: Optional[float] = None
-
-    class TimeDepositUpdate(BaseModel):
-        market_value: Optional[int] = None
-        invested_principal: Optional[int] = None
-        maturity_date: Optional[datetime] = None
-        interest_rate: Optional[float] = None
+    BSTimeseries = schemas.BSTimeseries
 
     class CashManagementSummary(BaseModel):
         total_cash: int
@@ -200,19 +140,11 @@ class DatabaseModels:
         latest_bs_entry: Optional["DatabaseModels.BSTimeseries"]
         updated_at: datetime
 
-        class Config:
-            json_encoders = {datetime: lambda v: v.isoformat()}
-
     # 환율 관련 모델
-    class CurrencyRate(BaseModel):
+    @read_only_dto
+    class CurrencyRate:
         currency: str
         exchange_rate: float
         updated_at: datetime
 
-    class MarketSummary(BaseModel):
-        domestic_value: float
-        international_value: float
-        domestic_pnl: float
-        international_pnl: float
-        domestic_return_rate: float
-        international_return_rate: float
+    MarketSummary = schemas.MarketSummary
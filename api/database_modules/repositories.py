@@ -1,15 +1,70 @@
 """Repository pattern implementation for data access layer."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from datetime import date, datetime, timedelta
-from typing import List, Optional, Dict, Any
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 import logging
 
+from postgrest.exceptions import APIError
+
+from .. import cache
+from ..decorators import log_and_reraise
 from .connection import DatabaseConnection
 from .models import DatabaseModels
+from ..domain import latest_business_date
 
 logger = logging.getLogger(__name__)
 
+# PostgREST: 호출한 RPC 함수가 DB에 없을 때의 에러 코드
+RPC_NOT_FOUND_CODE = "PGRST202"
+# PostgREST: 조회한 테이블/뷰가 DB에 없을 때의 에러 코드
+RELATION_NOT_FOUND_CODES = ("PGRST205", "42P01")
+
+# 하루/수시간 단위로만 바뀌는 참조 테이블의 캐시 유지 시간 (초)
+CURRENCY_CACHE_TTL = 3600
+SYMBOL_TABLE_CACHE_TTL = 900
+CURRENCY_CODES_CACHE_TTL = 300
+
+# 전체 테이블 순회 시 한 번에 가져올 행 수
+PAGE_SIZE = 500
+
+# select("*") 대신 호출부에서 실제 사용하는 컬럼만 조회 (특수문자 컬럼은 따옴표)
+HOLDING_COLUMNS = (
+    "id",
+    "account",
+    "company",
+    "market",
+    "area",
+    "amount",
+    "avg_price_krw",
+    "latest_close_krw",
+    "principal",
+    "market_value",
+    '"unrealized_G/L"',
+    "rate_of_return",
+    "avg_price_usd",
+    "latest_close_usd",
+    "principal_usd",
+    "market_value_usd",
+    '"unrealized_G/L_usd"',
+    "rate_of_return_usd",
+    "first_buy_at",
+    "last_buy_at",
+    "last_sell_at",
+    '"total_realized_G/L"',
+)
+CURRENCY_COLUMNS = ("currency", "exchange_rate", "updated_at")
+CASH_BALANCE_COLUMNS = ("account", "krw", "usd")
+TIME_DEPOSIT_COLUMNS = (
+    "account",
+    "invest_prod_name",
+    "market_value",
+    "invested_principal",
+    "maturity_date",
+    "interest_rate",
+)
+
 
 class BaseRepository(ABC):
     """베이스 리포지토리 추상 클래스."""
@@ -20,320 +75,530 @@ class BaseRepository(ABC):
 
     def _get_latest_business_date(self) -> date:
         """가장 최근 영업일을 계산하여 반환"""
-        now = datetime.now()
-        latest_business_day = now
-
-        # 평일 20시 이전이면 전날로
-        if now.hour < 20:
-            latest_business_day = now - timedelta(days=1)
-
-        # 주말이면 가장 최근 금요일로
-        while latest_business_day.weekday() >= 5:  # 5=토요일, 6=일요일
-            latest_business_day = latest_business_day - timedelta(days=1)
-
-        return latest_business_day.date()
+        return latest_business_date()
+
+    async def _iter_pages(
+        self, build_query: Callable[[], Any], label: str, batch_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """build_query()로 만든 정렬된 쿼리를 batch_size 행씩 페이지 조회하며 한 행씩 반환"""
+        offset = 0
+        while True:
+            try:
+                query = build_query().range(offset, offset + batch_size - 1)
+                response = await asyncio.to_thread(query.execute)
+            except Exception as e:
+                logger.exception(
+                    "%s 페이지 조회 오류 (offset=%d): %s", label, offset, e
+                )
+                raise
+            for row in response.data:
+                yield row
+            if len(response.data) < batch_size:
+                return
+            offset += batch_size
 
 
 class PortfolioRepository(BaseRepository):
     """포트폴리오 관련 데이터 접근 리포지토리."""
 
-    def get_overall_info(self, account: Optional[str] = None) -> List[Dict[str, Any]]:
-        """overall_info 테이블 데이터 조회"""
+    def __init__(self, connection: DatabaseConnection):
+        super().__init__(connection)
+        # portfolio_overview RPC 배포 여부 (없으면 테이블별 조회로 대체)
+        self._portfolio_rpc_available = True
+        self._portfolio_views_available = True
+
+    @log_and_reraise("portfolio_overview RPC 조회 오류")
+    async def get_portfolio_rows(
+        self, account: Optional[str] = None
+    ) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """portfolio_overview RPC로 현황 계산용 데이터를 한 번에 조회
+
+        RPC 함수(sql/portfolio_overview.sql)가 배포되지 않았으면 None 반환
+        """
+        if not self._portfolio_rpc_available:
+            return None
         try:
-            query = self.supabase.table("overall_info").select("*")
-            if account:
-                query = query.eq("account", account)
-            response = query.execute()
-            return response.data
-        except Exception as e:
-            logger.error(f"overall_info 조회 오류: {e}")
-            raise
-
-    def get_by_accounts(self, account: Optional[str] = None) -> List[Dict[str, Any]]:
-        """by_accounts 테이블 데이터 조회"""
+            query = self.supabase.rpc("portfolio_overview", {"p_account": account})
+            response = await asyncio.to_thread(query.execute)
+        except APIError as e:
+            if e.code != RPC_NOT_FOUND_CODE:
+                raise
+            logger.warning("⚠️ portfolio_overview RPC 없음 - 테이블별 조회로 대체")
+            self._portfolio_rpc_available = False
+            return None
+        return response.data
+
+    @log_and_reraise("포트폴리오 집계 뷰 조회 오류")
+    async def _select_portfolio_view(
+        self, view: str, columns: str, account: Optional[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """포트폴리오 집계 뷰 조회 (sql/portfolio_views.sql 미배포 시 None 반환)"""
+        if not self._portfolio_views_available:
+            return None
+        query = self.supabase.table(view).select(columns)
+        if account:
+            query = query.eq("account", account)
         try:
-            query = self.supabase.table("by_accounts").select("*")
-            if account:
-                query = query.eq("account", account)
-            response = query.execute()
-            return response.data
-        except Exception as e:
-            logger.error(f"by_accounts 조회 오류: {e}")
-            raise
-
-    def get_funds(self, account: Optional[str] = None) -> List[Dict[str, Any]]:
+            response = await asyncio.to_thread(query.execute)
+        except APIError as e:
+            if e.code not in RELATION_NOT_FOUND_CODES:
+                raise
+            logger.warning("⚠️ %s 뷰 없음 - 애플리케이션 집계로 대체", view)
+            self._portfolio_views_available = False
+            return None
+        return response.data
+
+    async def get_allocation(
+        self, account: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """계좌/자산유형/지역유형별 평가금액 집계 조회 (v_portfolio_allocation)"""
+        return await self._select_portfolio_view(
+            "v_portfolio_allocation",
+            "account,asset_type,region_type,holdings_count,total_market_value,holdings",
+            account,
+        )
+
+    @log_and_reraise("overall_info 조회 오류")
+    async def get_overall_info(
+        self, account: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """overall_info 테이블 데이터 조회"""
+        query = self.supabase.table("overall_info").select("*")
+        if account:
+            query = query.eq("account", account)
+        response = await asyncio.to_thread(query.execute)
+        return response.data
+
+    @log_and_reraise("by_accounts 조회 오류")
+    async def get_by_accounts(
+        self, account: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """by_accounts 테이블 데이터 조회"""
+        query = self.supabase.table("by_accounts").select("*")
+        if account:
+            query = query.eq("account", account)
+        response = await asyncio.to_thread(query.execute)
+        return response.data
+
+    @log_and_reraise("funds 조회 오류")
+    async def get_funds(self, account: Optional[str] = None) -> List[Dict[str, Any]]:
         """funds 테이블 데이터 조회"""
-        try:
-            query = self.supabase.table("funds").select("*")
-            if account:
-                query = query.eq("account", account)
-            response = query.execute()
-            return response.data
-        except Exception as e:
-            logger.error(f"funds 조회 오류: {e}")
-            raise
-
-    def get_symbol_table(self) -> List[Dict[str, Any]]:
-        """symbol_table 테이블 전체 조회"""
-        try:
-            response = self.supabase.table("symbol_table").select("*").execute()
-            return response.data
-        except Exception as e:
-            logger.error(f"symbol_table 조회 오류: {e}")
-            raise
-
+        query = self.supabase.table("funds").select("*")
+        if account:
+            query = query.eq("account", account)
+        response = await asyncio.to_thread(query.execute)
+        return response.data
+
+    async def get_portfolio_summary(
+        self, account: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """계좌별 포트폴리오 요약용 by_accounts 조회 (계좌 필터는 DB에서 적용)"""
+        return await self.get_by_accounts(account)
+
+    @log_and_reraise("symbol_table 조회 오류")
+    async def get_symbol_table(self) -> List[Dict[str, Any]]:
+        """symbol_table 테이블 전체 조회 (SYMBOL_TABLE_CACHE_TTL 동안 캐시)"""
+        return await cache.cached(
+            "symbol_table", SYMBOL_TABLE_CACHE_TTL, self._fetch_symbol_table
+        )
+
+    async def _fetch_symbol_table(self) -> List[Dict[str, Any]]:
+        query = self.supabase.table("symbol_table").select("*")
+        response = await asyncio.to_thread(query.execute)
+        return response.data
+
+    @log_and_reraise("symbol_table 추가 오류")
     def add_symbol_to_table(self, symbol_data: Dict[str, Any]) -> bool:
         """symbol_table에 새 종목 추가"""
-        try:
-            response = self.supabase.table("symbol_table").insert(symbol_data).execute()
-            return len(response.data) > 0
-        except Exception as e:
-            logger.error(f"symbol_table 추가 오류: {e}")
-            raise
-
-    def update_symbol_price(self, name: str, price_data: Dict[str, Any]) -> bool:
-        """symbol_table 가격 정보 업데이트"""
-        try:
-            response = (
-                self.supabase.table("symbol_table")
-                .update(price_data)
-                .eq("name", name)
-                .execute()
-            )
-            return len(response.data) > 0
-        except Exception as e:
-            logger.error(f"symbol_table 가격 업데이트 오류: {e}")
-            raise
-
-    def update_symbol_sector_info(self, name: str, sector_data: Dict[str, Any]) -> bool:
-        """symbol_table 섹터/산업 정보 업데이트"""
-        try:
-            response = (
-                self.supabase.table("symbol_table")
-                .update(sector_data)
-                .eq("name", name)
-                .execute()
-            )
-            return len(response.data) > 0
-        except Exception as e:
-            logger.error(f"symbol_table 섹터 정보 업데이트 오류: {e}")
-            raise
+        response = self.supabase.table("symbol_table").insert(symbol_data).execute()
+        cache.invalidate("symbol_table")
+        return len(response.data) > 0
 
 
 class HoldingsRepository(BaseRepository):
     """보유 종목 관련 데이터 접근 리포지토리."""
 
+    @log_and_reraise("stock_info 조회 오류")
     def get_stock_info(self) -> List[Dict[str, Any]]:
         """stock_info 테이블 데이터 조회"""
-        try:
-            response = self.supabase.table("stock_info").select("*").execute()
-            return response.data
-        except Exception as e:
-            logger.error(f"stock_info 조회 오류: {e}")
-            raise
-
+        response = self.supabase.table("stock_info").select("*").execute()
+        return response.data
+
+    def iter_stock_info(
+        self, batch_size: int = PAGE_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """stock_info를 id 순서로 batch_size 행씩 페이지 조회하며 한 행씩 반환"""
+        return self._iter_pages(
+            lambda: self.supabase.table("stock_info").select("*").order("id"),
+            "stock_info",
+            batch_size,
+        )
+
+    def iter_holdings(
+        self,
+        account: Optional[str] = None,
+        market: Optional[str] = None,
+        batch_size: int = PAGE_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """overall_info 보유 종목을 id 순서로 batch_size 행씩 페이지 조회하며 한 행씩 반환"""
+
+        def build_query():
+            query = self.supabase.table("overall_info").select(*HOLDING_COLUMNS)
+            if account:
+                query = query.eq("account", account)
+            if market:
+                query = query.eq("market", market)
+            return query.order("id")
+
+        return self._iter_pages(build_query, "overall_info", batch_size)
+
+    @log_and_reraise("계좌 존재 여부 조회 오류")
+    async def account_exists(self, account: str) -> bool:
+        """by_accounts에 해당 계좌 행이 하나라도 있는지 확인 (overall_info 조인 없이)"""
+        query = (
+            self.supabase.table("by_accounts")
+            .select("account")
+            .eq("account", account)
+            .limit(1)
+        )
+        response = await asyncio.to_thread(query.execute)
+        return bool(response.data)
+
+    @log_and_reraise("계좌별 보유 종목 조회 오류")
     def get_holdings_by_account(self, account: str) -> List[Dict[str, Any]]:
         """계좌별 보유 종목 조회"""
-        try:
-            response = (
-                self.supabase.table("overall_info")
-                .select("*")
-                .eq("account", account)
-                .execute()
-            )
-            return response.data
-        except Exception as e:
-            logger.error(f"계좌별 보유 종목 조회 오류: {e}")
-            raise
-
+        response = (
+            self.supabase.table("overall_info")
+            .select(*HOLDING_COLUMNS)
+            .eq("account", account)
+            .execute()
+        )
+        return response.data
+
+    @log_and_reraise("보유 종목 조회 오류")
     def get_all_holdings(
         self, account: Optional[str] = None, market: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """모든 보유 종목 조회"""
-        try:
-            query = self.supabase.table("overall_info").select("*")
-            if account:
-                query = query.eq("account", account)
-            if market:
-                query = query.eq("market", market)
-            response = query.execute()
-            return response.data
-        except Exception as e:
-            logger.error(f"보유 종목 조회 오류: {e}")
-            raise
+        query = self.supabase.table("overall_info").select(*HOLDING_COLUMNS)
+        if account:
+            query = query.eq("account", account)
+        if market:
+            query = query.eq("market", market)
+        response = query.execute()
+        return response.data
+
+    @log_and_reraise("symbol_table 조회 오류")
+    def get_symbol_table(
+        self, symbols: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """symbol_table 조회 (심볼 목록이 있으면 해당 심볼만)"""
+        query = self.supabase.table("symbol_table").select("*")
+        if symbols:
+            query = query.in_("symbol", symbols)
+        response = query.execute()
+        return response.data
+
+    @log_and_reraise("sector 미지정 symbol 조회 오류")
+    def get_symbols_without_sector(self) -> List[Dict[str, Any]]:
+        """sector 정보가 없는 symbol_table 항목 조회"""
+        response = (
+            self.supabase.table("symbol_table")
+            .select("*")
+            .is_("sector", "null")
+            .execute()
+        )
+        return response.data
+
+    @log_and_reraise("symbol_table 가격 일괄 업데이트 오류")
+    def upsert_symbol_prices(self, price_rows: List[Dict[str, Any]]) -> int:
+        """symbol_table 가격 정보 일괄 업데이트 (단일 upsert 요청)"""
+        return self._upsert_symbol_rows(price_rows)
+
+    @log_and_reraise("symbol_table 섹터 정보 일괄 업데이트 오류")
+    def upsert_symbol_sectors(self, sector_rows: List[Dict[str, Any]]) -> int:
+        """symbol_table 섹터/산업 정보 일괄 업데이트 (단일 upsert 요청)"""
+        return self._upsert_symbol_rows(sector_rows)
+
+    def _upsert_symbol_rows(self, rows: List[Dict[str, Any]]) -> int:
+        """name 기준으로 symbol_table 행들을 한 번에 upsert"""
+        if not rows:
+            return 0
+        response = (
+            self.supabase.table("symbol_table")
+            .upsert(rows, on_conflict="name")
+            .execute()
+        )
+        cache.invalidate("symbol_table")
+        return len(response.data)
 
 
 class CurrencyRepository(BaseRepository):
     """환율 관련 데이터 접근 리포지토리."""
 
-    def get_currency_rates(
+    @log_and_reraise("환율 정보 조회 오류")
+    async def get_currency_rates(
         self, currencies: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
-        """환율 정보 조회"""
-        try:
-            query = self.supabase.table("currency").select("*")
-            if currencies:
-                query = query.in_("currency", currencies)
-            response = query.execute()
-            return response.data
-        except Exception as e:
-            logger.error(f"환율 정보 조회 오류: {e}")
-            raise
-
+        """환율 정보 조회 (통화 목록별로 CURRENCY_CACHE_TTL 동안 캐시)"""
+        key = ("currency", tuple(sorted(currencies)) if currencies else None)
+        return await cache.cached(
+            key,
+            CURRENCY_CACHE_TTL,
+            lambda: self._fetch_currency_rates(currencies),
+        )
+
+    async def _fetch_currency_rates(
+        self, currencies: Optional[List[str]]
+    ) -> List[Dict[str, Any]]:
+        query = self.supabase.table("currency").select(*CURRENCY_COLUMNS)
+        if currencies:
+            query = query.in_("currency", currencies)
+        response = await asyncio.to_thread(query.execute)
+        # updated_at은 캐시에 넣기 전 한 번만 datetime으로 변환
+        for row in response.data:
+            updated_at = row.get("updated_at")
+            if isinstance(updated_at, str):
+                try:
+                    row["updated_at"] = datetime.fromisoformat(updated_at)
+                except ValueError:
+                    logger.warning(
+                        "⚠️ %s 환율 updated_at 형식 오류: %s",
+                        row.get("currency"),
+                        updated_at,
+                    )
+                    row["updated_at"] = None
+        return response.data
+
+    @log_and_reraise("통화 목록 조회 오류")
+    async def list_currency_codes(self) -> List[str]:
+        """등록된 통화 코드 목록 조회 (CURRENCY_CODES_CACHE_TTL 동안 캐시)"""
+        return await cache.cached(
+            "currency_codes", CURRENCY_CODES_CACHE_TTL, self._fetch_currency_codes
+        )
+
+    async def _fetch_currency_codes(self) -> List[str]:
+        query = self.supabase.table("currency").select("currency")
+        response = await asyncio.to_thread(query.execute)
+        return [row["currency"] for row in response.data]
+
+    @log_and_reraise("환율 업데이트 오류")
     def update_currency_rate(
         self, currency: str, exchange_rate: float, update_date: date
     ) -> bool:
         """환율 정보 업데이트"""
-        try:
-            response = (
-                self.supabase.table("currency")
-                .update(
-                    {
-                        "exchange_rate": exchange_rate,
-                        "updated_at": update_date.isoformat(),
-                    }
-                )
-                .eq("currency", currency)
-                .execute()
+        response = (
+            self.supabase.table("currency")
+            .update(
+                {
+                    "exchange_rate": exchange_rate,
+                    "updated_at": update_date.isoformat(),
+                }
             )
-            return len(response.data) > 0
-        except Exception as e:
-            logger.error(f"환율 업데이트 오류: {e}")
-            raise
+            .eq("currency", currency)
+            .execute()
+        )
+        cache.invalidate("currency")
+        return len(response.data) > 0
 
 
 class CashRepository(BaseRepository):
     """현금 관련 데이터 접근 리포지토리."""
 
-    def get_cash_balances(self, account: Optional[str] = None) -> List[Dict[str, Any]]:
-        """증권사별 예수금 정보 조회"""
+    def __init__(self, connection: DatabaseConnection):
+        super().__init__(connection)
+        # upsert_bs_timeseries RPC 배포 여부 (없으면 조회 후 수정/생성으로 대체)
+        self._bs_upsert_rpc_available = True
+        # cash_management_summary RPC 배포 여부 (없으면 테이블별 조회로 대체)
+        self._summary_rpc_available = True
+
+    @log_and_reraise("cash_management_summary RPC 조회 오류")
+    async def get_cash_summary_rows(self) -> Optional[Dict[str, Any]]:
+        """cash_management_summary RPC로 현금 요약용 데이터를 한 번에 조회
+
+        RPC 함수(sql/cash_management_summary.sql)가 배포되지 않았으면 None 반환
+        """
+        if not self._summary_rpc_available:
+            return None
         try:
-            query = self.supabase.table("cash_balance").select("*")
-            if account:
-                query = query.eq("account", account)
-            response = query.execute()
-            return response.data
-        except Exception as e:
-            logger.error(f"현금 잔액 조회 오류: {e}")
-            raise
+            query = self.supabase.rpc("cash_management_summary", {})
+            response = await asyncio.to_thread(query.execute)
+        except APIError as e:
+            if e.code != RPC_NOT_FOUND_CODE:
+                raise
+            logger.warning("⚠️ cash_management_summary RPC 없음 - 테이블별 조회로 대체")
+            self._summary_rpc_available = False
+            return None
+        return response.data
+
+    @log_and_reraise("현금 잔액 조회 오류")
+    async def get_cash_balances(
+        self, account: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """증권사별 예수금 정보 조회"""
+        query = self.supabase.table("cash_balance").select(*CASH_BALANCE_COLUMNS)
+        if account:
+            query = query.eq("account", account)
+        response = await asyncio.to_thread(query.execute)
+        return response.data
 
+    @log_and_reraise("현금 잔액 업데이트 오류")
     def update_cash_balance(self, account: str, update_data: Dict[str, Any]) -> bool:
         """증권사별 예수금 업데이트"""
-        try:
-            response = (
-                self.supabase.table("cash_balance")
-                .update(update_data)
-                .eq("account", account)
-                .execute()
-            )
-            return len(response.data) > 0
-        except Exception as e:
-            logger.error(f"현금 잔액 업데이트 오류: {e}")
-            raise
-
-    def get_time_deposits(self, account: Optional[str] = None) -> List[Dict[str, Any]]:
+        response = (
+            self.supabase.table("cash_balance")
+            .update(update_data)
+            .eq("account", account)
+            .execute()
+        )
+        return len(response.data) > 0
+
+    @log_and_reraise("예적금 정보 조회 오류")
+    async def get_time_deposits(
+        self, account: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """예적금 정보 조회"""
-        try:
-            query = self.supabase.table("time_deposit").select("*")
-            if account:
-                query = query.eq("account", account)
-            response = query.execute()
-            return response.data
-        except Exception as e:
-            logger.error(f"예적금 정보 조회 오류: {e}")
-            raise
+        query = self.supabase.table("time_deposit").select(*TIME_DEPOSIT_COLUMNS)
+        if account:
+            query = query.eq("account", account)
+        response = await asyncio.to_thread(query.execute)
+        return response.data
 
+    @log_and_reraise("예적금 생성 오류")
     def create_time_deposit(self, deposit_data: Dict[str, Any]) -> bool:
         """예적금 생성"""
-        try:
-            response = (
-                self.supabase.table("time_deposit").insert(deposit_data).execute()
-            )
-            return len(response.data) > 0
-        except Exception as e:
-            logger.error(f"예적금 생성 오류: {e}")
-            raise
+        response = self.supabase.table("time_deposit").insert(deposit_data).execute()
+        return len(response.data) > 0
 
+    @log_and_reraise("예적금 수정 오류")
     def update_time_deposit(
         self, account: str, invest_prod_name: str, update_data: Dict[str, Any]
     ) -> bool:
         """예적금 수정"""
-        try:
-            response = (
-                self.supabase.table("time_deposit")
-                .update(update_data)
-                .eq("account", account)
-                .eq("invest_prod_name", invest_prod_name)
-                .execute()
-            )
-            return len(response.data) > 0
-        except Exception as e:
-            logger.error(f"예적금 수정 오류: {e}")
-            raise
-
+        response = (
+            self.supabase.table("time_deposit")
+            .update(update_data)
+            .eq("account", account)
+            .eq("invest_prod_name", invest_prod_name)
+            .execute()
+        )
+        return len(response.data) > 0
+
+    @log_and_reraise("예적금 삭제 오류")
     def delete_time_deposit(self, account: str, invest_prod_name: str) -> bool:
         """예적금 삭제"""
-        try:
-            response = (
-                self.supabase.table("time_deposit")
-                .delete()
-                .eq("account", account)
-                .eq("invest_prod_name", invest_prod_name)
-                .execute()
-            )
-            return len(response.data) > 0
-        except Exception as e:
-            logger.error(f"예적금 삭제 오류: {e}")
-            raise
-
+        response = (
+            self.supabase.table("time_deposit")
+            .delete()
+            .eq("account", account)
+            .eq("invest_prod_name", invest_prod_name)
+            .execute()
+        )
+        return len(response.data) > 0
+
+    @log_and_reraise("예적금 일괄 수정 오류")
+    def bulk_upsert_time_deposits(self, rows: List[Dict[str, Any]]) -> int:
+        """(account, invest_prod_name) 기준으로 예적금 여러 건을 한 번에 upsert"""
+        if not rows:
+            return 0
+        response = (
+            self.supabase.table("time_deposit")
+            .upsert(rows, on_conflict="account,invest_prod_name")
+            .execute()
+        )
+        return len(response.data)
+
+    @log_and_reraise("예적금 일괄 삭제 오류")
+    def bulk_delete_time_deposits(
+        self, account: str, invest_prod_names: List[str]
+    ) -> int:
+        """한 계좌의 예적금 여러 건을 한 번의 요청으로 삭제"""
+        if not invest_prod_names:
+            return 0
+        response = (
+            self.supabase.table("time_deposit")
+            .delete()
+            .eq("account", account)
+            .in_("invest_prod_name", invest_prod_names)
+            .execute()
+        )
+        return len(response.data)
+
+    @log_and_reraise("최신 bs_timeseries 조회 오류")
     def get_latest_bs_entry(self) -> Optional[Dict[str, Any]]:
         """가장 최신 bs_timeseries 항목 조회"""
-        try:
-            response = (
-                self.supabase.table("bs_timeseries")
-                .select("*")
-                .order("date", desc=True)
-                .limit(1)
-                .execute()
-            )
-            return response.data[0] if response.data else None
-        except Exception as e:
-            logger.error(f"최신 bs_timeseries 조회 오류: {e}")
-            raise
-
+        response = (
+            self.supabase.table("bs_timeseries")
+            .select("*")
+            .order("date", desc=True)
+            .limit(1)
+            .execute()
+        )
+        return response.data[0] if response.data else None
+
+    @log_and_reraise("bs_timeseries 업데이트 오류")
     def update_bs_timeseries(self, date: date, update_data: Dict[str, Any]) -> bool:
         """bs_timeseries 업데이트"""
-        try:
-            response = (
-                self.supabase.table("bs_timeseries")
-                .update(update_data)
-                .eq("date", date.isoformat())
-                .execute()
-            )
-            return len(response.data) > 0
-        except Exception as e:
-            logger.error(f"bs_timeseries 업데이트 오류: {e}")
-            raise
-
+        response = (
+            self.supabase.table("bs_timeseries")
+            .update(update_data)
+            .eq("date", date.isoformat())
+            .execute()
+        )
+        return len(response.data) > 0
+
+    @log_and_reraise("bs_timeseries 생성 오류")
     def create_bs_timeseries(self, bs_data: Dict[str, Any]) -> bool:
         """bs_timeseries 신규 항목 생성"""
-        try:
-            response = self.supabase.table("bs_timeseries").insert(bs_data).execute()
-            return len(response.data) > 0
-        except Exception as e:
-            logger.error(f"bs_timeseries 생성 오류: {e}")
-            raise
-
+        response = self.supabase.table("bs_timeseries").insert(bs_data).execute()
+        return len(response.data) > 0
+
+    @log_and_reraise("bs_timeseries upsert 오류")
+    def upsert_bs_timeseries(
+        self, date: date, fields: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """해당 날짜의 bs_timeseries를 생성/수정하고 결과 행 반환
+
+        fields에 없는 필드는 기존 값을 유지하고, 신규 행이면 가장 최신 항목의 값을 이어받는다.
+        upsert_bs_timeseries RPC(sql/upsert_bs_timeseries.sql)로 한 번에 처리하며,
+        RPC가 배포되지 않았으면 조회 후 수정/생성으로 대체한다.
+        """
+        if self._bs_upsert_rpc_available:
+            try:
+                response = self.supabase.rpc(
+                    "upsert_bs_timeseries",
+                    {"p_date": date.isoformat(), "p_fields": fields},
+                ).execute()
+                return response.data
+            except APIError as e:
+                if e.code != RPC_NOT_FOUND_CODE:
+                    raise
+                logger.warning(
+                    "⚠️ upsert_bs_timeseries RPC 없음 - 조회 후 수정/생성으로 대체"
+                )
+                self._bs_upsert_rpc_available = False
+
+        existing = self.get_bs_timeseries_by_date(date)
+        if existing:
+            if not self.update_bs_timeseries(date, fields):
+                return None
+            return {**existing, **fields}
+
+        latest = self.get_latest_bs_entry() or {}
+        new_data = {
+            field: latest.get(field, 0)
+            for field in ("cash", "time_deposit", "security_cash_balance")
+        }
+        new_data.update(fields, date=date.isoformat())
+        return new_data if self.create_bs_timeseries(new_data) else None
+
+    @log_and_reraise("bs_timeseries 날짜별 조회 오류")
     def get_bs_timeseries_by_date(self, date: date) -> Optional[Dict[str, Any]]:
         """특정 날짜의 bs_timeseries 조회"""
-        try:
-            response = (
-                self.supabase.table("bs_timeseries")
-                .select("*")
-                .eq("date", date.isoformat())
-                .execute()
-            )
-            return response.data[0] if response.data else None
-        except Exception as e:
-            logger.error(f"bs_timeseries 날짜별 조회 오류: {e}")
-            raise
+        response = (
+            self.supabase.table("bs_timeseries")
+            .select("*")
+            .eq("date", date.isoformat())
+            .execute()
+        )
+        return response.data[0] if response.data else None
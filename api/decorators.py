@@ -0,0 +1,44 @@
+"""Shared decorators for AssetNest API layers."""
+
+import functools
+import inspect
+import logging
+from typing import Any, Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def log_and_reraise(message: str, log: Optional[logging.Logger] = None):
+    """예외 발생 시 "{message}: {e}"와 traceback을 로깅한 뒤 다시 던지는 데코레이터
+
+    Args:
+        message: 오류 로그 앞에 붙일 문맥 메시지
+        log: 사용할 로거 (기본값: 데코레이트되는 함수의 모듈 로거)
+    """
+
+    def decorator(func: F) -> F:
+        target_logger = log or logging.getLogger(func.__module__)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    target_logger.exception("%s: %s", message, e)
+                    raise
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                target_logger.exception("%s: %s", message, e)
+                raise
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -5,12 +5,15 @@ from .entities import (
     Portfolio,
     CashPosition,
     TimeDeposit,
+    asset_category,
 )
 from .value_objects import (
     AssetCategory,
     MarketType,
     Currency,
     BusinessDate,
+    latest_business_date,
+    current_trading_date,
 )
 
 __all__ = [
@@ -18,8 +21,11 @@ __all__ = [
     "Portfolio",
     "CashPosition",
     "TimeDeposit",
+    "asset_category",
     "AssetCategory",
     "MarketType",
     "Currency",
     "BusinessDate",
+    "latest_business_date",
+    "current_trading_date",
 ]
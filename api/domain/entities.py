@@ -1,14 +1,53 @@
 """Domain entities representing core business concepts."""
 
+import re
 from datetime import date, datetime
 from decimal import Decimal
 from typing import List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .value_objects import AssetCategory, MarketType, Currency
 
+# (자산유형, 지역유형)별 자산 카테고리 (카테고리 인스턴스는 공유)
+_CATEGORY_BY_ASSET_AND_REGION = {
+    ("equity", "domestic"): AssetCategory("국내주식"),
+    ("equity", "global"): AssetCategory("해외주식"),
+    ("bond", "domestic"): AssetCategory("국내채권"),
+    ("bond", "global"): AssetCategory("해외채권"),
+    ("REITs", "domestic"): AssetCategory("국내리츠"),
+    ("REITs", "global"): AssetCategory("해외리츠"),
+}
 
-@dataclass
+# 지역과 무관하게 결정되는 자산 카테고리
+_CATEGORY_BY_ASSET_TYPE = {
+    "TDF": AssetCategory("TDF"),
+    "commodity": AssetCategory("원자재"),
+    "gold": AssetCategory("금"),
+    "cash": AssetCategory("현금성자산"),
+}
+
+_OTHER_CATEGORY = AssetCategory("기타")
+
+
+def asset_category(
+    asset_type: Optional[str], region_type: Optional[str]
+) -> AssetCategory:
+    """자산 유형과 지역 유형으로 자산 카테고리를 결정"""
+    return _CATEGORY_BY_ASSET_AND_REGION.get(
+        (asset_type, region_type)
+    ) or _CATEGORY_BY_ASSET_TYPE.get(asset_type, _OTHER_CATEGORY)
+
+
+# ETF 판별 키워드 (종목명 부분 일치, 대소문자 무시)
+_ETF_NAME_PATTERN = re.compile(
+    "ETF|KODEX|TIGER|ARIRANG|KBSTAR|ACE|PLUS|ARK", re.IGNORECASE
+)
+
+# 원화로 거래되는 거래소
+_KRW_EXCHANGES = frozenset({"KOSPI", "KOSDAQ"})
+
+
+@dataclass(slots=True)
 class Asset:
     """자산 엔티티."""
 
@@ -27,45 +66,21 @@ class Asset:
 
     def is_etf(self) -> bool:
         """ETF 여부 확인"""
-        etf_keywords = [
-            "ETF",
-            "KODEX",
-            "TIGER",
-            "ARIRANG",
-            "KBSTAR",
-            "ACE",
-            "PLUS",
-            "ARK",
-        ]
-        return any(keyword in self.name.upper() for keyword in etf_keywords)
+        return _ETF_NAME_PATTERN.search(self.name) is not None
+
+    def value_krw(self, usd_rate: float = 1400.0) -> float:
+        """원화 환산 평가금액 (국내 거래소 외 종목은 USD 환율 적용)"""
+        value = self.latest_close or 0
+        if self.exchange in _KRW_EXCHANGES:
+            return value
+        return value * usd_rate
 
     def get_asset_category(self) -> AssetCategory:
         """자산 카테고리 결정"""
-        if self.asset_type == "equity" and self.region_type == "domestic":
-            return AssetCategory("국내주식")
-        elif self.asset_type == "equity" and self.region_type == "global":
-            return AssetCategory("해외주식")
-        elif self.asset_type == "bond" and self.region_type == "domestic":
-            return AssetCategory("국내채권")
-        elif self.asset_type == "bond" and self.region_type == "global":
-            return AssetCategory("해외채권")
-        elif self.asset_type == "REITs" and self.region_type == "domestic":
-            return AssetCategory("국내리츠")
-        elif self.asset_type == "REITs" and self.region_type == "global":
-            return AssetCategory("해외리츠")
-        elif self.asset_type == "TDF":
-            return AssetCategory("TDF")
-        elif self.asset_type == "commodity":
-            return AssetCategory("원자재")
-        elif self.asset_type == "gold":
-            return AssetCategory("금")
-        elif self.asset_type == "cash":
-            return AssetCategory("현금성자산")
-        else:
-            return AssetCategory("기타")
-
-
-@dataclass
+        return asset_category(self.asset_type, self.region_type)
+
+
+@dataclass(slots=True)
 class Portfolio:
     """포트폴리오 엔티티."""
 
@@ -73,64 +88,48 @@ class Portfolio:
     assets: List[Asset]
     cash_balance: float = 0.0
     time_deposits: float = 0.0
-    updated_at: datetime = datetime.now()
+    updated_at: datetime = field(default_factory=datetime.now)
 
     def total_value_krw(self, usd_rate: float = 1400.0) -> float:
         """총 평가금액 (KRW) 계산"""
-        asset_value = sum(
-            asset.latest_close or 0
-            for asset in self.assets
-            if asset.exchange in ["KOSPI", "KOSDAQ"]
-        )
-        usd_assets = [
-            asset for asset in self.assets if asset.exchange not in ["KOSPI", "KOSDAQ"]
-        ]
-        usd_value = sum((asset.latest_close or 0) * usd_rate for asset in usd_assets)
-        return asset_value + usd_value + self.cash_balance + self.time_deposits
+        asset_value = sum(asset.value_krw(usd_rate) for asset in self.assets)
+        return asset_value + self.cash_balance + self.time_deposits
 
     def total_value_usd(self, usd_rate: float = 1400.0) -> float:
         """총 평가금액 (USD) 계산"""
         return self.total_value_krw(usd_rate) / usd_rate
 
     def asset_allocation(self, usd_rate: float = 1400.0) -> dict:
-        """자산 분배 계산"""
-        total = self.total_value_krw(usd_rate)
-        if total == 0:
-            return {}
-
-        allocation = {}
+        """자산 분배 계산 (자산 목록을 한 번만 순회하며 합계와 카테고리별 금액 집계)"""
+        allocation: dict = {}
+        total = 0.0
         for asset in self.assets:
-            category = asset.get_asset_category()
-            value = asset.latest_close or 0
-            if asset.exchange not in ["KOSPI", "KOSDAQ"]:
-                value *= usd_rate
-
-            if category.value not in allocation:
-                allocation[category.value] = 0
-            allocation[category.value] += value
+            value = asset.value_krw(usd_rate)
+            category = asset.get_asset_category().value
+            allocation[category] = allocation.get(category, 0) + value
+            total += value
 
         # 현금성자산 추가
         cash_total = self.cash_balance + self.time_deposits
         if cash_total > 0:
-            if "현금성자산" not in allocation:
-                allocation["현금성자산"] = 0
-            allocation["현금성자산"] += cash_total
+            allocation["현금성자산"] = allocation.get("현금성자산", 0) + cash_total
+        total += cash_total
 
-        # 비율로 변환
-        for category in allocation:
-            allocation[category] = (allocation[category] / total) * 100
+        if total == 0:
+            return {}
 
-        return allocation
+        # 비율로 변환
+        return {category: value / total * 100 for category, value in allocation.items()}
 
 
-@dataclass
+@dataclass(slots=True)
 class CashPosition:
     """현금 포지션 엔티티."""
 
     account: str
     krw: float = 0.0
     usd: float = 0.0
-    updated_at: datetime = datetime.now()
+    updated_at: datetime = field(default_factory=datetime.now)
 
     def total_krw(self, usd_rate: float = 1400.0) -> float:
         """KRW 총액 계산"""
@@ -141,7 +140,7 @@ class CashPosition:
         return self.total_krw(usd_rate) / usd_rate
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeDeposit:
     """예적금 엔티티."""
 
@@ -151,13 +150,13 @@ class TimeDeposit:
     invested_principal: int
     maturity_date: Optional[datetime] = None
     interest_rate: Optional[float] = None
-    updated_at: datetime = datetime.now()
+    updated_at: datetime = field(default_factory=datetime.now)
 
-    def is_matured(self) -> bool:
-        """만기 도래 여부"""
+    def is_matured(self, now: Optional[datetime] = None) -> bool:
+        """만기 도래 여부 (여러 건을 판정할 때는 기준 시각 now를 한 번 구해 전달)"""
         if not self.maturity_date:
             return False
-        return datetime.now() >= self.maturity_date
+        return (now or datetime.now()) >= self.maturity_date
 
     def expected_return(self) -> float:
         """예상 수익률 계산"""
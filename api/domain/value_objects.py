@@ -2,27 +2,38 @@
 
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Union
+from functools import lru_cache
+from typing import Optional, Union
+
+# 당일 종가가 확정된 것으로 보는 시각 (시)
+MARKET_CLOSE_HOUR = 20
+
+
+# 허용되는 자산 카테고리 (인스턴스 생성마다 set을 만들지 않도록 모듈 상수로 유지)
+_VALID_ASSET_CATEGORIES = frozenset(
+    {
+        "국내주식",
+        "해외주식",
+        "국내채권",
+        "해외채권",
+        "국내리츠",
+        "해외리츠",
+        "TDF",
+        "원자재",
+        "금",
+        "현금성자산",
+        "기타",
+    }
+)
 
 
 class AssetCategory:
     """자산 카테고리 값 객체."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str):
-        valid_categories = {
-            "국내주식",
-            "해외주식",
-            "국내채권",
-            "해외채권",
-            "국내리츠",
-            "해외리츠",
-            "TDF",
-            "원자재",
-            "금",
-            "현금성자산",
-            "기타",
-        }
-        if value not in valid_categories:
+        if value not in _VALID_ASSET_CATEGORIES:
             raise ValueError(f"Invalid asset category: {value}")
         self.value = value
 
@@ -39,6 +50,8 @@ class AssetCategory:
 class MarketType:
     """시장 타입 값 객체."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str):
         valid_markets = {"KOSPI", "KOSDAQ", "KONEX", "US", "NASDAQ", "NYSE"}
         if value not in valid_markets:
@@ -66,6 +79,8 @@ class MarketType:
 class Currency:
     """통화 값 객체."""
 
+    __slots__ = ("code",)
+
     def __init__(self, code: str):
         valid_currencies = {"KRW", "USD", "EUR", "JPY", "CNY", "GBP"}
         if code not in valid_currencies:
@@ -90,12 +105,21 @@ class Currency:
         return f"Currency('{self.code}')"
 
 
+def _parse_iso_date(value: str) -> date:
+    """ISO 날짜/일시 문자열을 date로 변환 (YYYY-MM-DD는 직접 파싱)"""
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        return date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+    return datetime.fromisoformat(value).date()
+
+
 class BusinessDate:
     """영업일 값 객체."""
 
+    __slots__ = ("date",)
+
     def __init__(self, date: Union[date, str, datetime]):
         if isinstance(date, str):
-            self.date = datetime.fromisoformat(date).date()
+            self.date = _parse_iso_date(date)
         elif isinstance(date, datetime):
             self.date = date.date()
         else:
@@ -108,13 +132,13 @@ class BusinessDate:
         """유효한 영업일인지 확인 (평일만 영업일로 가정)"""
         return date.weekday() < 5  # 0-4는 월-금
 
-    def is_today(self) -> bool:
-        """오늘인지 확인"""
-        return self.date == date.today()
+    def is_today(self, today: Optional[date] = None) -> bool:
+        """오늘인지 확인 (여러 건을 확인할 때는 today를 한 번 구해 전달)"""
+        return self.date == (today or date.today())
 
-    def days_until_today(self) -> int:
+    def days_until_today(self, today: Optional[date] = None) -> int:
         """오늘까지 남은 일수"""
-        return (date.today() - self.date).days
+        return ((today or date.today()) - self.date).days
 
     def __eq__(self, other) -> bool:
         return isinstance(other, BusinessDate) and self.date == other.date
@@ -126,51 +150,112 @@ class BusinessDate:
         return f"BusinessDate('{self.date}')"
 
 
+@lru_cache(maxsize=4)
+def _business_date_for(today: date, after_close: bool) -> date:
+    """기준일과 마감 이후 여부로 최근 영업일 계산 (결과는 캐시)"""
+    business_day = today if after_close else today - timedelta(days=1)
+
+    # 주말이면 가장 최근 금요일로 (5=토요일 -> 1일, 6=일요일 -> 2일 전)
+    weekday = business_day.weekday()
+    if weekday >= 5:
+        business_day -= timedelta(days=weekday - 4)
+
+    return business_day
+
+
+def latest_business_date() -> date:
+    """가장 최근 영업일 반환 (평일 20시 이전이면 전날, 주말이면 금요일)"""
+    now = datetime.now()
+    return _business_date_for(now.date(), now.hour >= MARKET_CLOSE_HOUR)
+
+
+def current_trading_date() -> date:
+    """현재 시세 스냅숏의 기준일 반환 (평일이면 오늘, 주말이면 금요일)"""
+    return _business_date_for(date.today(), True)
+
+
+# Money 내부 정수 단위 (금액 1 = 1_000_000 micro)
+MICRO_UNITS = 1_000_000
+
+
+def _to_micro(value: Union[float, int, Decimal]) -> int:
+    """금액/계수를 micro 단위 정수로 변환 (Decimal 입력만 Decimal 연산)"""
+    if isinstance(value, int):
+        return value * MICRO_UNITS
+    if isinstance(value, Decimal):
+        return int((value * MICRO_UNITS).to_integral_value())
+    return round(value * MICRO_UNITS)
+
+
 class Money:
-    """금액 값 객체."""
+    """금액 값 객체 (내부적으로 micro 단위 정수로 보관해 정수 연산으로 계산)."""
+
+    __slots__ = ("micro", "currency")
 
     def __init__(self, amount: Union[float, int, Decimal], currency: Currency):
         if amount < 0:
             raise ValueError("Amount cannot be negative")
-        self.amount = Decimal(str(amount))
+        self.micro = _to_micro(amount)
         self.currency = currency
 
+    @classmethod
+    def from_micro(cls, micro: int, currency: Currency) -> "Money":
+        """micro 단위 정수로 생성 (변환/검증 없이)"""
+        money = cls.__new__(cls)
+        money.micro = micro
+        money.currency = currency
+        return money
+
+    @property
+    def amount(self) -> Decimal:
+        """금액 (표시용 Decimal)"""
+        return self.to_decimal()
+
+    def to_decimal(self) -> Decimal:
+        """Decimal 금액으로 변환"""
+        return Decimal(self.micro) / MICRO_UNITS
+
     def add(self, other: "Money") -> "Money":
         """금액 더하기"""
         if self.currency != other.currency:
             raise ValueError("Cannot add different currencies")
-        return Money(self.amount + other.amount, self.currency)
+        return Money.from_micro(self.micro + other.micro, self.currency)
 
     def subtract(self, other: "Money") -> "Money":
         """금액 빼기"""
         if self.currency != other.currency:
             raise ValueError("Cannot subtract different currencies")
-        if self.amount < other.amount:
+        if self.micro < other.micro:
             raise ValueError("Insufficient funds")
-        return Money(self.amount - other.amount, self.currency)
+        return Money.from_micro(self.micro - other.micro, self.currency)
 
     def multiply(self, factor: Union[float, int, Decimal]) -> "Money":
         """금액 곱하기"""
         if factor < 0:
             raise ValueError("Factor cannot be negative")
-        return Money(self.amount * Decimal(str(factor)), self.currency)
+        if isinstance(factor, int):
+            return Money.from_micro(self.micro * factor, self.currency)
+        return Money.from_micro(
+            self.micro * _to_micro(factor) // MICRO_UNITS, self.currency
+        )
 
     def convert_to(self, target_currency: Currency, exchange_rate: float) -> "Money":
         """다른 통화로 변환"""
         if exchange_rate <= 0:
             raise ValueError("Exchange rate must be positive")
-        converted_amount = float(self.amount) * exchange_rate
-        return Money(converted_amount, target_currency)
+        return Money.from_micro(
+            self.micro * _to_micro(exchange_rate) // MICRO_UNITS, target_currency
+        )
 
     def __eq__(self, other) -> bool:
         return (
             isinstance(other, Money)
-            and self.amount == other.amount
+            and self.micro == other.micro
             and self.currency == other.currency
         )
 
     def __str__(self) -> str:
-        return f"{self.amount:,.2f} {self.currency.code}"
+        return f"{self.to_decimal():,.2f} {self.currency.code}"
 
     def __repr__(self) -> str:
-        return f"Money({self.amount}, {self.currency})"
+        return f"Money({self.to_decimal()}, {self.currency})"
@@ -1,14 +1,24 @@
+import asyncio
+import hashlib
 import os
 import sys
-import time
 from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Callable, Coroutine, List, Optional
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+import orjson
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from .database import DatabaseManager
+from .middleware import RequestLoggingMiddleware
 from .models import (
     AssetAllocationResponse,
     CashBalanceUpdate,
@@ -31,14 +41,27 @@ from logger import get_api_logger
 
 api_logger = get_api_logger("API")
 
+# 조회 엔드포인트 로그 포맷 (%-인자로 지연 포맷팅)
+_LOG_PORTFOLIO_OVERVIEW_REQ = "📊 포트폴리오 개요 조회 요청 - 계정: %s"
+_LOG_PORTFOLIO_OVERVIEW_DONE = "✅ 포트폴리오 개요 조회 완료 - 총 자산: ₩%s"
+_LOG_CURRENCY_RATES_REQ = "💱 환율 정보 조회 요청 - 자동 업데이트: %s"
+_LOG_CURRENCY_RATES_DONE = "✅ 환율 정보 조회 완료 - %s개 통화"
+_LOG_CASH_BALANCES_REQ = "💰 증권사별 예수금 조회 요청 - 계정: %s"
+_LOG_CASH_BALANCES_DONE = "✅ 증권사별 예수금 조회 완료 - %s개 계정"
+_LOG_TIME_DEPOSITS_REQ = "💰 예적금 정보 조회 요청 - 계정: %s"
+_LOG_TIME_DEPOSITS_DONE = "✅ 예적금 정보 조회 완료 - %s개 예적금"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작 시 실행
     api_logger.info("🚀 AssetNest API 서버가 시작되었습니다")
     api_logger.info("📊 API 문서: http://localhost:8000/docs")
+    await db.warm_up()
     yield
-    # 종료 시 실행
+    # 종료 시 실행 (예약된 bs_timeseries 동기화를 마친 뒤 커넥션 풀 종료)
+    await db.flush_pending_syncs()
+    db.close()
     api_logger.info("🛑 AssetNest API 서버가 종료됩니다")
 
 
@@ -47,495 +70,560 @@ app = FastAPI(
     description="효율적인 자산관리를 위한 포트폴리오 API",
     version="1.0.0",
     lifespan=lifespan,
+    # 대용량 목록 응답의 JSON 인코딩을 orjson으로 처리
+    default_response_class=ORJSONResponse,
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
+def error_detail(message: str):
+    """처리되지 않은 예외를 500으로 응답할 때 detail 앞에 붙일 메시지를 엔드포인트에 지정"""
 
-# 로깅 미들웨어
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """API 요청/응답 로깅 미들웨어"""
-    start_time = time.time()
+    def decorator(endpoint):
+        endpoint.error_detail = message
+        return endpoint
 
-    # 요청 로깅
-    api_logger.info(
-        f"📨 {request.method} {request.url.path} - "
-        f"클라이언트: {request.client.host if request.client else 'unknown'}"
-    )
+    return decorator
 
-    # 쿼리 파라미터 로깅 (있는 경우)
-    if request.query_params:
-        api_logger.debug(f"📊 쿼리 파라미터: {dict(request.query_params)}")
 
-    try:
-        response = await call_next(request)
-        process_time = time.time() - start_time
+class ErrorDetailRoute(APIRoute):
+    """엔드포인트 밖으로 나온 예외를 한 곳에서 로깅하고 500 HTTPException으로 변환하는 라우트
 
-        # 응답 로깅
-        status_emoji = "✅" if response.status_code < 400 else "❌"
-        api_logger.info(
-            f"{status_emoji} {request.method} {request.url.path} - "
-            f"상태: {response.status_code} - 처리시간: {process_time:.3f}초"
+    HTTPException(404/400 등)과 요청 검증 오류는 그대로 전달합니다.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        detail = getattr(
+            self.endpoint, "error_detail", "요청 처리 중 오류가 발생했습니다"
         )
 
-        return response
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                api_logger.error(
+                    "❌ %s %s 실패: %s", request.method, request.url.path, e
+                )
+                raise HTTPException(status_code=500, detail=f"{detail}: {str(e)}")
+
+        return route_handler
+
+
+app.router.route_class = ErrorDetailRoute
+
+# 1KB 이상 JSON 응답 압축
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# 허용 origin 목록 (쉼표 구분). 대시보드처럼 서버 측에서만 호출하는 배포는
+# CORS_ORIGINS=""로 설정해 CORS 미들웨어 자체를 생략
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get("CORS_ORIGINS", "*").split(",")
+    if origin.strip()
+]
+if CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
-    except Exception as e:
-        process_time = time.time() - start_time
-        api_logger.error(
-            f"💥 {request.method} {request.url.path} - "
-            f"오류: {str(e)} - 처리시간: {process_time:.3f}초"
-        )
-        raise
+# 로깅 미들웨어 (가장 바깥에서 전체 처리시간 측정)
+app.add_middleware(RequestLoggingMiddleware, logger=api_logger)
 
 
 db = DatabaseManager()
 
 
+def _ndjson_response(models: AsyncIterator[BaseModel]) -> StreamingResponse:
+    """모델 비동기 이터레이터를 한 줄에 하나씩 NDJSON으로 스트리밍 (전체 목록을 메모리에 두지 않음)"""
+
+    async def ndjson_lines():
+        async for model in models:
+            # str을 거치지 않고 pydantic-core가 만든 bytes를 그대로 전송
+            yield to_json(model) + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+# compact 응답에서 모델을 datetime 객체가 살아 있는 파이썬 값으로 변환
+_PYTHON_VALUE = TypeAdapter(Any)
+
+
+def _epoch_millis(value: Any) -> Any:
+    """compact 응답용 orjson default 훅: datetime은 epoch 밀리초, date는 ISO 문자열
+
+    타임존 없는 datetime(서비스의 datetime.now() 기본값)은 서버 로컬 시각으로 해석한다.
+    """
+    if isinstance(value, datetime):
+        return round(value.timestamp() * 1000)
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError
+
+
+def _json_response(data: Any, compact: bool = False) -> Response:
+    """응답 모델(목록)을 pydantic-core 직렬화기로 바로 JSON 인코딩
+
+    response_model이 없는 엔드포인트에서 FastAPI가 거치는 jsonable_encoder의
+    파이썬 재귀 변환을 생략합니다. 직렬화기는 모델 클래스마다 한 번 컴파일되어
+    재사용되므로 요청마다 인코더 상태를 만들지 않습니다.
+
+    compact=True이면 (내부 서비스 간 호출용) datetime을 ISO 문자열 대신
+    epoch 밀리초 정수로 인코딩합니다.
+    """
+    if compact:
+        body = orjson.dumps(
+            _PYTHON_VALUE.dump_python(data),
+            default=_epoch_millis,
+            option=orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+        return Response(body, media_type="application/json")
+    return Response(to_json(data), media_type="application/json")
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match가 * 이거나 태그 목록 중 하나가 etag와 같은지 (W/ 접두어 무시)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def _etag_response(request: Request, data: Any) -> Response:
+    """응답 본문 해시를 ETag로 붙이고, If-None-Match와 일치하면 본문 없이 304 반환
+
+    데이터가 어떤 경로로 바뀌든 본문이 달라지면 태그도 바뀝니다.
+    GZip 압축으로 전송 바이트가 달라지므로 약한(W/) ETag를 사용합니다.
+    """
+    response = _json_response(data)
+    etag = f'W/"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
 @app.get("/")
 async def root():
     return {"message": "AssetNest API에 오신 것을 환영합니다!", "version": "1.0.0"}
 
 
-@app.get("/api/v1/portfolio/overview", response_model=PortfolioOverview)
-async def get_portfolio_overview(account: Optional[str] = None):
-    """포트폴리오 전체 현황을 반환합니다."""
-    try:
-        api_logger.info(f"📊 포트폴리오 개요 조회 요청 - 계정: {account or '전체'}")
-        data = await db.get_portfolio_overview(account)
-        api_logger.info(
-            f"✅ 포트폴리오 개요 조회 완료 - 총 자산: ₩{data.total_value_krw:,.0f}"
-        )
-        return data
-    except Exception as e:
-        api_logger.error(f"❌ 포트폴리오 개요 조회 실패: {str(e)}")
-        raise HTTPException(
-            status_code=500, detail=f"데이터 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+# 조회 엔드포인트: DatabaseManager가 이미 검증된 응답 모델을 반환하므로
+# response_model 재검증을 생략하고 스키마는 responses로만 문서화
+@app.get(
+    "/api/v1/portfolio/overview",
+    response_model=None,
+    responses={200: {"model": PortfolioOverview}},
+)
+@error_detail("데이터 조회 중 오류가 발생했습니다")
+async def get_portfolio_overview(request: Request, account: Optional[str] = None):
+    """포트폴리오 전체 현황을 반환합니다. (ETag 일치 시 304)"""
+    api_logger.info(_LOG_PORTFOLIO_OVERVIEW_REQ, account or "전체")
+    data = await db.get_portfolio_overview(account)
+    api_logger.info(
+        _LOG_PORTFOLIO_OVERVIEW_DONE,
+        format(data.total_value_krw, ",.0f"),
+    )
+    return _etag_response(request, data)
 
 
-@app.get("/api/v1/holdings/", response_model=List[HoldingResponse])
-async def get_all_holdings(account: Optional[str] = None, market: Optional[str] = None):
-    """모든 보유 종목 정보를 반환합니다."""
-    try:
-        holdings = await db.get_holdings(account, market)
-        return holdings
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"보유 종목 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+@app.get(
+    "/api/v1/holdings/",
+    response_model=None,
+    responses={200: {"model": List[HoldingResponse]}},
+)
+@error_detail("보유 종목 조회 중 오류가 발생했습니다")
+async def get_all_holdings(
+    account: Optional[str] = None, market: Optional[str] = None, stream: bool = False
+):
+    """모든 보유 종목 정보를 반환합니다.
+
+    stream=true이면 페이지 단위로 조회하며 NDJSON(한 줄에 한 종목)으로 스트리밍합니다.
+    """
+    if stream:
+        return _ndjson_response(db.iter_holdings(account, market))
+    holdings = await db.get_holdings(account, market)
+    return _json_response(holdings)
 
 
-@app.get("/api/v1/holdings/{account}", response_model=List[HoldingResponse])
+@app.get(
+    "/api/v1/holdings/{account}",
+    response_model=None,
+    responses={200: {"model": List[HoldingResponse]}},
+)
+@error_detail("계좌별 보유 종목 조회 중 오류가 발생했습니다")
 async def get_holdings_by_account(account: str):
     """특정 계좌의 보유 종목을 반환합니다."""
-    try:
-        holdings = await db.get_holdings(account=account)
-        if not holdings:
-            raise HTTPException(
-                status_code=404,
-                detail=f"계좌 '{account}'의 보유 종목을 찾을 수 없습니다",
-            )
-        return holdings
-    except Exception as e:
+    # 존재하지 않는 계좌는 전체 보유 종목 조회 없이 바로 404
+    if not await db.account_exists(account):
         raise HTTPException(
-            status_code=500,
-            detail=f"계좌별 보유 종목 조회 중 오류가 발생했습니다: {str(e)}",
+            status_code=404,
+            detail=f"계좌 '{account}'의 보유 종목을 찾을 수 없습니다",
         )
+    return _json_response(await db.get_holdings(account=account))
 
 
-@app.get("/api/v1/stocks/", response_model=List[StockInfo])
+@app.get(
+    "/api/v1/stocks/",
+    response_model=None,
+    responses={200: {"model": List[StockInfo]}},
+)
+@error_detail("주식 정보 조회 중 오류가 발생했습니다")
 async def get_all_stocks():
     """모든 주식 정보를 반환합니다."""
-    try:
-        stocks = await db.get_all_stocks()
-        return stocks
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"주식 정보 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+    return _json_response(await db.get_all_stocks())
+
+
+@app.get("/api/v1/stocks/stream")
+async def stream_all_stocks():
+    """모든 주식 정보를 페이지 단위로 조회하며 NDJSON(한 줄에 한 종목)으로 스트리밍합니다."""
+    return _ndjson_response(db.iter_all_stocks())
 
 
 @app.post("/api/v1/stocks/refresh-prices")
-async def refresh_stock_prices():
+@error_detail("가격 업데이트 중 오류가 발생했습니다")
+async def refresh_stock_prices(request: Request):
     """symbol_table의 주식 가격을 새로고침합니다."""
-    try:
-        api_logger.info("🔄 symbol_table 가격 업데이트 요청")
-        result = await db.update_symbol_table_prices()
-        api_logger.info(
-            f"✅ 가격 업데이트 완료 - 성공: {result['success_count']}, "
-            f"실패: {result['fail_count']}, 스킵: {result['skip_count']}, 전체: {result['total_count']}"
-        )
-        return {
-            "message": "주식 가격이 성공적으로 업데이트되었습니다",
-            "success_count": result["success_count"],
-            "fail_count": result["fail_count"],
-            "skip_count": result["skip_count"],
-            "total_count": result["total_count"],
-            "timestamp": datetime.now(),
-        }
-    except Exception as e:
-        api_logger.error(f"❌ 가격 업데이트 실패: {str(e)}")
-        raise HTTPException(
-            status_code=500, detail=f"가격 업데이트 중 오류가 발생했습니다: {str(e)}"
-        )
+    api_logger.info("🔄 symbol_table 가격 업데이트 요청")
+    result = await db.update_symbol_table_prices()
+    api_logger.info(
+        "✅ 가격 업데이트 완료 - 성공: %s, 실패: %s, 스킵: %s, 전체: %s",
+        result["success_count"],
+        result["fail_count"],
+        result["skip_count"],
+        result["total_count"],
+    )
+    return {
+        "message": "주식 가격이 성공적으로 업데이트되었습니다",
+        "success_count": result["success_count"],
+        "fail_count": result["fail_count"],
+        "skip_count": result["skip_count"],
+        "total_count": result["total_count"],
+        "timestamp": request.state.start_dt,
+    }
 
 
 @app.post("/api/v1/stocks/update")
-async def update_stocks():
+@error_detail("주식 정보 업데이트 중 오류가 발생했습니다")
+async def update_stocks(request: Request):
     """symbol_table의 가격 정보와 sector/industry 정보를 한꺼번에 업데이트합니다."""
-    try:
-        api_logger.info("🔄 symbol_table 전체 업데이트 요청 (가격 + sector/industry)")
-
-        # 1. 가격 정보 업데이트
-        api_logger.info("📊 1단계: 가격 정보 업데이트 시작")
-        price_result = await db.update_symbol_table_prices()
-        api_logger.info(
-            f"✅ 가격 업데이트 완료 - 성공: {price_result['success_count']}, "
-            f"실패: {price_result['fail_count']}, 스킵: {price_result['skip_count']}"
-        )
+    api_logger.info("🔄 symbol_table 전체 업데이트 요청 (가격 + sector/industry)")
+
+    # 가격/sector 정보는 서로 독립적인 외부 조회이므로 동시에 실행
+    api_logger.info("📊 가격 정보 업데이트 시작")
+    api_logger.info("🏢 sector/industry 정보 업데이트 시작")
+    price_result, sector_result = await asyncio.gather(
+        db.update_symbol_table_prices(),
+        db.update_symbol_sector_info(),
+        return_exceptions=True,
+    )
 
-        # 2. Sector/Industry 정보 업데이트
-        api_logger.info("🏢 2단계: sector/industry 정보 업데이트 시작")
-        sector_result = await db.update_symbol_sector_info()
-        api_logger.info(
-            f"✅ sector/industry 업데이트 완료 - 성공: {sector_result['success_count']}, "
-            f"실패: {sector_result['fail_count']}"
-        )
+    # 단계별 실패를 각각 기록한 뒤, 하나라도 실패하면 오류로 응답
+    if isinstance(price_result, Exception):
+        api_logger.error("❌ 가격 업데이트 실패: %s", price_result)
+    if isinstance(sector_result, Exception):
+        api_logger.error("❌ sector/industry 업데이트 실패: %s", sector_result)
+    for result in (price_result, sector_result):
+        if isinstance(result, Exception):
+            raise result
 
-        return {
-            "message": "주식 정보가 성공적으로 업데이트되었습니다",
-            "price_update": {
-                "success_count": price_result["success_count"],
-                "fail_count": price_result["fail_count"],
-                "skip_count": price_result["skip_count"],
-                "total_count": price_result["total_count"],
-                "failed_stocks": price_result.get("failed_stocks", []),
-            },
-            "sector_update": {
-                "success_count": sector_result["success_count"],
-                "fail_count": sector_result["fail_count"],
-                "total_count": sector_result["total_count"],
-                "failed_stocks": sector_result.get("failed_stocks", []),
-            },
-            "timestamp": datetime.now(),
-        }
-    except Exception as e:
-        api_logger.error(f"❌ 주식 정보 업데이트 실패: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"주식 정보 업데이트 중 오류가 발생했습니다: {str(e)}",
-        )
+    api_logger.info(
+        "✅ 가격 업데이트 완료 - 성공: %s, 실패: %s, 스킵: %s",
+        price_result["success_count"],
+        price_result["fail_count"],
+        price_result["skip_count"],
+    )
+    api_logger.info(
+        "✅ sector/industry 업데이트 완료 - 성공: %s, 실패: %s",
+        sector_result["success_count"],
+        sector_result["fail_count"],
+    )
+
+    return {
+        "message": "주식 정보가 성공적으로 업데이트되었습니다",
+        # 업데이트 결과 dict를 그대로 펼쳐 사용 (failed_stocks만 기본값 보장)
+        "price_update": {"failed_stocks": [], **price_result},
+        "sector_update": {"failed_stocks": [], **sector_result},
+        "timestamp": request.state.start_dt,
+    }
 
 
 @app.get("/api/v1/analytics/performance/{account}", response_model=PerformanceData)
+@error_detail("성과 분석 데이터 조회 중 오류가 발생했습니다")
 async def get_performance_analytics(account: str):
     """계좌별 성과 분석 데이터를 반환합니다."""
-    try:
-        performance = await db.get_performance_data(account)
-        if not performance:
-            raise HTTPException(
-                status_code=404,
-                detail=f"계좌 '{account}'의 성과 데이터를 찾을 수 없습니다",
-            )
-        return performance
-    except Exception as e:
+    performance = await db.get_performance_data(account)
+    if not performance:
         raise HTTPException(
-            status_code=500,
-            detail=f"성과 분석 데이터 조회 중 오류가 발생했습니다: {str(e)}",
+            status_code=404,
+            detail=f"계좌 '{account}'의 성과 데이터를 찾을 수 없습니다",
         )
+    return performance
 
 
 @app.get("/api/v1/currency/rates")
-async def get_currency_rates(auto_update: bool = True):
-    """환율 정보를 반환합니다."""
-    try:
-        api_logger.info(f"💱 환율 정보 조회 요청 - 자동 업데이트: {auto_update}")
-        rates = await db.get_currency_rates(auto_update=auto_update)
-        api_logger.info(f"✅ 환율 정보 조회 완료 - {len(rates)}개 통화")
-        return rates
-    except Exception as e:
-        api_logger.error(f"❌ 환율 정보 조회 실패: {str(e)}")
-        raise HTTPException(
-            status_code=500, detail=f"환율 정보 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+@error_detail("환율 정보 조회 중 오류가 발생했습니다")
+async def get_currency_rates(auto_update: bool = True, compact: bool = False):
+    """환율 정보를 반환합니다. (compact=true이면 일시를 epoch 밀리초로 반환)"""
+    api_logger.info(_LOG_CURRENCY_RATES_REQ, auto_update)
+    rates = await db.get_currency_rates(auto_update=auto_update)
+    api_logger.info(_LOG_CURRENCY_RATES_DONE, len(rates))
+    return _json_response(rates, compact)
 
 
 @app.post("/api/v1/currency/refresh")
-async def refresh_currency_rates(currencies: Optional[List[str]] = None):
+@error_detail("환율 새로고침 중 오류가 발생했습니다")
+async def refresh_currency_rates(
+    request: Request, currencies: Optional[List[str]] = None
+):
     """환율 정보를 수동으로 새로고침합니다."""
-    try:
-        api_logger.info(f"🔄 환율 수동 새로고침 요청 - 통화: {currencies or '전체'}")
-
-        if currencies:
-            # 특정 통화만 업데이트
-            updated_rates = await db.update_currency_rates(currencies)
-        else:
-            # 모든 환율 새로고침 (기존 환율 조회 후 업데이트)
-            current_rates = await db.get_currency_rates(auto_update=False)
-            all_currencies = [rate.currency for rate in current_rates]
-            updated_rates = await db.update_currency_rates(all_currencies)
-
-        api_logger.info(f"✅ 환율 새로고침 완료 - {len(updated_rates)}개 업데이트")
-        return {
-            "message": f"환율 정보가 성공적으로 업데이트되었습니다",
-            "updated_count": len(updated_rates),
-            "updated_currencies": [rate.currency for rate in updated_rates],
-            "timestamp": datetime.now(),
-        }
-    except Exception as e:
-        api_logger.error(f"❌ 환율 새로고침 실패: {str(e)}")
-        raise HTTPException(
-            status_code=500, detail=f"환율 새로고침 중 오류가 발생했습니다: {str(e)}"
-        )
+    api_logger.info("🔄 환율 수동 새로고침 요청 - 통화: %s", currencies or "전체")
+
+    if currencies:
+        # 특정 통화만 업데이트
+        updated_rates = await db.update_currency_rates(currencies)
+    else:
+        # 모든 환율 새로고침 (캐시된 통화 코드 목록으로 바로 업데이트)
+        all_currencies = await db.list_currency_codes()
+        updated_rates = await db.update_currency_rates(all_currencies)
+
+    api_logger.info("✅ 환율 새로고침 완료 - %s개 업데이트", len(updated_rates))
+    return {
+        "message": f"환율 정보가 성공적으로 업데이트되었습니다",
+        "updated_count": len(updated_rates),
+        "updated_currencies": [rate.currency for rate in updated_rates],
+        "timestamp": request.state.start_dt,
+    }
+
+
+@app.post("/api/v1/market/refresh")
+@error_detail("시장 데이터 새로고침 중 오류가 발생했습니다")
+async def refresh_market_data(request: Request):
+    """환율과 symbol_table 가격을 동시에 새로고침합니다."""
+    api_logger.info("🔄 시장 데이터(환율 + 가격) 새로고침 요청")
+    result = await db.refresh_market_data()
+    api_logger.info(
+        "✅ 시장 데이터 새로고침 완료 - 환율: %s개, 가격 성공: %s",
+        len(result["currency_rates"]),
+        result["price_update"]["success_count"],
+    )
+    return {
+        "message": "시장 데이터가 성공적으로 새로고침되었습니다",
+        "currency_rates": result["currency_rates"],
+        "price_update": result["price_update"],
+        "timestamp": request.state.start_dt,
+    }
 
 
-@app.get("/api/v1/portfolio/allocation", response_model=AssetAllocationResponse)
+@app.get(
+    "/api/v1/portfolio/allocation",
+    response_model=None,
+    responses={200: {"model": AssetAllocationResponse}},
+)
+@error_detail("자산 분배 조회 중 오류가 발생했습니다")
 async def get_asset_allocation(
-    account: Optional[str] = None, auto_add_unmatched: bool = True
+    request: Request,
+    account: Optional[str] = None,
+    auto_add_unmatched: bool = Query(True, deprecated=True),
 ):
-    """자산 분배 현황을 반환합니다.
+    """자산 분배 현황을 반환합니다. (ETag 일치 시 304)
 
     Args:
         account: 특정 계좌만 조회 (None이면 전체)
-        auto_add_unmatched: symbol_table에 없는 상품을 자동으로 추가할지 여부 (기본값: True)
+        auto_add_unmatched: 하위 호환용으로만 받으며 무시됨 (미매칭 상품 추가는
+            /api/v1/validation/unmatched-products 조회 후 별도로 수행)
     """
-    try:
-        allocation = await db.get_asset_allocation(account, auto_add_unmatched)
-        return allocation
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"자산 분배 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+    allocation = await db.get_asset_allocation(account)
+    return _etag_response(request, allocation)
 
 
 @app.get(
     "/api/v1/validation/unmatched-products", response_model=UnmatchedProductsResponse
 )
+@error_detail("매칭되지 않는 상품 조회 중 오류가 발생했습니다")
 async def get_unmatched_products(account: Optional[str] = None):
     """by_accounts 테이블에는 있지만 symbol_table에는 없는 상품들을 반환합니다."""
-    try:
-        unmatched = await db.get_unmatched_products(account)
-        return unmatched
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"매칭되지 않는 상품 조회 중 오류가 발생했습니다: {str(e)}",
-        )
+    unmatched = await db.get_unmatched_products(account)
+    return unmatched
 
 
 # ============ 현금 관리 API 엔드포인트 ============
 
 
-@app.get("/api/v1/cash/summary", response_model=CashManagementSummary)
-async def get_cash_management_summary():
-    """현금 관리 요약 정보를 반환합니다."""
-    try:
-        api_logger.info("💰 현금 관리 요약 정보 조회 요청")
-        summary = await db.get_cash_management_summary()
-        api_logger.info("✅ 현금 관리 요약 정보 조회 완료")
-        return summary
-    except Exception as e:
-        api_logger.error(f"❌ 현금 관리 요약 정보 조회 실패: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"현금 관리 요약 정보 조회 중 오류가 발생했습니다: {str(e)}",
-        )
+@app.get(
+    "/api/v1/cash/summary",
+    response_model=None,
+    responses={200: {"model": CashManagementSummary}},
+)
+@error_detail("현금 관리 요약 정보 조회 중 오류가 발생했습니다")
+async def get_cash_management_summary(compact: bool = False):
+    """현금 관리 요약 정보를 반환합니다. (compact=true이면 일시를 epoch 밀리초로 반환)"""
+    api_logger.info("💰 현금 관리 요약 정보 조회 요청")
+    summary = await db.get_cash_management_summary()
+    api_logger.info("✅ 현금 관리 요약 정보 조회 완료")
+    return _json_response(summary, compact)
 
 
 @app.get("/api/v1/cash/balances/")
-async def get_cash_balances(account: Optional[str] = None):
-    """증권사별 예수금 정보를 반환합니다."""
-    try:
-        api_logger.info(f"💰 증권사별 예수금 조회 요청 - 계정: {account or '전체'}")
-        balances = await db.get_cash_balances(account)
-        api_logger.info(f"✅ 증권사별 예수금 조회 완료 - {len(balances)}개 계정")
-        return balances
-    except Exception as e:
-        api_logger.error(f"❌ 증권사별 예수금 조회 실패: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"증권사별 예수금 조회 중 오류가 발생했습니다: {str(e)}",
-        )
+@error_detail("증권사별 예수금 조회 중 오류가 발생했습니다")
+async def get_cash_balances(account: Optional[str] = None, compact: bool = False):
+    """증권사별 예수금 정보를 반환합니다. (compact=true이면 일시를 epoch 밀리초로 반환)"""
+    api_logger.info(_LOG_CASH_BALANCES_REQ, account or "전체")
+    balances = await db.get_cash_balances(account)
+    api_logger.info(_LOG_CASH_BALANCES_DONE, len(balances))
+    return _json_response(balances, compact)
 
 
 @app.put("/api/v1/cash/balances/{account}")
+@error_detail("증권사별 예수금 업데이트 중 오류가 발생했습니다")
 async def update_cash_balance(account: str, update_data: CashBalanceUpdate):
     """특정 계좌의 예수금을 업데이트합니다."""
-    try:
-        # URL encoding된 계좌명을 디코딩
-        from urllib.parse import unquote
-
-        decoded_account = unquote(account)
-        api_logger.info(
-            f"💰 {decoded_account} 계좌 예수금 업데이트 요청: KRW={update_data.krw}, USD={update_data.usd}"
-        )
-        success = await db.update_cash_balance(
-            decoded_account, update_data.krw, update_data.usd
-        )
+    # 경로 파라미터는 라우팅 시 이미 URL 디코딩되어 있음
+    api_logger.info(
+        "💰 %s 계좌 예수금 업데이트 요청: KRW=%s, USD=%s",
+        account,
+        update_data.krw,
+        update_data.usd,
+    )
+    success = await db.update_cash_balance(account, update_data.krw, update_data.usd)
 
-        if success:
-            api_logger.info(f"✅ {decoded_account} 계좌 예수금 업데이트 성공")
-            return {
-                "message": f"{decoded_account} 계좌의 예수금이 성공적으로 업데이트되었습니다",
-                "success": True,
-            }
-        else:
-            api_logger.error(f"❌ {decoded_account} 계좌 예수금 업데이트 실패")
-            raise HTTPException(
-                status_code=400,
-                detail=f"{decoded_account} 계좌의 예수금 업데이트에 실패했습니다",
-            )
-    except HTTPException:
-        raise
-    except Exception as e:
-        api_logger.error(f"❌ 증권사별 예수금 업데이트 실패: {str(e)}")
+    if success:
+        api_logger.info("✅ %s 계좌 예수금 업데이트 성공", account)
+        return {
+            "message": f"{account} 계좌의 예수금이 성공적으로 업데이트되었습니다",
+            "success": True,
+        }
+    else:
+        api_logger.error("❌ %s 계좌 예수금 업데이트 실패", account)
         raise HTTPException(
-            status_code=500,
-            detail=f"증권사별 예수금 업데이트 중 오류가 발생했습니다: {str(e)}",
+            status_code=400,
+            detail=f"{account} 계좌의 예수금 업데이트에 실패했습니다",
         )
 
 
 @app.get("/api/v1/cash/deposits/")
-async def get_time_deposits(account: Optional[str] = None):
-    """예적금 정보를 반환합니다."""
-    try:
-        api_logger.info(f"💰 예적금 정보 조회 요청 - 계정: {account or '전체'}")
-        deposits = await db.get_time_deposits(account)
-        api_logger.info(f"✅ 예적금 정보 조회 완료 - {len(deposits)}개 예적금")
-        return deposits
-    except Exception as e:
-        api_logger.error(f"❌ 예적금 정보 조회 실패: {str(e)}")
-        raise HTTPException(
-            status_code=500, detail=f"예적금 정보 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+@error_detail("예적금 정보 조회 중 오류가 발생했습니다")
+async def get_time_deposits(account: Optional[str] = None, compact: bool = False):
+    """예적금 정보를 반환합니다. (compact=true이면 일시를 epoch 밀리초로 반환)"""
+    api_logger.info(_LOG_TIME_DEPOSITS_REQ, account or "전체")
+    deposits = await db.get_time_deposits(account)
+    api_logger.info(_LOG_TIME_DEPOSITS_DONE, len(deposits))
+    return _json_response(deposits, compact)
 
 
 @app.post("/api/v1/cash/deposits/")
+@error_detail("예적금 생성 중 오류가 발생했습니다")
 async def create_time_deposit(deposit_data: TimeDepositCreate):
     """새로운 예적금을 생성합니다."""
-    try:
-        api_logger.info(f"💰 예적금 생성 요청: {deposit_data.invest_prod_name}")
-        success = await db.create_time_deposit(
-            account=deposit_data.account,
-            invest_prod_name=deposit_data.invest_prod_name,
-            market_value=deposit_data.market_value,
-            invested_principal=deposit_data.invested_principal,
-            maturity_date=deposit_data.maturity_date,
-            interest_rate=deposit_data.interest_rate,
-        )
+    api_logger.info("💰 예적금 생성 요청: %s", deposit_data.invest_prod_name)
+    success = await db.create_time_deposit(
+        account=deposit_data.account,
+        invest_prod_name=deposit_data.invest_prod_name,
+        market_value=deposit_data.market_value,
+        invested_principal=deposit_data.invested_principal,
+        maturity_date=deposit_data.maturity_date,
+        interest_rate=deposit_data.interest_rate,
+    )
 
-        if success:
-            api_logger.info(f"✅ 예적금 생성 성공: {deposit_data.invest_prod_name}")
-            return {"message": "예적금이 성공적으로 생성되었습니다", "success": True}
-        else:
-            api_logger.error(f"❌ 예적금 생성 실패: {deposit_data.invest_prod_name}")
-            raise HTTPException(status_code=400, detail="예적금 생성에 실패했습니다")
-    except HTTPException:
-        raise
-    except Exception as e:
-        api_logger.error(f"❌ 예적금 생성 실패: {str(e)}")
-        raise HTTPException(
-            status_code=500, detail=f"예적금 생성 중 오류가 발생했습니다: {str(e)}"
-        )
+    if success:
+        api_logger.info("✅ 예적금 생성 성공: %s", deposit_data.invest_prod_name)
+        return {"message": "예적금이 성공적으로 생성되었습니다", "success": True}
+    else:
+        api_logger.error("❌ 예적금 생성 실패: %s", deposit_data.invest_prod_name)
+        raise HTTPException(status_code=400, detail="예적금 생성에 실패했습니다")
 
 
 @app.put("/api/v1/cash/deposits/{account}")
+@error_detail("예적금 수정 중 오류가 발생했습니다")
 async def update_time_deposit(account: str, update_data: TimeDepositUpdateWithAccount):
     """특정 예적금을 수정합니다."""
-    try:
-        api_logger.info(f"💰 예적금 수정 요청: {update_data.invest_prod_name}")
-        success = await db.update_time_deposit(
-            account=account,
-            invest_prod_name=update_data.invest_prod_name,
-            market_value=update_data.market_value,
-            invested_principal=update_data.invested_principal,
-            maturity_date=update_data.maturity_date,
-            interest_rate=update_data.interest_rate,
-        )
+    api_logger.info("💰 예적금 수정 요청: %s", update_data.invest_prod_name)
+    success = await db.update_time_deposit(
+        account=account,
+        invest_prod_name=update_data.invest_prod_name,
+        market_value=update_data.market_value,
+        invested_principal=update_data.invested_principal,
+        maturity_date=update_data.maturity_date,
+        interest_rate=update_data.interest_rate,
+    )
 
-        if success:
-            api_logger.info(f"✅ 예적금 수정 성공: {update_data.invest_prod_name}")
-            return {"message": "예적금이 성공적으로 수정되었습니다", "success": True}
-        else:
-            api_logger.error(f"❌ 예적금 수정 실패: {update_data.invest_prod_name}")
-            raise HTTPException(
-                status_code=404, detail="예적금을 찾을 수 없거나 수정에 실패했습니다"
-            )
-    except HTTPException:
-        raise
-    except Exception as e:
-        api_logger.error(f"❌ 예적금 수정 실패: {str(e)}")
+    if success:
+        api_logger.info("✅ 예적금 수정 성공: %s", update_data.invest_prod_name)
+        return {"message": "예적금이 성공적으로 수정되었습니다", "success": True}
+    else:
+        api_logger.error("❌ 예적금 수정 실패: %s", update_data.invest_prod_name)
         raise HTTPException(
-            status_code=500, detail=f"예적금 수정 중 오류가 발생했습니다: {str(e)}"
+            status_code=404, detail="예적금을 찾을 수 없거나 수정에 실패했습니다"
         )
 
 
 @app.delete("/api/v1/cash/deposits/{account}/{invest_prod_name}")
+@error_detail("예적금 삭제 중 오류가 발생했습니다")
 async def delete_time_deposit(account: str, invest_prod_name: str):
     """특정 예적금을 삭제합니다."""
-    try:
-        # URL encoding된 이름을 디코딩
-        from urllib.parse import unquote
-
-        deposit_name = unquote(invest_prod_name)
-
-        api_logger.info(f"💰 예적금 삭제 요청: {deposit_name}")
-        success = await db.delete_time_deposit(account, deposit_name)
-
-        if success:
-            api_logger.info(f"✅ 예적금 삭제 성공: {deposit_name}")
-            return {"message": "예적금이 성공적으로 삭제되었습니다", "success": True}
-        else:
-            api_logger.error(f"❌ 예적금 삭제 실패: {deposit_name}")
-            raise HTTPException(
-                status_code=404, detail="예적금을 찾을 수 없거나 삭제에 실패했습니다"
-            )
-    except HTTPException:
-        raise
-    except Exception as e:
-        api_logger.error(f"❌ 예적금 삭제 실패: {str(e)}")
+    # 경로 파라미터는 라우팅 시 이미 URL 디코딩되어 있음
+    deposit_name = invest_prod_name
+
+    api_logger.info("💰 예적금 삭제 요청: %s", deposit_name)
+    success = await db.delete_time_deposit(account, deposit_name)
+
+    if success:
+        api_logger.info("✅ 예적금 삭제 성공: %s", deposit_name)
+        return {"message": "예적금이 성공적으로 삭제되었습니다", "success": True}
+    else:
+        api_logger.error("❌ 예적금 삭제 실패: %s", deposit_name)
         raise HTTPException(
-            status_code=500, detail=f"예적금 삭제 중 오류가 발생했습니다: {str(e)}"
+            status_code=404, detail="예적금을 찾을 수 없거나 삭제에 실패했습니다"
         )
 
 
 @app.put("/api/v1/cash/current")
+@error_detail("현재 현금 업데이트 중 오류가 발생했습니다")
 async def update_current_cash(cash_data: CashUpdateRequest):
     """현재 현금을 업데이트하고 bs_timeseries에 저장합니다."""
-    try:
-        api_logger.info(f"💰 현재 현금 업데이트 요청: {cash_data.cash:,}원")
-        success = await db.update_current_cash(
-            cash=cash_data.cash, reason=cash_data.reason
-        )
+    api_logger.info("💰 현재 현금 업데이트 요청: %s원", format(cash_data.cash, ","))
+    success = await db.update_current_cash(cash=cash_data.cash, reason=cash_data.reason)
 
-        if success:
-            api_logger.info("✅ 현재 현금 업데이트 성공")
-            return {
-                "message": "현재 현금이 성공적으로 업데이트되었습니다",
-                "success": True,
-            }
-        else:
-            api_logger.error("❌ 현재 현금 업데이트 실패")
-            raise HTTPException(status_code=400, detail="현금 업데이트에 실패했습니다")
-    except HTTPException:
-        raise
-    except Exception as e:
-        api_logger.error(f"❌ 현재 현금 업데이트 실패: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"현재 현금 업데이트 중 오류가 발생했습니다: {str(e)}",
-        )
+    if success:
+        api_logger.info("✅ 현재 현금 업데이트 성공")
+        return {
+            "message": "현재 현금이 성공적으로 업데이트되었습니다",
+            "success": True,
+        }
+    else:
+        api_logger.error("❌ 현재 현금 업데이트 실패")
+        raise HTTPException(status_code=400, detail="현금 업데이트에 실패했습니다")
+
+
+@app.post("/api/v1/cache/invalidate")
+async def invalidate_cache(request: Request):
+    """조회 응답 캐시(포트폴리오/자산배분/보유종목/환율)를 비웁니다."""
+    api_logger.info("🧹 응답 캐시 무효화 요청")
+    db.invalidate_cache()
+    return {
+        "message": "응답 캐시가 무효화되었습니다",
+        "timestamp": request.state.start_dt,
+    }
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop 이벤트 루프 + httptools 파서 (uvicorn[standard]에 포함)
+    # 워커마다 모듈을 새로 import하므로 DatabaseManager/커넥션 풀도 워커별로 생성됨
+    # 응답/종목 목록 캐시와 single-flight는 워커별 메모리라 쓰기 무효화가 다른 워커에
+    # 전달되지 않음 -> 기본 1개, 여러 워커는 API_WORKERS로 명시할 때만 (TTL만큼 지연 감수)
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("API_WORKERS", "1")),
+    )
@@ -0,0 +1,80 @@
+"""ASGI middleware for AssetNest API."""
+
+import logging
+import time
+from datetime import datetime
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class _LazyQueryParams:
+    """로그 레코드가 실제로 출력될 때만 쿼리 문자열을 (키, 값) 목록으로 파싱"""
+
+    __slots__ = ("query_string",)
+
+    def __init__(self, query_string: bytes):
+        self.query_string = query_string
+
+    def __str__(self) -> str:
+        return str(parse_qsl(self.query_string.decode("latin-1")))
+
+
+class RequestLoggingMiddleware:
+    """API 요청/응답 로깅 미들웨어 (Request 객체를 만들지 않는 순수 ASGI 구현)"""
+
+    def __init__(self, app: ASGIApp, logger: logging.Logger):
+        self.app = app
+        self.logger = logger
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        # 요청 시작 시각을 request.state.start_dt로 공유 (응답 timestamp와 로그를 일치시킴)
+        scope.setdefault("state", {})["start_dt"] = datetime.now()
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+
+        # 요청 로깅
+        self.logger.info(
+            "📨 %s %s - 클라이언트: %s",
+            method,
+            path,
+            client[0] if client else "unknown",
+        )
+
+        # 쿼리 파라미터 로깅 (있는 경우)
+        query_string = scope.get("query_string")
+        if query_string and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("📊 쿼리 파라미터: %s", _LazyQueryParams(query_string))
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # 응답 로깅
+                status_code = message["status"]
+                status_emoji = "✅" if status_code < 400 else "❌"
+                self.logger.info(
+                    "%s %s %s - 상태: %d - 처리시간: %.3f초",
+                    status_emoji,
+                    method,
+                    path,
+                    status_code,
+                    time.perf_counter() - start_time,
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            self.logger.error(
+                "💥 %s %s - 오류: %s - 처리시간: %.3f초",
+                method,
+                path,
+                e,
+                time.perf_counter() - start_time,
+            )
+            raise
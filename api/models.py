@@ -1,8 +1,11 @@
 from datetime import date, datetime
-from decimal import Decimal
-from typing import List, Optional
+from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from pydantic.dataclasses import dataclass
+
+# 요청 본문 모델 설정: 알 수 없는 필드는 무시하고, 파싱 후에는 변경하지 않음
+REQUEST_BODY_CONFIG = ConfigDict(extra="ignore", frozen=True)
 
 
 class PortfolioOverview(BaseModel):
@@ -20,16 +23,13 @@ class PortfolioOverview(BaseModel):
     investment_allocations: List["AssetAllocation"] = []  # 투자자산 분배비율
     last_updated: datetime
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
 
 class HoldingResponse(BaseModel):
     id: int
     account: str
     company: str
     market: str  # "국내" or "해외"
-    area: Optional[str] = None
+    area: str | None = None
     amount: int
     avg_price_krw: float
     current_price_krw: float
@@ -37,29 +37,32 @@ class HoldingResponse(BaseModel):
     market_value: float
     unrealized_pnl: float  # "unrealized_G/L"
     return_rate: float
-    avg_price_usd: Optional[float] = None
-    current_price_usd: Optional[float] = None
-    principal_usd: Optional[float] = None
-    market_value_usd: Optional[float] = None
-    unrealized_pnl_usd: Optional[float] = None
-    return_rate_usd: Optional[float] = None
-    first_buy_at: Optional[date] = None
-    last_buy_at: Optional[date] = None
-    last_sell_at: Optional[date] = None
-    total_realized_pnl: Optional[float] = None  # "total_realized_G/L"
-
-
-class StockInfo(BaseModel):
+    avg_price_usd: float | None = None
+    current_price_usd: float | None = None
+    principal_usd: float | None = None
+    market_value_usd: float | None = None
+    unrealized_pnl_usd: float | None = None
+    return_rate_usd: float | None = None
+    first_buy_at: date | None = None
+    last_buy_at: date | None = None
+    last_sell_at: date | None = None
+    total_realized_pnl: float | None = None  # "total_realized_G/L"
+
+
+# 수천 행 단위로 만들어지는 종목 목록 응답: __slots__ 기반 pydantic 데이터클래스
+# (인스턴스에 __dict__가 없어 메모리가 작음, select("*")의 추가 컬럼은 무시)
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StockInfo:
     id: int
     company: str
     symbol: str
     exchange: str
-    sector: Optional[str] = None
-    industry: Optional[str] = None
-    area: Optional[str] = None
-    latest_close: Optional[float] = None
-    marketcap: Optional[float] = None
-    updated_at: Optional[datetime] = None
+    sector: str | None = None
+    industry: str | None = None
+    area: str | None = None
+    latest_close: float | None = None
+    marketcap: float | None = None
+    updated_at: datetime | None = None
 
 
 class PerformanceData(BaseModel):
@@ -108,12 +111,9 @@ class AssetAllocation(BaseModel):
 class AssetAllocationResponse(BaseModel):
     total_portfolio_value: float
     allocations: List[AssetAllocation]
-    account: Optional[str] = None
+    account: str | None = None
     last_updated: datetime
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
 
 class UnmatchedProduct(BaseModel):
     """by_accounts 테이블에는 있지만 symbol_table에는 없는 상품"""
@@ -121,10 +121,10 @@ class UnmatchedProduct(BaseModel):
     account: str
     invest_prod_name: str
     amount: int
-    avg_price_krw: Optional[float] = None
-    avg_price_usd: Optional[float] = None
-    first_buy_at: Optional[date] = None
-    last_buy_at: Optional[date] = None
+    avg_price_krw: float | None = None
+    avg_price_usd: float | None = None
+    first_buy_at: date | None = None
+    last_buy_at: date | None = None
 
 
 class UnmatchedProductsResponse(BaseModel):
@@ -135,9 +135,6 @@ class UnmatchedProductsResponse(BaseModel):
     accounts_with_unmatched: List[str]
     last_updated: datetime
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
 
 class CashBalance(BaseModel):
     """증권사별 예수금 정보"""
@@ -155,8 +152,8 @@ class TimeDeposit(BaseModel):
     invest_prod_name: str
     market_value: int
     invested_principal: int
-    maturity_date: Optional[datetime] = None
-    interest_rate: Optional[float] = None
+    maturity_date: datetime | None = None
+    interest_rate: float | None = None
     updated_at: datetime
 
 
@@ -172,8 +169,10 @@ class BSTimeseries(BaseModel):
 class CashBalanceUpdate(BaseModel):
     """현금 잔액 업데이트 요청"""
 
-    krw: Optional[float] = None
-    usd: Optional[float] = None
+    krw: float | None = None
+    usd: float | None = None
+
+    model_config = REQUEST_BODY_CONFIG
 
 
 class TimeDepositCreate(BaseModel):
@@ -183,34 +182,42 @@ class TimeDepositCreate(BaseModel):
     invest_prod_name: str
     market_value: int
     invested_principal: int
-    maturity_date: Optional[datetime] = None
-    interest_rate: Optional[float] = None
+    maturity_date: datetime | None = None
+    interest_rate: float | None = None
+
+    model_config = REQUEST_BODY_CONFIG
 
 
 class TimeDepositUpdate(BaseModel):
     """예적금 수정 요청"""
 
-    market_value: Optional[int] = None
-    invested_principal: Optional[int] = None
-    maturity_date: Optional[datetime] = None
-    interest_rate: Optional[float] = None
+    market_value: int | None = None
+    invested_principal: int | None = None
+    maturity_date: datetime | None = None
+    interest_rate: float | None = None
+
+    model_config = REQUEST_BODY_CONFIG
 
 
 class TimeDepositUpdateWithAccount(BaseModel):
     """예적금 수정 요청 (계정 포함)"""
 
     invest_prod_name: str
-    market_value: Optional[int] = None
-    invested_principal: Optional[int] = None
-    maturity_date: Optional[datetime] = None
-    interest_rate: Optional[float] = None
+    market_value: int | None = None
+    invested_principal: int | None = None
+    maturity_date: datetime | None = None
+    interest_rate: float | None = None
+
+    model_config = REQUEST_BODY_CONFIG
 
 
 class CashUpdateRequest(BaseModel):
     """현금 업데이트 요청 (bs_timeseries)"""
 
     cash: int
-    reason: Optional[str] = None
+    reason: str | None = None
+
+    model_config = REQUEST_BODY_CONFIG
 
 
 class CashManagementSummary(BaseModel):
@@ -222,8 +229,5 @@ class CashManagementSummary(BaseModel):
     total_security_cash: int  # 총 증권사 예수금
     cash_balances: List[CashBalance]
     time_deposits: List[TimeDeposit]
-    latest_bs_entry: Optional[BSTimeseries]
+    latest_bs_entry: BSTimeseries | None
     updated_at: datetime
-
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
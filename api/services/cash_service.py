@@ -1,41 +1,136 @@
 """Cash management service for handling cash balances and time deposits."""
 
+import asyncio
 import logging
+import operator
 from datetime import date, datetime
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Set
+
+from pydantic import TypeAdapter
 
 from .interfaces import ICashService, ISyncService
-from ..database_modules.repositories import CashRepository
+from ..database_modules.repositories import (
+    CASH_BALANCE_COLUMNS,
+    TIME_DEPOSIT_COLUMNS,
+    CashRepository,
+)
 from ..database_modules.models import DatabaseModels
 
 logger = logging.getLogger(__name__)
 
 
+# 우리 DB(cash_balance/time_deposit)에서 읽은 행 목록을 TypeAdapter로 한 번에 변환
+# (행마다 Python에서 모델을 만들지 않고 pydantic-core가 목록 전체를 일괄 처리)
+_CASH_BALANCE_LIST = TypeAdapter(List[DatabaseModels.CashBalance])
+_TIME_DEPOSIT_LIST = TypeAdapter(List[DatabaseModels.TimeDeposit])
+# 행에서 필요한 컬럼을 C 수준에서 한 번에 꺼냄 (저장소/RPC가 항상 이 컬럼들을 선택)
+_CASH_BALANCE_FIELDS = operator.itemgetter(*CASH_BALANCE_COLUMNS)
+_TIME_DEPOSIT_FIELDS = operator.itemgetter(*TIME_DEPOSIT_COLUMNS)
+
+# 연속된 변경을 한 번의 bs_timeseries 동기화로 합치기 위해 기다리는 시간 (초)
+SYNC_DEBOUNCE_SECONDS = 0.05
+SYNC_CASH_BALANCE = "cash_balance"
+SYNC_TIME_DEPOSIT = "time_deposit"
+
+
+def _cash_balances_from_rows(
+    rows: List[Dict[str, Any]], now: datetime
+) -> List[DatabaseModels.CashBalance]:
+    """cash_balance 행 목록을 CashBalance 목록으로 일괄 변환"""
+    return _CASH_BALANCE_LIST.validate_python(
+        [
+            {"account": account, "krw": krw or 0, "usd": usd or 0, "updated_at": now}
+            for account, krw, usd in map(_CASH_BALANCE_FIELDS, rows)
+        ]
+    )
+
+
+def _time_deposits_from_rows(
+    rows: List[Dict[str, Any]], now: datetime
+) -> List[DatabaseModels.TimeDeposit]:
+    """time_deposit 행 목록을 TimeDeposit 목록으로 일괄 변환"""
+    return _TIME_DEPOSIT_LIST.validate_python(
+        [
+            {
+                "account": account,
+                "invest_prod_name": invest_prod_name,
+                "market_value": market_value or 0,
+                "invested_principal": invested_principal or 0,
+                "maturity_date": maturity_date or None,
+                "interest_rate": interest_rate,
+                "updated_at": now,
+            }
+            for (
+                account,
+                invest_prod_name,
+                market_value,
+                invested_principal,
+                maturity_date,
+                interest_rate,
+            ) in map(_TIME_DEPOSIT_FIELDS, rows)
+        ]
+    )
+
+
 class CashService(ICashService):
     """현금 관리 서비스."""
 
-    def __init__(self, cash_repository: CashRepository, sync_service: ISyncService):
+    def __init__(
+        self,
+        cash_repository: CashRepository,
+        sync_service: ISyncService,
+        on_synced: Optional[Callable[[], None]] = None,
+    ):
         self.cash_repository = cash_repository
         self.sync_service = sync_service
+        # 예약된 동기화가 끝난 뒤 호출 (예: 조회 응답 캐시 무효화)
+        self.on_synced = on_synced
+        self._pending_syncs: Set[str] = set()
+        self._sync_task: Optional[asyncio.Task] = None
+        # 진행 중인 동기화가 끝난 뒤에 flush가 반환되도록 직렬화
+        self._sync_lock = asyncio.Lock()
+
+    def _schedule_sync(self, target: str) -> None:
+        """bs_timeseries 동기화 예약 (짧은 시간 안의 여러 변경을 한 번의 동기화로 합침)"""
+        self._pending_syncs.add(target)
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._run_scheduled_syncs())
+
+    async def _run_scheduled_syncs(self) -> None:
+        """대기 시간 뒤 예약된 동기화를 실행 (실행 중 새로 예약된 것도 이어서 처리)"""
+        while self._pending_syncs:
+            await asyncio.sleep(SYNC_DEBOUNCE_SECONDS)
+            try:
+                await self.flush_pending_syncs()
+            except Exception as e:
+                logger.error(f"❌ 예약된 bs_timeseries 동기화 실패: {e}")
+
+    async def flush_pending_syncs(self) -> None:
+        """예약된 bs_timeseries 동기화를 즉시 실행 (바로 일관된 값이 필요할 때 호출)"""
+        async with self._sync_lock:
+            pending, self._pending_syncs = self._pending_syncs, set()
+            if not pending:
+                return
+
+            try:
+                if SYNC_CASH_BALANCE in pending:
+                    await self.sync_service.sync_bs_timeseries_from_cash_balances()
+                if SYNC_TIME_DEPOSIT in pending:
+                    await self.sync_service.sync_bs_timeseries_from_time_deposits()
+            finally:
+                if self.on_synced is not None:
+                    self.on_synced()
 
     async def get_cash_balances(
         self, account: Optional[str] = None
     ) -> List[DatabaseModels.CashBalance]:
         """증권사별 예수금 정보 조회"""
         try:
-            cash_balances_data = self.cash_repository.get_cash_balances(account)
-
-            cash_balances = []
-            for item in cash_balances_data:
-                cash_balance = DatabaseModels.CashBalance(
-                    account=item.get("account"),
-                    krw=float(item.get("krw", 0)),
-                    usd=float(item.get("usd", 0)),
-                    updated_at=datetime.now(),
-                )
-                cash_balances.append(cash_balance)
+            cash_balances_data = await self.cash_repository.get_cash_balances(account)
+            if not cash_balances_data:
+                return []
 
-            return cash_balances
+            return _cash_balances_from_rows(cash_balances_data, datetime.now())
 
         except Exception as e:
             logger.error(f"현금 잔액 조회 오류: {e}")
@@ -60,30 +155,25 @@ class CashService(ICashService):
 
             logger.info(f"🔄 {account} 현금 잔액 업데이트 시도: {update_data}")
 
-            # 먼저 해당 계좌가 존재하는지 확인
-            existing = self.cash_repository.get_cash_balances(account)
-            if not existing:
-                logger.error(f"❌ {account} 계좌를 찾을 수 없음")
-                return False
-
-            result = self.cash_repository.update_cash_balance(account, update_data)
+            # 갱신된 행이 없으면 계좌가 없는 것이므로 별도의 존재 확인 조회는 하지 않음
+            result = await asyncio.to_thread(
+                self.cash_repository.update_cash_balance, account, update_data
+            )
 
             if result:
                 logger.info(f"✅ {account} 현금 잔액 업데이트 성공: {update_data}")
 
-                # bs_timeseries 테이블에 security_cash_balance 동기화
-                await self.sync_service.sync_bs_timeseries_from_cash_balances()
+                # bs_timeseries 테이블에 security_cash_balance 동기화 (예약)
+                self._schedule_sync(SYNC_CASH_BALANCE)
 
                 return True
             else:
-                logger.error(f"❌ {account} 현금 잔액 업데이트 실패 - 데이터 없음")
+                logger.error(f"❌ {account} 계좌를 찾을 수 없음")
                 return False
 
         except Exception as e:
-            logger.error(f"현금 잔액 업데이트 오류: {e}")
-            import traceback
-
-            logger.error(f"상세 에러: {traceback.format_exc()}")
+            # traceback은 로그가 실제로 출력될 때만 포맷됨
+            logger.exception("현금 잔액 업데이트 오류: %s", e)
             raise
 
     async def get_time_deposits(
@@ -91,22 +181,11 @@ class CashService(ICashService):
     ) -> List[DatabaseModels.TimeDeposit]:
         """예적금 정보 조회"""
         try:
-            time_deposits_data = self.cash_repository.get_time_deposits(account)
-
-            time_deposits = []
-            for item in time_deposits_data:
-                time_deposit = DatabaseModels.TimeDeposit(
-                    account=item.get("account"),
-                    invest_prod_name=item.get("invest_prod_name"),
-                    market_value=item.get("market_value", 0),
-                    invested_principal=item.get("invested_principal", 0),
-                    maturity_date=item.get("maturity_date"),
-                    interest_rate=item.get("interest_rate"),
-                    updated_at=datetime.now(),
-                )
-                time_deposits.append(time_deposit)
+            time_deposits_data = await self.cash_repository.get_time_deposits(account)
+            if not time_deposits_data:
+                return []
 
-            return time_deposits
+            return _time_deposits_from_rows(time_deposits_data, datetime.now())
 
         except Exception as e:
             logger.error(f"예적금 정보 조회 오류: {e}")
@@ -137,13 +216,15 @@ class CashService(ICashService):
                 insert_data["interest_rate"] = interest_rate
 
             logger.debug(f"Insert data: {insert_data}")
-            result = self.cash_repository.create_time_deposit(insert_data)
+            result = await asyncio.to_thread(
+                self.cash_repository.create_time_deposit, insert_data
+            )
 
             if result:
                 logger.info(f"✅ 예적금 생성 성공: {invest_prod_name}")
 
-                # bs_timeseries 테이블 동기화
-                await self.sync_service.sync_bs_timeseries_from_time_deposits()
+                # bs_timeseries 테이블 동기화 (예약)
+                self._schedule_sync(SYNC_TIME_DEPOSIT)
 
                 return True
             else:
@@ -179,15 +260,18 @@ class CashService(ICashService):
                 return False
 
             logger.debug(f"Update data: {update_data}")
-            result = self.cash_repository.update_time_deposit(
-                account, invest_prod_name, update_data
+            result = await asyncio.to_thread(
+                self.cash_repository.update_time_deposit,
+                account,
+                invest_prod_name,
+                update_data,
             )
 
             if result:
                 logger.info(f"✅ 예적금 수정 성공: {invest_prod_name}")
 
-                # bs_timeseries 테이블 동기화
-                await self.sync_service.sync_bs_timeseries_from_time_deposits()
+                # bs_timeseries 테이블 동기화 (예약)
+                self._schedule_sync(SYNC_TIME_DEPOSIT)
 
                 return True
             else:
@@ -201,13 +285,15 @@ class CashService(ICashService):
     async def delete_time_deposit(self, account: str, invest_prod_name: str) -> bool:
         """예적금 삭제"""
         try:
-            result = self.cash_repository.delete_time_deposit(account, invest_prod_name)
+            result = await asyncio.to_thread(
+                self.cash_repository.delete_time_deposit, account, invest_prod_name
+            )
 
             if result:
                 logger.info(f"✅ 예적금 삭제 성공: {invest_prod_name}")
 
-                # bs_timeseries 테이블 동기화
-                await self.sync_service.sync_bs_timeseries_from_time_deposits()
+                # bs_timeseries 테이블 동기화 (예약)
+                self._schedule_sync(SYNC_TIME_DEPOSIT)
 
                 return True
             else:
@@ -221,30 +307,40 @@ class CashService(ICashService):
     async def get_cash_management_summary(self) -> DatabaseModels.CashManagementSummary:
         """현금 관리 요약 정보 조회"""
         try:
-            # 1. 현금 잔액 조회
-            cash_balances = await self.get_cash_balances()
-
-            # 2. 예적금 조회
-            time_deposits = await self.get_time_deposits()
-
-            # 3. 최신 bs_timeseries 조회
-            latest_bs = await self.get_latest_bs_entry()
+            # 예약된 동기화가 있으면 먼저 반영해 최신 bs_timeseries를 읽음
+            await self.flush_pending_syncs()
+
+            # cash_management_summary RPC로 한 번에 조회 (미배포 시 테이블별 조회)
+            rows = await self.cash_repository.get_cash_summary_rows()
+            if rows is not None:
+                now = datetime.now()
+                cash_balances = _cash_balances_from_rows(rows["cash_balances"], now)
+                time_deposits = _time_deposits_from_rows(rows["time_deposits"], now)
+                latest_bs = rows["latest_bs_entry"]
+            else:
+                # 현금 잔액 / 예적금 / 최신 bs_timeseries는 서로 독립적이므로 동시에 조회
+                results = await asyncio.gather(
+                    self.get_cash_balances(),
+                    self.get_time_deposits(),
+                    self.get_latest_bs_entry(),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        raise result
+                cash_balances, time_deposits, latest_bs = results
 
             if latest_bs:
                 # date 필드를 datetime으로 변환하여 JSON 직렬화 문제 해결
-                bs_data = latest_bs.copy()
-                if "date" in bs_data:
-                    date_value = bs_data["date"]
-                    if isinstance(date_value, str):
-                        bs_data["date"] = datetime.fromisoformat(
-                            date_value.replace("Z", "+00:00")
-                        )
-                    elif isinstance(date_value, date):
-                        bs_data["date"] = datetime.combine(
-                            date_value, datetime.min.time()
-                        )
-                    else:
-                        bs_data["date"] = date_value
+                # (저장소가 호출마다 새 dict를 반환하므로 복사하지 않고 그대로 수정)
+                date_value = latest_bs.get("date")
+                if isinstance(date_value, str):
+                    # Python 3.11+ fromisoformat은 "Z" 접미사를 직접 처리 (C 구현)
+                    latest_bs["date"] = datetime.fromisoformat(date_value)
+                elif isinstance(date_value, date):
+                    latest_bs["date"] = datetime.combine(
+                        date_value, datetime.min.time()
+                    )
 
                 return DatabaseModels.CashManagementSummary(
                     total_cash=latest_bs["cash"]
@@ -255,7 +351,7 @@ class CashService(ICashService):
                     total_security_cash=latest_bs["security_cash_balance"],
                     cash_balances=cash_balances,
                     time_deposits=time_deposits,
-                    latest_bs_entry=DatabaseModels.BSTimeseries(**bs_data),
+                    latest_bs_entry=DatabaseModels.BSTimeseries(**latest_bs),
                     updated_at=datetime.now(),
                 )
             else:
@@ -277,7 +373,7 @@ class CashService(ICashService):
     async def get_latest_bs_entry(self) -> Optional[Dict[str, Any]]:
         """가장 최신 bs_timeseries 항목 조회"""
         try:
-            return self.cash_repository.get_latest_bs_entry()
+            return await asyncio.to_thread(self.cash_repository.get_latest_bs_entry)
         except Exception as e:
             logger.error(f"최신 bs_timeseries 조회 오류: {e}")
             raise
@@ -293,67 +389,25 @@ class CashService(ICashService):
         try:
             today = date.today()
 
-            # 업데이트할 컬럼 결정
-            update_fields = {}
-            if cash is not None:
-                update_fields["cash"] = int(cash)
-            if time_deposit is not None:
-                update_fields["time_deposit"] = int(time_deposit)
-            if security_cash_balance is not None:
-                update_fields["security_cash_balance"] = int(security_cash_balance)
+            # 업데이트할 컬럼 결정 (값은 API 요청 모델에서 이미 int로 검증됨)
+            update_fields = {
+                field: value
+                for field, value in (
+                    ("cash", cash),
+                    ("time_deposit", time_deposit),
+                    ("security_cash_balance", security_cash_balance),
+                )
+                if value is not None
+            }
 
             if not update_fields:
                 logger.warning("❌ 업데이트할 필드가 없습니다")
                 return False
 
-            # 오늘 데이터가 있는지 확인
-            existing_bs = self.cash_repository.get_bs_timeseries_by_date(today)
-
-            if existing_bs:
-                # 기존 데이터가 있으면 선택적 컬럼만 업데이트
-                result = self.cash_repository.update_bs_timeseries(today, update_fields)
-                logger.info(f"✅ 기존 데이터 업데이트: {list(update_fields.keys())}")
-            else:
-                # 새 데이터인 경우, 가장 최신 데이터에서 기존 값 가져오기
-                latest_bs = self.cash_repository.get_latest_bs_entry()
-
-                # 기본값 설정
-                new_data = {"date": today.isoformat()}
-
-                if latest_bs:
-                    latest = latest_bs
-                    # 업데이트하지 않을 필드는 최신 데이터에서 가져오기
-                    new_data["cash"] = (
-                        int(cash) if cash is not None else latest.get("cash", 0)
-                    )
-                    new_data["time_deposit"] = (
-                        int(time_deposit)
-                        if time_deposit is not None
-                        else latest.get("time_deposit", 0)
-                    )
-                    new_data["security_cash_balance"] = (
-                        int(security_cash_balance)
-                        if security_cash_balance is not None
-                        else latest.get("security_cash_balance", 0)
-                    )
-                else:
-                    # 이전 데이터가 없는 경우 기본값 사용
-                    new_data["cash"] = int(cash) if cash is not None else 0
-                    new_data["time_deposit"] = (
-                        int(time_deposit) if time_deposit is not None else 0
-                    )
-                    new_data["security_cash_balance"] = (
-                        int(security_cash_balance)
-                        if security_cash_balance is not None
-                        else 0
-                    )
-
-                result = self.cash_repository.create_bs_timeseries(new_data)
-                logger.info(
-                    f"✅ 새 데이터 생성: cash={new_data['cash']:,}, "
-                    f"time_deposit={new_data['time_deposit']:,}, "
-                    f"security={new_data['security_cash_balance']:,}"
-                )
+            # 오늘 항목이 있으면 선택한 필드만 수정, 없으면 최신 항목 값을 이어받아 생성
+            result = await asyncio.to_thread(
+                self.cash_repository.upsert_bs_timeseries, today, update_fields
+            )
 
             if result:
                 # 업데이트된 정보 요약
@@ -1,16 +1,92 @@
 """Holdings service for stock and portfolio holdings management."""
 
+import asyncio
 import logging
-from datetime import date, datetime, timedelta
-from typing import List, Dict, Any, Optional
+import re
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from pydantic import TypeAdapter
 
 from .interfaces import IHoldingsService
-from ..database_modules.repositories import HoldingsRepository
+from ..database_modules.repositories import PAGE_SIZE, HoldingsRepository
 from ..adapters.market_data_adapter import MarketDataAdapter
 from ..database_modules.models import DatabaseModels
+from ..domain import latest_business_date
 
 logger = logging.getLogger(__name__)
 
+# 회사 이름 키워드 기반 sector 분류 (앞에 있는 sector가 우선)
+SECTOR_KEYWORDS = {
+    "IT": ["반도체", "소프트웨어", "IT", "컴퓨터", "인터넷", "게임"],
+    "금융": ["은행", "증권", "보험", "카드", "금융"],
+    "바이오": ["바이오", "제약", "의약", "헬스케어", "의료"],
+    "제조": ["제조", "자동차", "조선", "기계", "화학"],
+    "유통": ["유통", "백화점", "리테일", "상사"],
+    "통신": ["통신", "방송", "미디어"],
+    "건설": ["건설", "부동산", "건축"],
+    "에너지": ["에너지", "전력", "가스", "석유"],
+}
+# 키워드 -> (우선순위, sector), 모든 키워드를 한 번에 찾는 정규식
+_SECTOR_BY_KEYWORD = {
+    keyword: (priority, sector)
+    for priority, (sector, keywords) in enumerate(SECTOR_KEYWORDS.items())
+    for keyword in keywords
+}
+# 전방탐색으로 겹치는 키워드도 모두 찾음 ("석유통상"의 "석유"와 "유통")
+_SECTOR_KEYWORD_RE = re.compile(
+    "(?=(%s))" % "|".join(map(re.escape, _SECTOR_BY_KEYWORD))
+)
+
+
+# stock_info 행 목록 -> StockInfo 목록 일괄 검증기
+_STOCK_INFO_LIST = TypeAdapter(List[DatabaseModels.StockInfo])
+# overall_info 행 목록 -> HoldingResponse 목록 일괄 검증기
+_HOLDING_LIST = TypeAdapter(List[DatabaseModels.HoldingResponse])
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    """값이 있으면 float으로, 없으면 None 반환"""
+    return float(value) if value else None
+
+
+def _optional_date(value: Any) -> Optional[date]:
+    """ISO 문자열/날짜 값을 date로 변환"""
+    if not value:
+        return None
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+
+def _holding_fields(item: Dict[str, Any]) -> Dict[str, Any]:
+    """overall_info 행을 HoldingResponse 필드 dict로 변환"""
+    return dict(
+        id=item.get("id"),
+        account=item.get("account"),
+        company=item.get("company"),
+        market=item.get("market"),
+        area=item.get("area"),
+        amount=int(item.get("amount") or 0),
+        avg_price_krw=float(item.get("avg_price_krw") or 0),
+        current_price_krw=float(item.get("latest_close_krw") or 0),
+        principal=float(item.get("principal") or 0),
+        market_value=float(item.get("market_value") or 0),
+        unrealized_pnl=float(item.get("unrealized_G/L") or 0),
+        return_rate=float(item.get("rate_of_return") or 0),
+        avg_price_usd=_optional_float(item.get("avg_price_usd")),
+        current_price_usd=_optional_float(item.get("latest_close_usd")),
+        principal_usd=_optional_float(item.get("principal_usd")),
+        market_value_usd=_optional_float(item.get("market_value_usd")),
+        unrealized_pnl_usd=_optional_float(item.get("unrealized_G/L_usd")),
+        return_rate_usd=_optional_float(item.get("rate_of_return_usd")),
+        first_buy_at=_optional_date(item.get("first_buy_at")),
+        last_buy_at=_optional_date(item.get("last_buy_at")),
+        last_sell_at=_optional_date(item.get("last_sell_at")),
+        total_realized_pnl=_optional_float(item.get("total_realized_G/L")),
+    )
+
 
 class HoldingsService(IHoldingsService):
     """보유 종목 관리 서비스."""
@@ -24,33 +100,23 @@ class HoldingsService(IHoldingsService):
         self.market_data_adapter = market_data_adapter
 
     async def get_holdings(
-        self, account: Optional[str] = None
-    ) -> List[DatabaseModels.HoldingDetail]:
+        self, account: Optional[str] = None, market: Optional[str] = None
+    ) -> List[DatabaseModels.HoldingResponse]:
         """보유 종목 정보 조회"""
         try:
             logger.info(f"📊 보유 종목 정보 조회 - 계좌: {account or '전체'}")
 
-            holdings_data = self.holdings_repository.get_holdings(account)
-
-            holdings = []
-            for item in holdings_data:
-                holding = DatabaseModels.HoldingDetail(
-                    account=item.get("account"),
-                    name=item.get("company"),
-                    symbol=item.get("symbol"),
-                    quantity=int(item.get("amount", 0)),
-                    average_price=float(item.get("avg_price_krw", 0)),
-                    current_price=float(item.get("current_price_krw", 0)),
-                    valuation_amount=float(item.get("market_value", 0)),
-                    profit_loss=float(item.get("unrealized_pnl", 0)),
-                    profit_loss_rate=float(item.get("return_rate", 0)),
-                    currency="KRW",
-                    sector=item.get("sector"),
-                    asset_type=item.get("asset_type"),
-                    region_type=item.get("region_type"),
-                    updated_at=datetime.now(),
-                )
-                holdings.append(holding)
+            holdings_data = await asyncio.to_thread(
+                self.holdings_repository.get_all_holdings, account, market
+            )
+            if not holdings_data:
+                logger.info("✅ 보유 종목 정보 조회 완료 - 0개 종목")
+                return []
+
+            # 필드 매핑 후 목록 전체를 한 번에 검증
+            holdings = _HOLDING_LIST.validate_python(
+                [_holding_fields(item) for item in holdings_data]
+            )
 
             logger.info(f"✅ 보유 종목 정보 조회 완료 - {len(holdings)}개 종목")
             return holdings
@@ -59,6 +125,17 @@ class HoldingsService(IHoldingsService):
             logger.error(f"보유 종목 정보 조회 오류: {e}")
             raise
 
+    async def iter_holdings(
+        self, account: Optional[str] = None, market: Optional[str] = None
+    ) -> AsyncIterator[DatabaseModels.HoldingResponse]:
+        """보유 종목 정보를 페이지 단위로 조회하며 하나씩 반환"""
+        async for item in self.holdings_repository.iter_holdings(account, market):
+            yield DatabaseModels.HoldingResponse.model_validate(_holding_fields(item))
+
+    async def account_exists(self, account: str) -> bool:
+        """보유 종목 계좌 존재 여부 확인"""
+        return await self.holdings_repository.account_exists(account)
+
     async def update_holding(
         self,
         account: str,
@@ -140,48 +217,60 @@ class HoldingsService(IHoldingsService):
             latest_business_date = self._get_latest_business_date()
             logger.info(f"📅 최근 영업일: {latest_business_date}")
 
-            # symbol_table 데이터 조회
-            symbol_data = self.holdings_repository.get_symbol_table(symbols)
+            # symbol_table 데이터 조회 (동기 클라이언트 호출은 스레드에서 실행)
+            symbol_data = await asyncio.to_thread(
+                self.holdings_repository.get_symbol_table, symbols
+            )
             logger.info(f"📊 대상 심볼 수: {len(symbol_data)}")
 
             updated_symbols = []
             failed_symbols = []
+            price_rows = []
+
+            # 지역별로 묶어 시세를 한 번에 조회 (DB 쓰기는 이후 한 번에)
+            symbols_by_region: Dict[str, List[str]] = defaultdict(list)
+            for symbol_info in symbol_data:
+                region = symbol_info.get("region_type") or "domestic"
+                symbols_by_region[region].append(symbol_info.get("symbol"))
+
+            prices = await self.market_data_adapter.get_stock_prices_bulk(
+                symbols_by_region, latest_business_date
+            )
 
-            # 종목별 가격 업데이트
             for symbol_info in symbol_data:
                 symbol = symbol_info.get("symbol")
-                region_type = symbol_info.get("region_type", "domestic")
+                price_data = prices.get(symbol)
 
-                try:
-                    # 시장 데이터 어댑터로 가격 조회
-                    price_data = await self.market_data_adapter.get_stock_price(
-                        symbol, region_type, latest_business_date
+                # upsert 충돌 키가 name이므로 이름 없는 심볼은 쓰지 않고 실패 처리
+                if not symbol_info.get("name"):
+                    failed_symbols.append(symbol)
+                    logger.warning("⚠️ %s 종목명 없음 - 가격 업데이트 제외", symbol)
+                elif price_data and price_data.get("latest_close"):
+                    # name 기준 upsert, NOT NULL인 symbol도 함께 전달
+                    price_rows.append(
+                        {
+                            "symbol": symbol,
+                            "name": symbol_info.get("name"),
+                            "latest_close": price_data["latest_close"],
+                            "marketcap": price_data.get("marketcap"),
+                            "updated_at": price_data["updated_at"],
+                        }
                     )
+                else:
+                    failed_symbols.append(symbol)
+                    logger.warning("⚠️ %s 가격 정보 없음", symbol)
 
-                    if price_data and price_data.get("latest_close"):
-                        # symbol_table 업데이트
-                        update_result = self.holdings_repository.update_symbol_price(
-                            symbol,
-                            price_data["latest_close"],
-                            price_data.get("marketcap"),
-                            price_data.get("updated_at", datetime.now()),
-                        )
-
-                        if update_result:
-                            updated_symbols.append(symbol)
-                            logger.debug(
-                                f"✅ {symbol} 가격 업데이트 성공: {price_data['latest_close']}"
-                            )
-                        else:
-                            failed_symbols.append(symbol)
-                            logger.error(f"❌ {symbol} 가격 DB 업데이트 실패")
-                    else:
-                        failed_symbols.append(symbol)
-                        logger.warning(f"⚠️ {symbol} 가격 정보 없음")
-
+            # symbol_table 일괄 업데이트
+            if price_rows:
+                try:
+                    await asyncio.to_thread(
+                        self.holdings_repository.upsert_symbol_prices, price_rows
+                    )
+                    updated_symbols = [row["symbol"] for row in price_rows]
+                    logger.debug(f"✅ {len(price_rows)}개 심볼 가격 일괄 업데이트 성공")
                 except Exception as e:
-                    failed_symbols.append(symbol)
-                    logger.error(f"❌ {symbol} 가격 업데이트 오류: {e}")
+                    failed_symbols.extend(row["symbol"] for row in price_rows)
+                    logger.error(f"❌ 가격 DB 일괄 업데이트 실패: {e}")
 
             # 결과 요약
             total_symbols = len(symbol_data)
@@ -216,22 +305,7 @@ class HoldingsService(IHoldingsService):
         try:
             logger.info("📊 모든 주식 정보 조회 시작")
 
-            stock_data = self.holdings_repository.get_all_stocks()
-
-            stocks = []
-            for item in stock_data:
-                stock = DatabaseModels.StockInfo(
-                    symbol=item.get("symbol"),
-                    name=item.get("company"),
-                    sector=item.get("sector"),
-                    industry=item.get("industry"),
-                    asset_type=item.get("asset_type"),
-                    region_type=item.get("region_type"),
-                    latest_close=item.get("latest_close"),
-                    marketcap=item.get("marketcap"),
-                    updated_at=item.get("updated_at"),
-                )
-                stocks.append(stock)
+            stocks = [stock async for stock in self.iter_all_stocks()]
 
             logger.info(f"✅ 모든 주식 정보 조회 완료 - {len(stocks)}개 종목")
             return stocks
@@ -240,6 +314,22 @@ class HoldingsService(IHoldingsService):
             logger.error(f"모든 주식 정보 조회 오류: {e}")
             raise
 
+    async def iter_all_stocks(self) -> AsyncIterator[DatabaseModels.StockInfo]:
+        """모든 주식 정보를 페이지 단위로 조회하며 하나씩 반환
+
+        원본 행은 한 페이지 분량만 모아 한 번에 검증하므로 (추가 컬럼은 무시됨)
+        전체 목록을 만들 때도 원본 행 전체가 모델과 함께 메모리에 남지 않는다.
+        """
+        rows: List[Dict[str, Any]] = []
+        async for item in self.holdings_repository.iter_stock_info():
+            rows.append(item)
+            if len(rows) == PAGE_SIZE:
+                for stock in _STOCK_INFO_LIST.validate_python(rows):
+                    yield stock
+                rows.clear()
+        for stock in _STOCK_INFO_LIST.validate_python(rows):
+            yield stock
+
     async def get_performance_data(
         self, account: str
     ) -> DatabaseModels.PerformanceData:
@@ -281,34 +371,40 @@ class HoldingsService(IHoldingsService):
             logger.info("🔄 symbol sector 정보 업데이트 시작")
 
             # sector가 None인 심볼 조회
-            symbols_to_update = self.holdings_repository.get_symbols_without_sector()
+            symbols_to_update = await asyncio.to_thread(
+                self.holdings_repository.get_symbols_without_sector
+            )
             logger.info(f"📊 sector 업데이트 대상: {len(symbols_to_update)}개 종목")
 
             updated_symbols = []
             failed_symbols = []
+            sector_rows = []
 
             for symbol_info in symbols_to_update:
                 symbol = symbol_info.get("symbol")
-                try:
-                    # 기본적인 sector 정보 추출 (단순화된 버전)
-                    company_name = symbol_info.get("company", "")
-                    sector = self._extract_sector_from_name(company_name)
+                company_name = symbol_info.get("name")
+                # upsert 충돌 키가 name이므로 이름 없는 심볼은 쓰지 않고 실패 처리
+                if not company_name:
+                    failed_symbols.append(symbol)
+                    logger.warning("⚠️ %s 종목명 없음 - sector 업데이트 제외", symbol)
+                    continue
+                # 기본적인 sector 정보 추출 (단순화된 버전)
+                sector = self._extract_sector_from_name(company_name)
+                sector_rows.append(
+                    {"name": company_name, "symbol": symbol, "sector": sector}
+                )
 
-                    # sector 정보 업데이트
-                    result = self.holdings_repository.update_symbol_sector(
-                        symbol, sector
+            # sector 정보 일괄 업데이트 (단일 upsert)
+            if sector_rows:
+                try:
+                    await asyncio.to_thread(
+                        self.holdings_repository.upsert_symbol_sectors, sector_rows
                     )
-
-                    if result:
-                        updated_symbols.append(symbol)
-                        logger.debug(f"✅ {symbol} sector 업데이트 성공: {sector}")
-                    else:
-                        failed_symbols.append(symbol)
-                        logger.error(f"❌ {symbol} sector DB 업데이트 실패")
-
+                    updated_symbols = [row["symbol"] for row in sector_rows]
+                    logger.debug(f"✅ {len(sector_rows)}개 심볼 sector 업데이트 성공")
                 except Exception as e:
-                    failed_symbols.append(symbol)
-                    logger.error(f"❌ {symbol} sector 업데이트 오류: {e}")
+                    failed_symbols.extend(row["symbol"] for row in sector_rows)
+                    logger.error(f"❌ sector DB 일괄 업데이트 실패: {e}")
 
             # 결과 요약
             total_symbols = len(symbols_to_update)
@@ -338,36 +434,12 @@ class HoldingsService(IHoldingsService):
         if not company_name:
             return "기타"
 
-        # 기본적인 sector 키워드 매칭
-        sector_keywords = {
-            "IT": ["반도체", "소프트웨어", "IT", "컴퓨터", "인터넷", "게임"],
-            "금융": ["은행", "증권", "보험", "카드", "금융"],
-            "바이오": ["바이오", "제약", "의약", "헬스케어", "의료"],
-            "제조": ["제조", "자동차", "조선", "기계", "화학"],
-            "유통": ["유통", "백화점", "리테일", "상사"],
-            "통신": ["통신", "방송", "미디어"],
-            "건설": ["건설", "부동산", "건축"],
-            "에너지": ["에너지", "전력", "가스", "석유"],
-        }
-
-        for sector, keywords in sector_keywords.items():
-            for keyword in keywords:
-                if keyword in company_name:
-                    return sector
-
-        return "기타"
+        # 이름 전체를 한 번만 스캔하고, 찾은 키워드 중 우선순위가 가장 높은 sector 선택
+        matches = _SECTOR_KEYWORD_RE.findall(company_name)
+        if not matches:
+            return "기타"
+        return min(map(_SECTOR_BY_KEYWORD.__getitem__, matches))[1]
 
     def _get_latest_business_date(self) -> date:
         """가장 최근 영업일을 계산하여 반환"""
-        now = datetime.now()
-        latest_business_day = now
-
-        # 평일 20시 이전이면 전날로
-        if now.hour < 20:
-            latest_business_day = now - timedelta(days=1)
-
-        # 주말이면 가장 최근 금요일로
-        while latest_business_day.weekday() >= 5:  # 5=토요일, 6=일요일
-            latest_business_day = latest_business_day - timedelta(days=1)
-
-        return latest_business_day.date()
+        return latest_business_date()
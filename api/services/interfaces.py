@@ -19,7 +19,7 @@ class IPortfolioService(ABC):
 
     @abstractmethod
     async def get_asset_allocation(
-        self, account: Optional[str] = None, auto_add_unmatched: bool = True
+        self, account: Optional[str] = None
     ) -> DatabaseModels.AssetAllocationResponse:
         """자산 분배 현황 조회"""
         pass
@@ -49,6 +49,11 @@ class IHoldingsService(ABC):
         """보유 종목 정보 조회"""
         pass
 
+    @abstractmethod
+    async def account_exists(self, account: str) -> bool:
+        """보유 종목 계좌 존재 여부 확인"""
+        pass
+
     @abstractmethod
     async def get_all_stocks(self) -> List[DatabaseModels.StockInfo]:
         """모든 주식 정보 조회"""
@@ -89,6 +94,11 @@ class ICurrencyService(ABC):
         """특정 통화들의 환율 정보 업데이트"""
         pass
 
+    @abstractmethod
+    async def list_currency_codes(self) -> List[str]:
+        """등록된 통화 코드 목록 조회"""
+        pass
+
     @abstractmethod
     def _get_latest_business_date(self) -> date:
         """가장 최근 영업일을 계산하여 반환"""
@@ -171,6 +181,11 @@ class ICashService(ABC):
         """현재 현금 정보 선택적 업데이트 (bs_timeseries)"""
         pass
 
+    @abstractmethod
+    async def flush_pending_syncs(self) -> None:
+        """예약된 bs_timeseries 동기화를 즉시 실행"""
+        pass
+
 
 class ISyncService(ABC):
     """동기화 서비스 인터페이스."""
@@ -1,106 +1,204 @@
 """Portfolio service for portfolio overview and asset allocation management."""
 
+import asyncio
 import logging
 from datetime import date, datetime
 from typing import List, Dict, Any, Optional
 
 from .interfaces import IPortfolioService, ISyncService
-from ..database_modules.repositories import PortfolioRepository
+from ..database_modules.repositories import (
+    CashRepository,
+    CurrencyRepository,
+    PortfolioRepository,
+)
 from ..database_modules.models import DatabaseModels
+from ..domain import asset_category
 
 logger = logging.getLogger(__name__)
 
+# 환율 데이터가 없을 때 사용할 기본 USD 환율
+DEFAULT_USD_RATE = 1400.0
+
+
+def _allocation_rows(
+    holdings_data: List[Dict[str, Any]], funds_data: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """overall_info/funds 행을 v_portfolio_allocation과 같은 모양으로 집계
+
+    (계좌, 자산유형, 지역유형)별 종목 수, 평가금액 합계, 평가금액 내림차순 종목명 목록.
+    """
+    positions = [
+        (item, item.get(name_key), float(item.get("market_value") or 0))
+        for rows, name_key in (
+            (holdings_data, "company"),
+            (funds_data, "invest_prod_name"),
+        )
+        for item in rows
+    ]
+    groups: Dict[tuple, Dict[str, Any]] = {}
+    for item, name, market_value in sorted(
+        positions, key=lambda position: position[2], reverse=True
+    ):
+        if market_value <= 0:
+            continue
+        key = (item.get("account"), item.get("asset_type"), item.get("region_type"))
+        group = groups.setdefault(
+            key,
+            {
+                "account": key[0],
+                "asset_type": key[1],
+                "region_type": key[2],
+                "holdings_count": 0,
+                "total_market_value": 0.0,
+                "holdings": [],
+            },
+        )
+        group["holdings_count"] += 1
+        group["total_market_value"] += market_value
+        if name:
+            group["holdings"].append(name)
+    return list(groups.values())
+
 
 class PortfolioService(IPortfolioService):
     """포트폴리오 관리 서비스."""
 
     def __init__(
-        self, portfolio_repository: PortfolioRepository, sync_service: ISyncService
+        self,
+        portfolio_repository: PortfolioRepository,
+        sync_service: ISyncService,
+        currency_repository: CurrencyRepository,
+        cash_repository: CashRepository,
     ):
         self.portfolio_repository = portfolio_repository
         self.sync_service = sync_service
+        self.currency_repository = currency_repository
+        self.cash_repository = cash_repository
 
-    async def get_portfolio_overview(self) -> DatabaseModels.PortfolioOverview:
+    async def get_portfolio_overview(
+        self, account: Optional[str] = None
+    ) -> DatabaseModels.PortfolioOverview:
         """포트폴리오 전체 현황 조회"""
         try:
-            logger.info("📊 포트폴리오 전체 현황 조회 시작")
+            logger.info(
+                f"📊 포트폴리오 전체 현황 조회 시작 - 계좌: {account or '전체'}"
+            )
 
-            # 1. overall_info 뷰에서 데이터 조회
-            overview_data = self.portfolio_repository.get_portfolio_overview()
+            # 1. RPC 한 번으로 조회, 미배포 시 독립적인 테이블 조회를 동시에 실행
+            rows = await self.portfolio_repository.get_portfolio_rows(account)
+            if rows is not None:
+                holdings_data = rows.get("holdings") or []
+                funds_data = rows.get("funds") or []
+                usd_data = rows.get("usd_rates") or []
+                cash_data = rows.get("cash_balances") or []
+                deposit_data = rows.get("time_deposits") or []
+            else:
+                holdings_data, funds_data, usd_data, cash_data, deposit_data = (
+                    await asyncio.gather(
+                        self.portfolio_repository.get_overall_info(account),
+                        self.portfolio_repository.get_funds(account),
+                        self.currency_repository.get_currency_rates(["USD"]),
+                        self.cash_repository.get_cash_balances(account),
+                        self.cash_repository.get_time_deposits(account),
+                    )
+                )
 
-            if not overview_data:
+            if not (holdings_data or funds_data or cash_data or deposit_data):
                 logger.warning("⚠️ 포트폴리오 데이터가 없습니다")
-                return self._create_empty_overview()
-
-            # 2. 데이터 변환 및 계산
-            total_assets = 0
-            total_valuation_amount = 0
-            total_profit_loss = 0
-            total_profit_loss_rate = 0
-            krw_assets = 0
-            usd_assets = 0
-            total_equity = 0
-            total_bond = 0
-            total_reit = 0
-            total_commodity = 0
-            total_cash = 0
-
-            for item in overview_data:
-                # 통화별 자산 계산
-                if item.get("currency") == "KRW":
-                    krw_assets += float(item.get("valuation_amount", 0))
-                elif item.get("currency") == "USD":
-                    usd_assets += float(item.get("valuation_amount", 0))
-
-                # 자산유형별 계산
-                asset_type = item.get("asset_type", "").lower()
-                valuation = float(item.get("valuation_amount", 0))
-
-                if asset_type == "equity":
-                    total_equity += valuation
-                elif asset_type == "bond":
-                    total_bond += valuation
-                elif asset_type == "reit":
-                    total_reit += valuation
-                elif asset_type == "commodity":
-                    total_commodity += valuation
-                elif asset_type == "cash":
-                    total_cash += valuation
-
-                # 총계 계산
-                total_valuation_amount += valuation
-                total_profit_loss += float(item.get("profit_loss", 0))
-
-            # 평가손익률 계산 (가중 평균)
-            if total_valuation_amount > 0:
-                total_profit_loss_rate = (
-                    total_profit_loss / total_valuation_amount
-                ) * 100
-
-            # 총자산 = 총평가금액 (bs_timeseries의 현금 포함)
-            total_assets = total_valuation_amount
-
-            # 최신 bs_timeseries 데이터 조회
-            latest_bs = self._get_latest_bs_data()
-
-            # PortfolioOverview 객체 생성
+                return self._create_empty_overview(account)
+
+            usd_rate = DEFAULT_USD_RATE
+            if usd_data and usd_data[0].get("exchange_rate"):
+                usd_rate = float(usd_data[0]["exchange_rate"])
+            logger.info(f"💱 USD 환율 적용: {usd_rate}")
+
+            # 2. 투자자산 (보유 종목 + 펀드) 카테고리별 집계
+            allocations: Dict[str, Dict[str, Any]] = {}
+            investment_value = 0.0
+            total_principal = 0.0
+            total_pnl_krw = 0.0
+
+            for item in holdings_data:
+                market_value = float(item.get("market_value") or 0)
+                if market_value <= 0:
+                    continue
+                total_principal += float(item.get("principal") or 0)
+                total_pnl_krw += float(item.get("unrealized_G/L") or 0)
+                investment_value += market_value
+                self._add_to_allocation(
+                    allocations, item, item.get("company"), market_value
+                )
+
+            for item in funds_data:
+                market_value = float(item.get("market_value") or 0)
+                if market_value <= 0:
+                    continue
+                investment_value += market_value
+                self._add_to_allocation(
+                    allocations, item, item.get("invest_prod_name"), market_value
+                )
+
+            # 3. 현금성자산 (증권사 예수금 + 예적금)
+            cash_asset_value = sum(
+                float(item.get("krw") or 0) + float(item.get("usd") or 0) * usd_rate
+                for item in cash_data
+            ) + sum(float(item.get("market_value") or 0) for item in deposit_data)
+
+            total_value_krw = investment_value + cash_asset_value
+            if total_value_krw > 0:
+                cash_asset_ratio = cash_asset_value / total_value_krw * 100
+                investment_asset_ratio = investment_value / total_value_krw * 100
+            else:
+                cash_asset_ratio = 0.0
+                investment_asset_ratio = 0.0
+
+            investment_allocations = [
+                {
+                    "asset_category": category,
+                    **data,
+                    "allocation_percentage": (
+                        round(data["total_market_value"] / investment_value * 100, 2)
+                        if investment_value > 0
+                        else 0.0
+                    ),
+                }
+                for category, data in sorted(
+                    allocations.items(),
+                    key=lambda entry: entry[1]["total_market_value"],
+                    reverse=True,
+                )
+            ]
+
+            accounts = sorted(
+                {
+                    item["account"]
+                    for rows in (holdings_data, funds_data, cash_data, deposit_data)
+                    for item in rows
+                    if item.get("account")
+                }
+            )
+
             overview = DatabaseModels.PortfolioOverview(
-                total_assets=int(total_assets),
-                total_valuation_amount=int(total_valuation_amount),
-                total_profit_loss=int(total_profit_loss),
-                total_profit_loss_rate=round(total_profit_loss_rate, 2),
-                krw_assets=int(krw_assets),
-                usd_assets=int(usd_assets),
-                total_equity=int(total_equity),
-                total_bond=int(total_bond),
-                total_reit=int(total_reit),
-                total_commodity=int(total_commodity),
-                total_cash=int(total_cash),
-                updated_at=datetime.now(),
+                total_value_krw=total_value_krw,
+                total_value_usd=total_value_krw / usd_rate,
+                total_pnl_krw=total_pnl_krw,
+                total_pnl_usd=total_pnl_krw / usd_rate,
+                total_return_rate=(
+                    round(total_pnl_krw / total_principal * 100, 2)
+                    if total_principal > 0
+                    else 0.0
+                ),
+                accounts=accounts,
+                cash_asset_value=cash_asset_value,
+                investment_asset_value=investment_value,
+                cash_asset_ratio=round(cash_asset_ratio, 2),
+                investment_asset_ratio=round(investment_asset_ratio, 2),
+                investment_allocations=investment_allocations,
+                last_updated=datetime.now(),
             )
 
             logger.info(
-                f"✅ 포트폴리오 전체 현황 조회 완료 - 총자산: {total_assets:,.0f}원"
+                f"✅ 포트폴리오 전체 현황 조회 완료 - 총자산: {total_value_krw:,.0f}원"
             )
             return overview
 
@@ -108,6 +206,24 @@ class PortfolioService(IPortfolioService):
             logger.error(f"포트폴리오 전체 현황 조회 오류: {e}")
             raise
 
+    @staticmethod
+    def _add_to_allocation(
+        allocations: Dict[str, Dict[str, Any]],
+        item: Dict[str, Any],
+        name: Optional[str],
+        market_value: float,
+    ) -> None:
+        """자산 카테고리별 집계에 종목 하나를 추가"""
+        category = asset_category(item.get("asset_type"), item.get("region_type")).value
+        entry = allocations.setdefault(
+            category,
+            {"holdings_count": 0, "total_market_value": 0.0, "holdings": []},
+        )
+        entry["holdings_count"] += 1
+        entry["total_market_value"] += market_value
+        if name:
+            entry["holdings"].append(name)
+
     async def get_portfolio_summary(
         self, account: Optional[str] = None
     ) -> List[DatabaseModels.PortfolioSummary]:
@@ -115,16 +231,19 @@ class PortfolioService(IPortfolioService):
         try:
             logger.info(f"📊 포트폴리오 요약 정보 조회 - 계좌: {account or '전체'}")
 
-            summary_data = self.portfolio_repository.get_portfolio_summary(account)
+            summary_data = await self.portfolio_repository.get_portfolio_summary(
+                account
+            )
 
+            now = datetime.now()
             summaries = []
             for item in summary_data:
                 summary = DatabaseModels.PortfolioSummary(
                     account=item.get("account"),
-                    valuation_amount=int(item.get("valuation_amount", 0)),
-                    profit_loss=int(item.get("profit_loss", 0)),
-                    profit_loss_rate=float(item.get("profit_loss_rate", 0)),
-                    updated_at=datetime.now(),
+                    valuation_amount=int(item.get("valuation_amount") or 0),
+                    profit_loss=int(item.get("profit_loss") or 0),
+                    profit_loss_rate=float(item.get("profit_loss_rate") or 0),
+                    updated_at=now,
                 )
                 summaries.append(summary)
 
@@ -135,69 +254,72 @@ class PortfolioService(IPortfolioService):
             logger.error(f"포트폴리오 요약 정보 조회 오류: {e}")
             raise
 
-    async def get_asset_allocation(self) -> DatabaseModels.AssetAllocation:
-        """자산 배분 현황 조회"""
-        try:
-            logger.info("📊 자산 배분 현황 조회 시작")
-
-            # 자산유형별 배분 조회
-            allocation_data = self.portfolio_repository.get_asset_allocation_by_type()
-
-            # 지역별 배분 조회
-            region_data = self.portfolio_repository.get_asset_allocation_by_region()
-
-            # 통화별 배분 조회
-            currency_data = self.portfolio_repository.get_asset_allocation_by_currency()
-
-            # 자산유형별 데이터 처리
-            asset_type_allocation = {}
-            for item in allocation_data:
-                asset_type = item.get("asset_type", "기타")
-                amount = float(item.get("valuation_amount", 0))
-                asset_type_allocation[asset_type] = amount
-
-            # 지역별 데이터 처리
-            region_allocation = {}
-            for item in region_data:
-                region = item.get("region_type", "기타")
-                amount = float(item.get("valuation_amount", 0))
-                region_allocation[region] = amount
-
-            # 통화별 데이터 처리
-            currency_allocation = {}
-            for item in currency_data:
-                currency = item.get("currency", "기타")
-                amount = float(item.get("valuation_amount", 0))
-                currency_allocation[currency] = amount
-
-            # 총자산 계산
-            total_assets = sum(asset_type_allocation.values())
-
-            # 비율 계산
-            asset_type_ratios = {
-                asset_type: (amount / total_assets * 100) if total_assets > 0 else 0
-                for asset_type, amount in asset_type_allocation.items()
-            }
+    async def get_asset_allocation(
+        self, account: Optional[str] = None
+    ) -> DatabaseModels.AssetAllocationResponse:
+        """투자자산 카테고리별 배분 현황 조회
 
-            region_ratios = {
-                region: (amount / total_assets * 100) if total_assets > 0 else 0
-                for region, amount in region_allocation.items()
-            }
+        (계좌, 자산유형, 지역유형)별 합계는 v_portfolio_allocation 뷰에서 DB가 집계하고,
+        뷰가 없으면 같은 원천(overall_info + funds)을 애플리케이션에서 같은 방식으로 집계한다.
+        """
+        try:
+            logger.info(f"📊 자산 배분 현황 조회 시작 - 계좌: {account or '전체'}")
 
-            currency_ratios = {
-                currency: (amount / total_assets * 100) if total_assets > 0 else 0
-                for currency, amount in currency_allocation.items()
-            }
+            rows = await self.portfolio_repository.get_allocation(account)
+            if rows is None:
+                holdings_data, funds_data = await asyncio.gather(
+                    self.portfolio_repository.get_overall_info(account),
+                    self.portfolio_repository.get_funds(account),
+                )
+                rows = _allocation_rows(holdings_data, funds_data)
+
+            # 뷰 행 순서는 보장되지 않으므로 키 순으로 합쳐 종목명 순서를 고정
+            allocations: Dict[str, Dict[str, Any]] = {}
+            for row in sorted(
+                rows,
+                key=lambda row: (
+                    row.get("account") or "",
+                    row.get("asset_type") or "",
+                    row.get("region_type") or "",
+                ),
+            ):
+                category = asset_category(
+                    row.get("asset_type"), row.get("region_type")
+                ).value
+                entry = allocations.setdefault(
+                    category,
+                    {"holdings_count": 0, "total_market_value": 0.0, "holdings": []},
+                )
+                entry["holdings_count"] += int(row.get("holdings_count") or 0)
+                entry["total_market_value"] += float(row.get("total_market_value") or 0)
+                entry["holdings"].extend(row.get("holdings") or [])
 
-            allocation = DatabaseModels.AssetAllocation(
-                by_asset_type=asset_type_ratios,
-                by_region=region_ratios,
-                by_currency=currency_ratios,
-                total_assets=int(total_assets),
-                updated_at=datetime.now(),
+            total_value = sum(
+                entry["total_market_value"] for entry in allocations.values()
+            )
+            allocation = DatabaseModels.AssetAllocationResponse(
+                total_portfolio_value=total_value,
+                allocations=[
+                    DatabaseModels.AssetAllocation(
+                        asset_category=category,
+                        **data,
+                        allocation_percentage=(
+                            round(data["total_market_value"] / total_value * 100, 2)
+                            if total_value > 0
+                            else 0.0
+                        ),
+                    )
+                    for category, data in sorted(
+                        allocations.items(),
+                        key=lambda entry: entry[1]["total_market_value"],
+                        reverse=True,
+                    )
+                ],
+                account=account,
+                last_updated=datetime.now(),
             )
 
-            logger.info(f"✅ 자산 배분 현황 조회 완료 - 총자산: {total_assets:,.0f}원")
+            logger.info(f"✅ 자산 배분 현황 조회 완료 - 투자자산: {total_value:,.0f}원")
             return allocation
 
         except Exception as e:
@@ -211,15 +333,16 @@ class PortfolioService(IPortfolioService):
 
             unmatched_data = self.portfolio_repository.get_unmatched_products()
 
+            now = datetime.now()
             unmatched_products = []
             for item in unmatched_data:
                 product = DatabaseModels.UnmatchedProduct(
                     company=item.get("company"),
-                    valuation_amount=int(item.get("valuation_amount", 0)),
-                    profit_loss=int(item.get("profit_loss", 0)),
-                    profit_loss_rate=float(item.get("profit_loss_rate", 0)),
+                    valuation_amount=int(item.get("valuation_amount") or 0),
+                    profit_loss=int(item.get("profit_loss") or 0),
+                    profit_loss_rate=float(item.get("profit_loss_rate") or 0),
                     account=item.get("account"),
-                    updated_at=datetime.now(),
+                    updated_at=now,
                 )
                 unmatched_products.append(product)
 
@@ -239,17 +362,18 @@ class PortfolioService(IPortfolioService):
 
             top_holdings_data = self.portfolio_repository.get_top_holdings(limit)
 
+            now = datetime.now()
             top_holdings = []
             for item in top_holdings_data:
                 holding = DatabaseModels.TopHolding(
                     name=item.get("name"),
                     symbol=item.get("symbol"),
-                    valuation_amount=int(item.get("valuation_amount", 0)),
-                    profit_loss=int(item.get("profit_loss", 0)),
-                    profit_loss_rate=float(item.get("profit_loss_rate", 0)),
+                    valuation_amount=int(item.get("valuation_amount") or 0),
+                    profit_loss=int(item.get("profit_loss") or 0),
+                    profit_loss_rate=float(item.get("profit_loss_rate") or 0),
                     account=item.get("account"),
                     sector=item.get("sector"),
-                    updated_at=datetime.now(),
+                    updated_at=now,
                 )
                 top_holdings.append(holding)
 
@@ -275,21 +399,18 @@ class PortfolioService(IPortfolioService):
             logger.error(f"포트폴리오 데이터 새로고침 오류: {e}")
             raise
 
-    def _create_empty_overview(self) -> DatabaseModels.PortfolioOverview:
+    def _create_empty_overview(
+        self, account: Optional[str] = None
+    ) -> DatabaseModels.PortfolioOverview:
         """빈 포트폴리오 개요 생성"""
         return DatabaseModels.PortfolioOverview(
-            total_assets=0,
-            total_valuation_amount=0,
-            total_profit_loss=0,
-            total_profit_loss_rate=0.0,
-            krw_assets=0,
-            usd_assets=0,
-            total_equity=0,
-            total_bond=0,
-            total_reit=0,
-            total_commodity=0,
-            total_cash=0,
-            updated_at=datetime.now(),
+            total_value_krw=0.0,
+            total_value_usd=0.0,
+            total_pnl_krw=0.0,
+            total_pnl_usd=0.0,
+            total_return_rate=0.0,
+            accounts=[account] if account else [],
+            last_updated=datetime.now(),
         )
 
     async def add_unmatched_to_symbol_table(
@@ -319,14 +440,14 @@ class PortfolioService(IPortfolioService):
 
                     if result:
                         added_count += 1
-                        logger.debug(f"✅ {product.company} symbol_table 추가 성공")
+                        logger.debug("✅ %s symbol_table 추가 성공", product.company)
                     else:
                         failed_count += 1
-                        logger.error(f"❌ {product.company} symbol_table 추가 실패")
+                        logger.error("❌ %s symbol_table 추가 실패", product.company)
 
                 except Exception as e:
                     failed_count += 1
-                    logger.error(f"❌ {product.company} symbol_table 추가 오류: {e}")
+                    logger.error("❌ %s symbol_table 추가 오류: %s", product.company, e)
 
             result = {
                 "total_products": len(unmatched_response.unmatched_products),
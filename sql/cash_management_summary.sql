@@ -0,0 +1,28 @@
+-- 현금 관리 요약에 필요한 데이터를 한 번의 RPC 호출로 반환
+-- (cash_balance, time_deposit, 최신 bs_timeseries 항목)
+-- 서버 함수로 두면 요청마다 세 번의 왕복 대신 한 번이면 되고, 실행 계획도 세션 단위로 재사용됨
+-- 사용: supabase.rpc('cash_management_summary', {})
+CREATE OR REPLACE FUNCTION cash_management_summary()
+RETURNS json
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT json_build_object(
+        'cash_balances', COALESCE(
+            (SELECT json_agg(cb)
+             FROM (SELECT account, krw, usd FROM cash_balance) cb),
+            '[]'::json
+        ),
+        'time_deposits', COALESCE(
+            (SELECT json_agg(td)
+             FROM (SELECT account, invest_prod_name, market_value,
+                          invested_principal, maturity_date, interest_rate
+                   FROM time_deposit) td),
+            '[]'::json
+        ),
+        'latest_bs_entry', (
+            SELECT row_to_json(bs)
+            FROM (SELECT * FROM bs_timeseries ORDER BY date DESC LIMIT 1) bs
+        )
+    );
+$$;
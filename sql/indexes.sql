@@ -0,0 +1,22 @@
+-- 리포지토리 조회 패턴에 맞춘 인덱스
+-- overall_info는 by_accounts 기반 통합 뷰이므로 by_accounts 인덱스가 함께 적용됨
+
+-- 계좌별 필터 (.eq("account") / .in_("account"))
+CREATE INDEX IF NOT EXISTS by_accounts_account_idx ON by_accounts (account);
+CREATE INDEX IF NOT EXISTS funds_account_idx ON funds (account);
+CREATE INDEX IF NOT EXISTS cash_balance_account_idx ON cash_balance (account);
+
+-- 예적금 수정/삭제는 (account, invest_prod_name)으로 한 건을 지정
+CREATE UNIQUE INDEX IF NOT EXISTS time_deposit_account_prod_key
+    ON time_deposit (account, invest_prod_name);
+
+-- 최신 항목 조회(order date desc limit 1)와 날짜별 조회/upsert 대상
+CREATE UNIQUE INDEX IF NOT EXISTS bs_timeseries_date_key
+    ON bs_timeseries (date DESC);
+
+-- 가격/섹터 일괄 upsert(on_conflict="name")의 충돌 대상
+CREATE UNIQUE INDEX IF NOT EXISTS symbol_table_name_key ON symbol_table (name);
+
+-- 섹터 정보 미입력 종목 조회 (.is_("sector", "null"))
+CREATE INDEX IF NOT EXISTS symbol_table_missing_sector_idx
+    ON symbol_table (name) WHERE sector IS NULL;
@@ -0,0 +1,35 @@
+-- 포트폴리오 전체 현황 계산에 필요한 데이터를 한 번의 RPC 호출로 반환
+-- (overall_info, funds, USD 환율, cash_balance, time_deposit)
+-- 사용: supabase.rpc('portfolio_overview', {'p_account': <계좌 또는 null>})
+CREATE OR REPLACE FUNCTION portfolio_overview(p_account text DEFAULT NULL)
+RETURNS json
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT json_build_object(
+        'holdings', COALESCE(
+            (SELECT json_agg(o) FROM overall_info o
+             WHERE p_account IS NULL OR o.account = p_account),
+            '[]'::json
+        ),
+        'funds', COALESCE(
+            (SELECT json_agg(f) FROM funds f
+             WHERE p_account IS NULL OR f.account = p_account),
+            '[]'::json
+        ),
+        'usd_rates', COALESCE(
+            (SELECT json_agg(c) FROM currency c WHERE c.currency = 'USD'),
+            '[]'::json
+        ),
+        'cash_balances', COALESCE(
+            (SELECT json_agg(cb) FROM cash_balance cb
+             WHERE p_account IS NULL OR cb.account = p_account),
+            '[]'::json
+        ),
+        'time_deposits', COALESCE(
+            (SELECT json_agg(td) FROM time_deposit td
+             WHERE p_account IS NULL OR td.account = p_account),
+            '[]'::json
+        )
+    );
+$$;
@@ -0,0 +1,34 @@
+-- 투자자산 배분 집계 뷰 (보유 종목 + 펀드)
+-- 포트폴리오 전체 현황과 같은 원천(overall_info의 원화 평가금액 + funds)을 사용
+-- 사용: supabase.table('v_portfolio_allocation').select('*').eq('account', <계좌>)
+CREATE OR REPLACE VIEW v_portfolio_positions AS
+    SELECT
+        o.account,
+        o.asset_type,
+        o.region_type,
+        o.company AS name,
+        o.market_value::double precision AS market_value
+    FROM overall_info o
+    WHERE o.market_value > 0
+    UNION ALL
+    SELECT
+        f.account,
+        f.asset_type,
+        f.region_type,
+        f.invest_prod_name AS name,
+        f.market_value::double precision AS market_value
+    FROM funds f
+    WHERE f.market_value > 0;
+
+-- (계좌, 자산유형, 지역유형)별 집계 - 카테고리 매핑은 PortfolioService에서 수행
+CREATE OR REPLACE VIEW v_portfolio_allocation AS
+    SELECT
+        account,
+        asset_type,
+        region_type,
+        COUNT(*) AS holdings_count,
+        SUM(market_value) AS total_market_value,
+        ARRAY_AGG(name ORDER BY market_value DESC) FILTER (WHERE name IS NOT NULL)
+            AS holdings
+    FROM v_portfolio_positions
+    GROUP BY account, asset_type, region_type;
@@ -0,0 +1,34 @@
+-- 특정 날짜의 bs_timeseries 항목을 한 번의 호출로 생성/수정하고 결과 행을 반환
+-- p_fields에 없는 필드는 기존 값을 유지하고, 신규 행이면 가장 최신 항목의 값을 이어받음
+-- (bs_timeseries(date) 유니크 인덱스 필요: sql/indexes.sql)
+-- 사용: supabase.rpc('upsert_bs_timeseries', {'p_date': '2025-01-20', 'p_fields': {'cash': 1000}})
+CREATE OR REPLACE FUNCTION upsert_bs_timeseries(p_date date, p_fields jsonb)
+RETURNS json
+LANGUAGE sql
+AS $$
+    INSERT INTO bs_timeseries AS bs (date, cash, time_deposit, security_cash_balance)
+    SELECT
+        p_date,
+        COALESCE((p_fields->>'cash')::bigint, latest.cash, 0),
+        COALESCE((p_fields->>'time_deposit')::bigint, latest.time_deposit, 0),
+        COALESCE(
+            (p_fields->>'security_cash_balance')::bigint,
+            latest.security_cash_balance,
+            0
+        )
+    FROM (SELECT 1) AS one
+    LEFT JOIN LATERAL (
+        SELECT cash, time_deposit, security_cash_balance
+        FROM bs_timeseries
+        ORDER BY date DESC
+        LIMIT 1
+    ) AS latest ON true
+    ON CONFLICT (date) DO UPDATE SET
+        cash = COALESCE((p_fields->>'cash')::bigint, bs.cash),
+        time_deposit = COALESCE((p_fields->>'time_deposit')::bigint, bs.time_deposit),
+        security_cash_balance = COALESCE(
+            (p_fields->>'security_cash_balance')::bigint,
+            bs.security_cash_balance
+        )
+    RETURNING to_json(bs.*);
+$$;
@@ -14,7 +14,8 @@ sys.path.insert(0, str(project_root))
 if __name__ == "__main__":
     import uvicorn
 
-    from api.main import app
+    # api.main은 uvicorn 워커 프로세스가 import 문자열로 한 번만 로드
+    # (여기서 import하면 reload 감시 프로세스에도 DatabaseManager가 생성됨)
 
     print("🚀 AssetNest API 서버를 시작합니다...")
     print("📊 API 문서: http://localhost:8000/docs")
@@ -26,4 +27,6 @@ if __name__ == "__main__":
         port=8000,
         reload=True,  # 개발 중에만 사용
         log_level="info",
+        loop="uvloop",  # uvicorn[standard]에 포함된 uvloop 이벤트 루프
+        http="httptools",
     )
@@ -116,13 +116,8 @@ class TestCurrencyAPI:
         ]
 
         with patch("api.main.db") as mock_db:
-            # 기존 환율 조회
-            mock_db.get_currency_rates = AsyncMock(
-                return_value=[
-                    {"currency": "USD", "rate": 1385.0},
-                    {"currency": "EUR", "rate": 1500.0},
-                ]
-            )
+            # 기존 통화 코드 조회
+            mock_db.list_currency_codes = AsyncMock(return_value=["USD", "EUR"])
             # 환율 업데이트
             mock_db.update_currency_rates = AsyncMock(return_value=updated_rates)
 
@@ -176,7 +171,7 @@ class TestCurrencyAPI:
     def test_refresh_currency_rates_database_error(self, test_client):
         """환율 정보 새로고침 DB 에러 테스트"""
         with patch("api.main.db") as mock_db:
-            mock_db.get_currency_rates = AsyncMock(
+            mock_db.list_currency_codes = AsyncMock(
                 side_effect=Exception("API rate limit exceeded")
             )
 
@@ -189,9 +184,7 @@ class TestCurrencyAPI:
     def test_refresh_currency_rates_update_error(self, test_client):
         """환율 정보 업데이트 실패 테스트"""
         with patch("api.main.db") as mock_db:
-            mock_db.get_currency_rates = AsyncMock(
-                return_value=[{"currency": "USD", "rate": 1385.0}]
-            )
+            mock_db.list_currency_codes = AsyncMock(return_value=["USD"])
             mock_db.update_currency_rates = AsyncMock(
                 side_effect=Exception("Update failed")
             )
@@ -340,7 +333,7 @@ class TestAnalyticsCurrencyAPIValidation:
         ]
 
         with patch("api.main.db") as mock_db:
-            mock_db.get_currency_rates = AsyncMock(return_value=updated_rates)
+            mock_db.list_currency_codes = AsyncMock(return_value=["USD"])
             mock_db.update_currency_rates = AsyncMock(return_value=updated_rates)
 
             response = test_client.post("/api/v1/currency/refresh")
@@ -442,3 +435,41 @@ class TestAnalyticsCurrencyAPIPerformance:
             assert response.status_code == 200
             # 응답 시간이 합리적인 범위 내에 있어야 함 (여기서는 1초 이하)
             assert (end_time - start_time) < 1.0
+
+
+class TestCurrencyServiceAutoUpdate:
+    """CurrencyService 자동 업데이트 단위 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_auto_update_saves_rates_and_notifies(self):
+        """오래된 환율은 새로 받아 DB에 저장하고 저장 후 콜백을 호출"""
+        from datetime import datetime
+        from unittest.mock import Mock
+        from api.database_modules.models import DatabaseModels
+        from api.services.currency_service import CurrencyService
+
+        refreshed = DatabaseModels.CurrencyRate(
+            currency="USD", exchange_rate=1450.0, updated_at=datetime.now()
+        )
+        repository = Mock()
+        repository.get_currency_rates = AsyncMock(
+            return_value=[
+                {
+                    "currency": "USD",
+                    "exchange_rate": 1400.0,
+                    "updated_at": datetime(2020, 1, 2),
+                }
+            ]
+        )
+        repository.update_currency_rate.return_value = True
+        adapter = Mock()
+        adapter.update_currency_rates = AsyncMock(return_value=[refreshed])
+        on_rates_saved = Mock()
+
+        rates = await CurrencyService(
+            repository, adapter, on_rates_saved=on_rates_saved
+        ).get_currency_rates(auto_update=True, currencies=["USD"])
+
+        assert rates == [refreshed]
+        repository.update_currency_rate.assert_called_once()
+        on_rates_saved.assert_called_once_with()
@@ -99,6 +99,49 @@ class TestCashManagementAPI:
             assert data[0]["account"] == "증권사A"
             mock_db.get_cash_balances.assert_called_once_with("증권사A")
 
+    def test_get_cash_balances_compact_datetime(self, test_client):
+        """compact=true이면 일시를 epoch 밀리초로 반환하는지 테스트"""
+        from datetime import datetime, timezone
+        from api.models import CashBalance
+
+        updated_at = datetime(2025, 1, 20, 10, 0, tzinfo=timezone.utc)
+        balances = [
+            CashBalance(
+                account="증권사A", krw=15000000, usd=10000, updated_at=updated_at
+            )
+        ]
+
+        with patch("api.main.db") as mock_db:
+            mock_db.get_cash_balances = AsyncMock(return_value=balances)
+
+            response = test_client.get("/api/v1/cash/balances/?compact=true")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data[0]["updated_at"] == 1737367200000
+            assert data[0]["krw"] == 15000000
+
+    def test_get_cash_balances_compact_naive_datetime(self, test_client):
+        """compact=true에서 타임존 없는 일시는 서버 로컬 시각 기준 epoch 밀리초로 반환"""
+        from datetime import datetime
+        from api.models import CashBalance
+
+        updated_at = datetime(2025, 1, 20, 10, 0)
+        balances = [
+            CashBalance(
+                account="증권사A", krw=15000000, usd=10000, updated_at=updated_at
+            )
+        ]
+
+        with patch("api.main.db") as mock_db:
+            mock_db.get_cash_balances = AsyncMock(return_value=balances)
+
+            response = test_client.get("/api/v1/cash/balances/?compact=true")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data[0]["updated_at"] == round(updated_at.timestamp() * 1000)
+
     def test_get_cash_balances_database_error(self, test_client):
         """증권사별 예수금 정보 조회 DB 에러 테스트"""
         with patch("api.main.db") as mock_db:
@@ -97,11 +97,32 @@ class TestHoldingsAPI:
             data = response.json()
             assert "보유 종목 조회 중 오류가 발생했습니다" in data["detail"]
 
+    def test_get_all_holdings_stream_ndjson(self, test_client, sample_holdings):
+        """보유 종목 NDJSON 스트리밍 조회 테스트"""
+        from api.models import HoldingResponse
+
+        async def iter_holdings(account, market):
+            for holding in sample_holdings:
+                yield HoldingResponse.model_construct(**holding)
+
+        with patch("api.main.db") as mock_db:
+            mock_db.iter_holdings = iter_holdings
+
+            response = test_client.get("/api/v1/holdings/?stream=true")
+
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            lines = response.text.splitlines()
+            assert len(lines) == 2
+            assert '"company":"Apple Inc."' in lines[1]
+            mock_db.get_holdings.assert_not_called()
+
     def test_get_holdings_by_account_success(self, test_client, sample_holdings):
         """특정 계좌 보유 종목 조회 성공 테스트"""
         with patch("api.main.db") as mock_db:
             # 특정 계좌 종목만 필터링
             account_holdings = [h for h in sample_holdings if h["account"] == "증권사A"]
+            mock_db.account_exists = AsyncMock(return_value=True)
             mock_db.get_holdings = AsyncMock(return_value=account_holdings)
 
             response = test_client.get("/api/v1/holdings/증권사A")
@@ -116,6 +137,7 @@ class TestHoldingsAPI:
     def test_get_holdings_by_account_not_found(self, test_client):
         """존재하지 않는 계좌 보유 종목 조회 테스트"""
         with patch("api.main.db") as mock_db:
+            mock_db.account_exists = AsyncMock(return_value=False)
             mock_db.get_holdings = AsyncMock(return_value=[])
 
             response = test_client.get("/api/v1/holdings/존재하지않는계좌")
@@ -123,10 +145,12 @@ class TestHoldingsAPI:
             assert response.status_code == 404
             data = response.json()
             assert "존재하지않는계좌'의 보유 종목을 찾을 수 없습니다" in data["detail"]
+            mock_db.get_holdings.assert_not_called()
 
     def test_get_holdings_by_account_database_error(self, test_client):
         """특정 계좌 보유 종목 조회 DB 에러 테스트"""
         with patch("api.main.db") as mock_db:
+            mock_db.account_exists = AsyncMock(return_value=True)
             mock_db.get_holdings = AsyncMock(side_effect=Exception("Database error"))
 
             response = test_client.get("/api/v1/holdings/증권사A")
@@ -138,6 +162,7 @@ class TestHoldingsAPI:
     def test_get_holdings_by_account_with_special_characters(self, test_client):
         """특수문자가 포함된 계좌명 조회 테스트"""
         with patch("api.main.db") as mock_db:
+            mock_db.account_exists = AsyncMock(return_value=False)
             mock_db.get_holdings = AsyncMock(return_value=[])
 
             # URL 인코딩된 특수문자가 포함된 계좌명
@@ -379,3 +404,22 @@ class TestHoldingsAPIPerformance:
 
             # 현재 구현에서는 매번 DB 호출됨 (캐싱 없음)
             assert call_count == 3
+
+
+class TestHoldingsService:
+    """HoldingsService 단위 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_holdings_validates_rows(self):
+        """필수 필드가 빠진 overall_info 행은 검증 오류로 거부됨"""
+        from unittest.mock import Mock
+        from pydantic import ValidationError
+        from api.services.holdings_service import HoldingsService
+
+        repository = Mock()
+        repository.get_all_holdings.return_value = [
+            {"id": 1, "account": None, "company": "삼성전자", "market": "국내"}
+        ]
+
+        with pytest.raises(ValidationError):
+            await HoldingsService(repository, Mock()).get_holdings()
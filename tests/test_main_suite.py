@@ -169,6 +169,7 @@ class TestHoldingsAPI:
     def test_get_holdings_by_account_success(self, client, sample_holdings):
         """특정 계좌 보유 종목 조회 성공 테스트"""
         with patch("api.main.db") as mock_db:
+            mock_db.account_exists = AsyncMock(return_value=True)
             mock_db.get_holdings = AsyncMock(return_value=sample_holdings)
 
             response = client.get("/api/v1/holdings/증권사A")
@@ -182,6 +183,7 @@ class TestHoldingsAPI:
     def test_get_holdings_by_account_not_found(self, client):
         """존재하지 않는 계좌 보유 종목 조회 테스트"""
         with patch("api.main.db") as mock_db:
+            mock_db.account_exists = AsyncMock(return_value=False)
             mock_db.get_holdings = AsyncMock(return_value=[])
 
             response = client.get("/api/v1/holdings/존재하지않는계좌")
@@ -189,6 +191,7 @@ class TestHoldingsAPI:
             assert response.status_code == 404
             data = response.json()
             assert "존재하지않는계좌'의 보유 종목을 찾을 수 없습니다" in data["detail"]
+            mock_db.get_holdings.assert_not_called()
 
 
 class TestStocksAPI:
@@ -241,6 +244,25 @@ class TestStocksAPI:
             data = response.json()
             assert len(data) == 0
 
+    def test_stream_all_stocks_ndjson(self, client):
+        """주식 정보 NDJSON 스트리밍 테스트"""
+        from api.models import StockInfo
+
+        async def iter_stocks():
+            yield StockInfo(id=1, company="삼성전자", symbol="005930", exchange="KOSPI")
+            yield StockInfo(id=2, company="Apple", symbol="AAPL", exchange="NASDAQ")
+
+        with patch("api.main.db") as mock_db:
+            mock_db.iter_all_stocks = iter_stocks
+
+            response = client.get("/api/v1/stocks/stream")
+
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            lines = response.text.splitlines()
+            assert len(lines) == 2
+            assert '"symbol":"AAPL"' in lines[1]
+
 
 class TestCurrencyAPI:
     """환율 API 테스트"""
@@ -275,12 +297,7 @@ class TestCurrencyAPI:
         ]
 
         with patch("api.main.db") as mock_db:
-            mock_db.get_currency_rates = AsyncMock(
-                return_value=[
-                    {"currency": "USD", "rate": 1385.0},
-                    {"currency": "EUR", "rate": 1500.0},
-                ]
-            )
+            mock_db.list_currency_codes = AsyncMock(return_value=["USD", "EUR"])
             mock_db.update_currency_rates = AsyncMock(return_value=updated_rates)
 
             response = client.post("/api/v1/currency/refresh")
@@ -356,5 +373,63 @@ class TestAPIPerformance:
             assert (end_time - start_time) < 2.0
 
 
+class TestCache:
+    """api.cache 동작 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_load_skips_store(self):
+        """loader 실행 중 무효화되면 이전 결과를 캐시에 저장하지 않음"""
+        import asyncio
+        from api import cache
+
+        cache.clear()
+        started = asyncio.Event()
+        release = asyncio.Event()
+        calls = []
+
+        async def slow_loader():
+            calls.append("slow")
+            started.set()
+            await release.wait()
+            return "stale"
+
+        async def fresh_loader():
+            calls.append("fresh")
+            return "fresh"
+
+        key = ("test", "value")
+        task = asyncio.create_task(cache.cached(key, 60, slow_loader))
+        await started.wait()
+        cache.invalidate("test")
+        release.set()
+
+        assert await task == "stale"
+        assert await cache.cached(key, 60, fresh_loader) == "fresh"
+        assert calls == ["slow", "fresh"]
+        assert not cache._locks
+
+    @pytest.mark.asyncio
+    async def test_locks_released_after_load(self):
+        """키별 잠금은 동시 호출이 끝나면 제거됨"""
+        import asyncio
+        from api import cache
+
+        cache.clear()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return 1
+
+        results = await asyncio.gather(
+            *(cache.cached(("test", "lock"), 60, loader) for _ in range(5))
+        )
+
+        assert results == [1] * 5
+        assert len(calls) == 1
+        assert not cache._locks
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
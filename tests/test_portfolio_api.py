@@ -66,7 +66,7 @@ class TestPortfolioAPI:
             assert data["total_portfolio_value"] == 100000000
             assert len(data["allocations"]) == 3
             assert data["by_asset_type"]["equity"] == 0.7
-            mock_db.get_asset_allocation.assert_called_once_with(None, True)
+            mock_db.get_asset_allocation.assert_called_once_with(None)
 
     def test_get_asset_allocation_with_account(
         self, test_client, sample_asset_allocation
@@ -82,7 +82,70 @@ class TestPortfolioAPI:
             )
 
             assert response.status_code == 200
-            mock_db.get_asset_allocation.assert_called_once_with("증권사A", False)
+            mock_db.get_asset_allocation.assert_called_once_with("증권사A")
+
+    def test_get_asset_allocation_not_modified(
+        self, test_client, sample_asset_allocation
+    ):
+        """ETag가 일치하면 자산 분배 조회가 304를 반환하는지 테스트"""
+        with patch("api.main.db") as mock_db:
+            mock_db.get_asset_allocation = AsyncMock(
+                return_value=sample_asset_allocation
+            )
+
+            first = test_client.get("/api/v1/portfolio/allocation")
+            etag = first.headers["etag"]
+
+            second = test_client.get(
+                "/api/v1/portfolio/allocation", headers={"If-None-Match": etag}
+            )
+
+            assert first.status_code == 200
+            assert second.status_code == 304
+            assert second.headers["etag"] == etag
+            assert second.content == b""
+
+    def test_get_asset_allocation_etag_follows_data(
+        self, test_client, sample_asset_allocation
+    ):
+        """데이터가 바뀌면 (쓰기 경로와 무관하게) 이전 ETag로는 200을 반환"""
+        with patch("api.main.db") as mock_db:
+            mock_db.get_asset_allocation = AsyncMock(
+                return_value=sample_asset_allocation
+            )
+
+            etag = test_client.get("/api/v1/portfolio/allocation").headers["etag"]
+            mock_db.get_asset_allocation.return_value = {
+                **sample_asset_allocation,
+                "total_portfolio_value": 110000000,
+            }
+            response = test_client.get(
+                "/api/v1/portfolio/allocation", headers={"If-None-Match": etag}
+            )
+
+            assert response.status_code == 200
+            assert response.headers["etag"] != etag
+
+    @pytest.mark.parametrize(
+        "if_none_match", ["*", 'W/"stale", {etag}', '"stale",{etag}']
+    )
+    def test_get_asset_allocation_if_none_match_forms(
+        self, test_client, sample_asset_allocation, if_none_match
+    ):
+        """If-None-Match의 * 와 여러 태그 목록을 처리하는지 테스트"""
+        with patch("api.main.db") as mock_db:
+            mock_db.get_asset_allocation = AsyncMock(
+                return_value=sample_asset_allocation
+            )
+
+            etag = test_client.get("/api/v1/portfolio/allocation").headers["etag"]
+            response = test_client.get(
+                "/api/v1/portfolio/allocation",
+                headers={"If-None-Match": if_none_match.format(etag=etag)},
+            )
+
+            assert response.status_code == 304
+            assert response.headers["etag"] == etag
 
     def test_get_asset_allocation_database_error(self, test_client):
         """자산 분배 조회 DB 에러 테스트"""
@@ -267,3 +330,106 @@ class TestPortfolioAPIPerformance:
             assert response.status_code == 200
             # 응답 시간이 합리적인 범위 내에 있어야 함 (여기서는 1초 이하)
             assert (end_time - start_time) < 1.0
+
+
+class TestPortfolioServiceAllocation:
+    """PortfolioService.get_asset_allocation 단위 테스트"""
+
+    HOLDINGS = [
+        {
+            "account": "증권사A",
+            "company": "삼성전자",
+            "asset_type": "equity",
+            "region_type": "domestic",
+            "market_value": 7000000,
+        },
+        {
+            "account": "증권사A",
+            "company": "SK하이닉스",
+            "asset_type": "equity",
+            "region_type": "domestic",
+            "market_value": 3000000,
+        },
+        {
+            "account": "증권사B",
+            "company": "Apple",
+            "asset_type": "equity",
+            "region_type": "global",
+            "market_value": 5000000,
+        },
+        {
+            "account": "증권사B",
+            "company": "매도완료",
+            "asset_type": "equity",
+            "region_type": "global",
+            "market_value": 0,
+        },
+    ]
+    FUNDS = [
+        {
+            "account": "증권사A",
+            "invest_prod_name": "국채펀드",
+            "asset_type": "bond",
+            "region_type": "domestic",
+            "market_value": 2000000,
+        }
+    ]
+    # 같은 행에 대해 v_portfolio_allocation 뷰가 반환하는 집계 행
+    VIEW_ROWS = [
+        {
+            "account": "증권사B",
+            "asset_type": "equity",
+            "region_type": "global",
+            "holdings_count": 1,
+            "total_market_value": 5000000.0,
+            "holdings": ["Apple"],
+        },
+        {
+            "account": "증권사A",
+            "asset_type": "bond",
+            "region_type": "domestic",
+            "holdings_count": 1,
+            "total_market_value": 2000000.0,
+            "holdings": ["국채펀드"],
+        },
+        {
+            "account": "증권사A",
+            "asset_type": "equity",
+            "region_type": "domestic",
+            "holdings_count": 2,
+            "total_market_value": 10000000.0,
+            "holdings": ["삼성전자", "SK하이닉스"],
+        },
+    ]
+
+    @staticmethod
+    def _service(view_rows):
+        from unittest.mock import Mock
+        from api.services.portfolio_service import PortfolioService
+
+        repository = Mock()
+        repository.get_allocation = AsyncMock(return_value=view_rows)
+        repository.get_overall_info = AsyncMock(
+            return_value=TestPortfolioServiceAllocation.HOLDINGS
+        )
+        repository.get_funds = AsyncMock(
+            return_value=TestPortfolioServiceAllocation.FUNDS
+        )
+        return PortfolioService(repository, Mock(), Mock(), Mock())
+
+    @pytest.mark.asyncio
+    async def test_view_and_fallback_paths_match(self):
+        """뷰 경로와 뷰 미배포 대체 경로가 같은 행에서 같은 배분을 계산"""
+        from_view = await self._service(self.VIEW_ROWS).get_asset_allocation()
+        from_rows = await self._service(None).get_asset_allocation()
+
+        assert from_view.model_dump(exclude={"last_updated"}) == from_rows.model_dump(
+            exclude={"last_updated"}
+        )
+        assert from_rows.total_portfolio_value == 17000000.0
+        assert [a.asset_category for a in from_rows.allocations] == [
+            "국내주식",
+            "해외주식",
+            "국내채권",
+        ]
+        assert from_rows.allocations[0].holdings == ["삼성전자", "SK하이닉스"]
@@ -170,6 +170,31 @@ class TestStocksAPI:
             mock_db.update_symbol_table_prices.assert_called_once()
             mock_db.update_symbol_sector_info.assert_called_once()
 
+    def test_refresh_market_data_success(self, test_client):
+        """환율 + 가격 동시 새로고침 성공 테스트"""
+        result = {
+            "currency_rates": [
+                {
+                    "currency": "USD",
+                    "exchange_rate": 1350.5,
+                    "updated_at": "2025-01-20T10:00:00",
+                }
+            ],
+            "price_update": {"success_count": 9, "failed_count": 1},
+        }
+
+        with patch("api.main.db") as mock_db:
+            mock_db.refresh_market_data = AsyncMock(return_value=result)
+
+            response = test_client.post("/api/v1/market/refresh")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["currency_rates"][0]["currency"] == "USD"
+            assert data["price_update"]["success_count"] == 9
+            assert "timestamp" in data
+            mock_db.refresh_market_data.assert_called_once()
+
     def test_update_stocks_price_update_failure(self, test_client):
         """주식 정보 업데이트 - 가격 업데이트 실패 테스트"""
         with patch("api.main.db") as mock_db:
@@ -183,7 +208,8 @@ class TestStocksAPI:
             data = response.json()
             assert "주식 정보 업데이트 중 오류가 발생했습니다" in data["detail"]
             mock_db.update_symbol_table_prices.assert_called_once()
-            mock_db.update_symbol_sector_info.assert_not_called()
+            # 가격/섹터 업데이트는 동시에 실행되므로 섹터 업데이트도 호출됨
+            mock_db.update_symbol_sector_info.assert_called_once()
 
     def test_update_stocks_sector_update_failure(self, test_client):
         """주식 정보 업데이트 - 섹터 정보 업데이트 실패 테스트"""
@@ -545,3 +571,270 @@ class TestStocksAPIPerformance:
             # 각 함수가 3번씩 호출되었는지 확인
             assert mock_db.update_symbol_table_prices.call_count == 3
             assert mock_db.update_symbol_sector_info.call_count == 3
+
+
+class TestSymbolPriceUpdateService:
+    """HoldingsService.update_symbol_prices 단위 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_update_symbol_prices_skips_rows_without_name(self):
+        """종목명이 없는 심볼은 upsert에서 빠지고 실패로 집계됨"""
+        from unittest.mock import Mock
+        from api.services.holdings_service import HoldingsService
+
+        repository = Mock()
+        repository.get_symbol_table.return_value = [
+            {"symbol": "005930", "name": "삼성전자", "region_type": "domestic"},
+            {"symbol": "000660", "name": None, "region_type": "domestic"},
+        ]
+        adapter = Mock()
+        adapter.get_stock_prices_bulk = AsyncMock(
+            return_value={
+                symbol: {
+                    "latest_close": 70000.0,
+                    "marketcap": 400.0,
+                    "updated_at": "2025-01-20",
+                }
+                for symbol in ("005930", "000660")
+            }
+        )
+
+        result = await HoldingsService(repository, adapter).update_symbol_prices()
+
+        rows = repository.upsert_symbol_prices.call_args.args[0]
+        assert [row["symbol"] for row in rows] == ["005930"]
+        assert result["updated_symbols"] == ["005930"]
+        assert result["failed_symbols"] == ["000660"]
+
+    @pytest.mark.asyncio
+    async def test_update_symbol_sector_info_skips_rows_without_name(self):
+        """종목명이 없는 심볼은 sector upsert에서 빠지고 실패로 집계됨"""
+        from unittest.mock import Mock
+        from api.services.holdings_service import HoldingsService
+
+        repository = Mock()
+        repository.get_symbols_without_sector.return_value = [
+            {"symbol": "005930", "name": "삼성전자"},
+            {"symbol": "000660", "name": ""},
+            {"symbol": "035420", "name": None},
+        ]
+
+        result = await HoldingsService(repository, Mock()).update_symbol_sector_info()
+
+        rows = repository.upsert_symbol_sectors.call_args.args[0]
+        assert [row["symbol"] for row in rows] == ["005930"]
+        assert result["updated_symbols"] == ["005930"]
+        assert result["failed_symbols"] == ["000660", "035420"]
+
+    @pytest.mark.parametrize(
+        "company_name, sector",
+        [
+            ("석유통상", "유통"),
+            ("한국석유통신", "유통"),
+            ("SK하이닉스반도체", "IT"),
+            ("삼성전자", "기타"),
+        ],
+    )
+    def test_extract_sector_from_name_overlapping_keywords(self, company_name, sector):
+        """겹치는 키워드가 있어도 우선순위가 높은 sector를 선택"""
+        from unittest.mock import Mock
+        from api.services.holdings_service import HoldingsService
+
+        service = HoldingsService(Mock(), Mock())
+
+        assert service._extract_sector_from_name(company_name) == sector
+
+
+class TestMarketDataAdapterBulk:
+    """MarketDataAdapter.get_stock_prices_bulk 단위 테스트 (fdr/yfinance 모킹)"""
+
+    @staticmethod
+    def _listings():
+        import pandas as pd
+
+        return {
+            "KRX": pd.DataFrame(
+                {
+                    "Code": ["005930", "000660"],
+                    "Close": [70000, 130000],
+                    "Marcap": [418_000_000_000_000, 94_600_000_000_000],
+                }
+            ),
+            "ETF/KR": pd.DataFrame(
+                {"Symbol": ["069500"], "Price": [35000], "MarCap": [60000]}
+            ),
+        }
+
+    @staticmethod
+    def _ticker(close=None, marketcap=None):
+        """history/info를 가진 yf.Ticker 대역 (close가 없으면 빈 history)"""
+        from unittest.mock import Mock
+        import pandas as pd
+
+        ticker = Mock()
+        if close is None:
+            ticker.history.return_value = pd.DataFrame({"Close": []})
+            ticker.info = {}
+        else:
+            ticker.history.return_value = pd.DataFrame(
+                {"Close": [close]}, index=pd.to_datetime(["2025-01-17"])
+            )
+            ticker.info = {"marketCap": marketcap}
+        return ticker
+
+    @pytest.mark.asyncio
+    async def test_domestic_prices_from_listings_and_yfinance_fallback(self):
+        """KRX/ETF 목록 단위 환산, 두 목록에 없는 심볼은 yfinance(.KS -> .KQ)로 조회"""
+        from datetime import date
+        from unittest.mock import Mock
+        from api.adapters.market_data_adapter import MarketDataAdapter
+        from api.domain import current_trading_date
+
+        listings = self._listings()
+        fdr = Mock()
+        fdr.StockListing.side_effect = listings.__getitem__
+        tickers = {
+            "123450.KS": self._ticker(),
+            "123450.KQ": self._ticker(close=5000.0, marketcap=120_000_000_000),
+            "999990.KS": self._ticker(),
+            "999990.KQ": self._ticker(),
+        }
+        yf = Mock()
+        yf.Ticker.side_effect = tickers.__getitem__
+
+        with patch("api.adapters.market_data_adapter.fdr", fdr), patch(
+            "api.adapters.market_data_adapter.yf", yf
+        ):
+            prices = await MarketDataAdapter().get_stock_prices_bulk(
+                {"domestic": ["005930", "069500", "123450", "999990"]},
+                date(2025, 1, 16),
+            )
+
+        today = current_trading_date().isoformat()
+        assert prices["005930"] == {
+            "latest_close": 70000.0,
+            "marketcap": 418_000.0,  # 원 -> 십억원
+            "updated_at": today,
+        }
+        assert prices["069500"] == {
+            "latest_close": 35000.0,
+            "marketcap": 600.0,  # 억원 -> 십억원
+            "updated_at": today,
+        }
+        assert prices["123450"] == {
+            "latest_close": 5000.0,
+            "marketcap": 120.0,
+            "updated_at": "2025-01-17",
+        }
+        assert "999990" not in prices
+        assert "000660" not in prices
+
+    @pytest.mark.asyncio
+    async def test_region_failure_drops_only_that_region(self):
+        """국내 목록 조회가 실패해도 해외 심볼 결과는 반환"""
+        from datetime import date
+        from unittest.mock import Mock
+        from api.adapters.market_data_adapter import MarketDataAdapter
+
+        fdr = Mock()
+        fdr.StockListing.side_effect = KeyError("Code")
+        yf = Mock()
+        yf.Ticker.return_value = self._ticker(close=230.0, marketcap=3_500_000_000_000)
+
+        with patch("api.adapters.market_data_adapter.fdr", fdr), patch(
+            "api.adapters.market_data_adapter.yf", yf
+        ):
+            prices = await MarketDataAdapter(retry_delay=0).get_stock_prices_bulk(
+                {"domestic": ["005930"], "global": ["AAPL"]}, date(2025, 1, 16)
+            )
+
+        assert prices == {
+            "AAPL": {
+                "latest_close": 230.0,
+                "marketcap": 3500.0,
+                "updated_at": "2025-01-17",
+            }
+        }
+
+
+class TestMarketDataAdapterRetry:
+    """해외 시세 재시도 (일시적 오류만, 지수 백오프 + 지터) 단위 테스트"""
+
+    @staticmethod
+    def _adapter(monkeypatch, errors):
+        """errors를 차례로 던진 뒤 시세를 반환하는 어댑터와 호출/대기 기록"""
+        from unittest.mock import Mock
+        from api.adapters import market_data_adapter
+        from api.adapters.market_data_adapter import MarketDataAdapter
+
+        calls = []
+        sleeps = []
+
+        def fake_quote(symbol):
+            calls.append(symbol)
+            if len(calls) <= len(errors):
+                raise errors[len(calls) - 1]
+            return 230.0, 3500.0, None
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        adapter = MarketDataAdapter(max_retries=3, retry_delay=1.0)
+        monkeypatch.setattr(adapter, "_fetch_yfinance_quote", fake_quote)
+        monkeypatch.setattr(market_data_adapter.asyncio, "sleep", fake_sleep)
+        monkeypatch.setattr(market_data_adapter, "yf", Mock())
+        monkeypatch.setattr(market_data_adapter, "fdr", Mock())
+        return adapter, calls, sleeps
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried_with_jittered_backoff(
+        self, monkeypatch
+    ):
+        """연결/타임아웃 오류는 재시도하고, 대기 시간은 [delay/2, delay] 범위"""
+        import requests
+        from datetime import date
+
+        adapter, calls, sleeps = self._adapter(
+            monkeypatch,
+            [requests.exceptions.ConnectionError(), TimeoutError()],
+        )
+
+        prices = await adapter.get_stock_prices_bulk(
+            {"global": ["AAPL"]}, date(2025, 1, 17)
+        )
+
+        assert prices["AAPL"]["latest_close"] == 230.0
+        assert calls == ["AAPL"] * 3
+        assert len(sleeps) == 2
+        assert 0.5 <= sleeps[0] <= 1.0
+        assert 1.0 <= sleeps[1] <= 2.0
+
+    @pytest.mark.asyncio
+    async def test_permanent_errors_are_not_retried(self, monkeypatch):
+        """심볼 없음 같은 영구 오류는 한 번만 호출하고 바로 포기"""
+        from datetime import date
+
+        adapter, calls, sleeps = self._adapter(monkeypatch, [KeyError("marketCap")])
+
+        prices = await adapter.get_stock_prices_bulk(
+            {"global": ["UNKNOWN"]}, date(2025, 1, 17)
+        )
+
+        assert prices == {}
+        assert calls == ["UNKNOWN"]
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, monkeypatch):
+        """일시적 오류가 계속되면 max_retries번 시도 후 해당 심볼만 제외"""
+        from datetime import date
+
+        adapter, calls, sleeps = self._adapter(monkeypatch, [TimeoutError()] * 3)
+
+        prices = await adapter.get_stock_prices_bulk(
+            {"global": ["AAPL"]}, date(2025, 1, 17)
+        )
+
+        assert prices == {}
+        assert calls == ["AAPL"] * 3
+        assert len(sleeps) == 2